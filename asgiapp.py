@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+ASGI web application for misipwgen: the JSON API of webapp.py for asyncio servers
+Run with: gunicorn -k uvicorn_worker.UvicornWorker asgiapp:app
+(pip install uvicorn uvicorn-worker), or `uvicorn asgiapp:app` for development
+
+The event loop only parses requests and writes responses; generation runs in a
+bounded thread pool, so one process keeps many keep-alive clients connected
+while a few threads do the work.
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from misipwgen import webapi
+from misipwgen.webapi import GeneratorRegistry
+
+# Largest accepted request body, in bytes
+MAX_BODY = 64 * 1024
+
+
+class App:
+    """ASGI application serving the `misipwgen.webapi` endpoints"""
+
+    def __init__(self, languages=None, max_workers=None, timeout=30.0, reservoir=0):
+        self.registry = GeneratorRegistry(languages, timeout=timeout, reservoir=reservoir)
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 2)
+        self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="misipwgen")
+        self._warming = None
+        self.routes = {
+            ("GET", "/readyz"): self.readyz,
+            ("GET", "/metrics"): self.metrics,
+            ("POST", "/api/generate/batch"): self.batch,
+        }
+        for path, handler in webapi.HANDLERS.items():
+            self.routes[("POST", path)] = self.json_handler(handler)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+        elif scope["type"] == "http":
+            self.warm()
+            await self.http(scope, receive, send)
+
+    def warm(self):
+        """Start loading the generators in the pool (once); returns the future
+
+        If loading fails, the next request starts it again.
+        """
+        if self._warming is None:
+            loop = asyncio.get_running_loop()
+            self._warming = loop.run_in_executor(self.executor, self.registry.warm)
+            self._warming.add_done_callback(self._warmed)
+        return self._warming
+
+    def _warmed(self, future):
+        # Retrieving the exception also keeps asyncio from reporting it as never retrieved
+        if future.cancelled() or future.exception() is not None:
+            self._warming = None
+
+    async def run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.warm()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def http(self, scope, receive, send):
+        route = self.routes.get((scope["method"], scope["path"]))
+        if route is None:
+            if any(path == scope["path"] for _, path in self.routes):
+                return await respond(send, 405, {"error": "Method not allowed"})
+            return await respond(send, 404, {"error": "Not found"})
+        await route(scope, receive, send)
+
+    async def readyz(self, scope, receive, send):
+        """Readiness probe: 200 once every generator is loaded, else 503"""
+        status, body = self.registry.status()
+        await respond(send, status, body)
+
+    async def metrics(self, scope, receive, send):
+        """Prometheus metrics of this process"""
+        text = self.registry.render_metrics().encode()
+        await send_body(send, 200, text, b"text/plain; version=0.0.4; charset=utf-8")
+
+    def json_handler(self, handler):
+        async def endpoint(scope, receive, send):
+            data = await read_json(receive, send)
+            if data is None:
+                return
+            # Generation and serialization both run in the pool
+            status, payload = await self.run(webapi.call, self.registry, handler, lambda: data, encode)
+            await send_body(send, status, payload)
+
+        return endpoint
+
+    async def batch(self, scope, receive, send):
+        """Stream many words, phrases or sentences as NDJSON or plain text lines"""
+        data = await read_json(receive, send)
+        if data is None:
+            return
+        status, body = await self.run(webapi.call, self.registry, webapi.batch, lambda: data, encode)
+        if status != 200:
+            return await send_body(send, status, body)
+        mimetype, chunks = body
+
+        headers = [(b"content-type", f"{mimetype}; charset=utf-8".encode())]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        try:
+            # Each chunk is generated in the pool; the loop only writes it out
+            while True:
+                chunk = await self.run(next, chunks, None)
+                if chunk is None:
+                    break
+                await send({"type": "http.response.body", "body": chunk.encode(), "more_body": True})
+        finally:
+            chunks.close()
+        await send({"type": "http.response.body", "body": b""})
+
+
+async def read_json(receive, send):
+    """Decoded JSON body of the request, or None after answering an error"""
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        body += message.get("body", b"")
+        if len(body) > MAX_BODY:
+            await respond(send, 413, {"error": "Request body too large"})
+            return None
+        if not message.get("more_body", False):
+            break
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        await respond(send, 400, {"error": "Body must be a JSON object"})
+        return None
+    return data
+
+
+def encode(body):
+    return json.dumps(body).encode()
+
+
+async def respond(send, status, body):
+    await send_body(send, status, encode(body))
+
+
+async def send_body(send, status, payload, content_type=b"application/json"):
+    headers = [
+        (b"content-type", content_type),
+        (b"content-length", str(len(payload)).encode()),
+    ]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": payload})
+
+
+def create_app(languages=None, max_workers=None, timeout=30.0, reservoir=0):
+    """Build the ASGI app; generators load at startup (lifespan) or on the first request"""
+    return App(languages, max_workers=max_workers, timeout=timeout, reservoir=reservoir)
+
+
+app = create_app(
+    max_workers=int(os.environ.get("MISIPWGEN_THREADS", 0)) or None,
+    reservoir=int(os.environ.get("MISIPWGEN_RESERVOIR", 0)),
+)
@@ -0,0 +1,5 @@
+"""Benchmarks for misipwgen.
+
+`python -m benchmarks` runs the suite in `benchmarks.runner` and compares it with
+a stored baseline; the `bench_*.py` scripts are standalone, focused comparisons.
+"""
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Words per second: a loop of generate() against generate_many() and the NumPy engine.
+
+Usage: python benchmarks/bench_bulk.py [--lang it] [--length 10] [--count 50000]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+try:  # pragma: no cover - convenience for local script execution
+    from misipwgen import MisiPwGen
+except Exception:  # noqa: BLE001
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from misipwgen import MisiPwGen  # type: ignore
+
+
+def words_per_second(fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--lang", default="it")
+    p.add_argument("--length", type=int, default=10)
+    p.add_argument("--count", type=int, default=50000)
+    args = p.parse_args()
+
+    generators = {
+        "v2": MisiPwGen.from_language(args.lang),
+        "legacy": MisiPwGen.legacy(lang=args.lang),
+    }
+    for name, gen in generators.items():
+        loop = words_per_second(
+            lambda: [gen.generate(args.length) for _ in range(args.count)], args.count
+        )
+        bulk = words_per_second(lambda: gen.generate_many(args.length, args.count), args.count)
+        print(f"{name:<7} loop {loop:12,.0f} words/s   bulk {bulk:12,.0f} words/s   x{bulk / loop:.2f}")
+
+    from misipwgen.engines import numpy as numpy_engine
+
+    if numpy_engine.AVAILABLE:
+        engine = numpy_engine.NumpyEngine(generators["v2"])
+        rate = words_per_second(lambda: engine.generate_many(args.length, args.count), args.count)
+        print(f"{'numpy':<7} bulk {rate:12,.0f} words/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Per-word latency of the legacy generator: filtered tables vs rejection sampling.
+
+Usage: python benchmarks/bench_legacy.py [--lang it] [--length 10] [--words 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+try:  # pragma: no cover - convenience for local script execution
+    from misipwgen import MisiPwGen
+except Exception:  # noqa: BLE001
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from misipwgen import MisiPwGen  # type: ignore
+
+
+def latencies(gen, words: int, length: int) -> list:
+    out = []
+    for _ in range(words):
+        start = time.perf_counter()
+        gen.generate(length)
+        out.append(time.perf_counter() - start)
+    return sorted(out)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--lang", default="it")
+    p.add_argument("--length", type=int, default=10)
+    p.add_argument("--words", type=int, default=20000)
+    args = p.parse_args()
+
+    for label, rejection in (("filtered", False), ("rejection", True)):
+        gen = MisiPwGen.legacy(lang=args.lang, rng=random.Random(1), rejection_sampling=rejection)
+        gen.generate_many(args.length, 1000)  # build tables outside the timing
+        lat = latencies(gen, args.words, args.length)
+        p50, p99 = (lat[int(q * (len(lat) - 1))] * 1e6 for q in (0.5, 0.99))
+        print(
+            f"{label:10s} {len(lat) / sum(lat):12,.0f} words/s   "
+            f"p50 {p50:7.1f} us   p99 {p99:7.1f} us   max {lat[-1] * 1e6:9.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Memory held by loaded v2 syllables: list of SyllableV2 vs the compact collection.
+
+Usage: python benchmarks/bench_memory.py [--lang it]
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+import tracemalloc
+
+try:  # pragma: no cover - convenience for local script execution
+    from misipwgen.generator_v2 import SyllablesLoaderV2Py
+except Exception:  # noqa: BLE001
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from misipwgen.generator_v2 import SyllablesLoaderV2Py  # type: ignore
+
+
+def retained_bytes(fn) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn()  # noqa: F841 - keep the result alive while measuring
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--lang", default="it")
+    args = p.parse_args()
+
+    module = f"misipwgen.data.{args.lang}.syllables_v2"
+    # Import the data module first so only the collections are measured
+    importlib.import_module(module)
+    loader = SyllablesLoaderV2Py(module)
+
+    legacy = retained_bytes(loader.load)
+    compact = retained_bytes(loader.load_compact)
+    print(f"SyllableCollectionV2         {legacy / 1024:10.1f} KiB")
+    print(f"CompactSyllableCollectionV2  {compact / 1024:10.1f} KiB   ({compact / legacy:.0%})")
+
+
+if __name__ == "__main__":
+    main()
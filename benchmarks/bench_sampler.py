@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Compare the cumulative bisect sampler with the alias-method sampler.
+
+Usage: python benchmarks/bench_sampler.py [--lang it] [--number 200000]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+from random import randrange
+
+try:  # pragma: no cover - convenience for local script execution
+    from misipwgen.generator_v2 import MisiPwGenV2
+except Exception:  # noqa: BLE001
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from misipwgen.generator_v2 import MisiPwGenV2  # type: ignore
+
+
+def generate_bisect(gen: MisiPwGenV2, n: int) -> str:
+    """The pre-alias generation loop, kept here as the reference path."""
+    word = ""
+    residual = n
+    while residual > 0:
+        first = len(word) == 0
+        last_idx = gen.syllables.last_index(residual)
+        end_idx = gen.syllables.last_syllable_by_length.get(residual)
+        prev_len_idx = gen.syllables.last_syllable_by_length.get(residual - 1, -1)
+        picked = None
+        if end_idx is not None:
+            total_end = gen.cumulative.weight_at("end", end_idx) - (
+                gen.cumulative.weight_at("end", prev_len_idx) if prev_len_idx >= 0 else 0
+            )
+            if total_end > 0:
+                w = randrange(1, total_end + 1)
+                picked = gen.cumulative.invert_in_range("end", w, prev_len_idx, end_idx)
+        if picked is None:
+            which = "start" if first else "middle"
+            w = randrange(1, gen.cumulative.weight_at(which, last_idx) + 1)
+            picked = gen.cumulative.invert(which, w)
+        word += gen.syllables[picked].random()
+        residual = n - len(word)
+    return word
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--lang", default="it")
+    p.add_argument("--number", type=int, default=200000, help="Draws per measurement")
+    args = p.parse_args()
+
+    gen = MisiPwGenV2.from_language(args.lang)
+    last = gen.syllables.last_index(gen.syllables.max_syllable_length)
+    total = gen.cumulative.weight_at("middle", last)
+    table = gen.alias.upto("middle", gen.syllables.max_syllable_length)
+
+    draws = {
+        "bisect draw": lambda: gen.cumulative.invert("middle", randrange(1, total + 1)),
+        "alias draw": lambda: table.sample(randrange),
+    }
+    words = {
+        "bisect word(8)": lambda: generate_bisect(gen, 8),
+        "alias word(8)": lambda: gen.generate(8),
+    }
+    for label, fn in list(draws.items()) + list(words.items()):
+        number = args.number if label in draws else args.number // 10
+        elapsed = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{label:<16} {elapsed / number * 1e9:10.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Multi-thread throughput of one shared generator.
+
+Compares a single RNG shared by every thread with per-thread RNGs created by
+`rng_factory`. Tables are shared read-only in both cases.
+
+Usage: python benchmarks/bench_threads.py [--lang it] [--length 10] [--words 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+try:  # pragma: no cover - convenience for local script execution
+    from misipwgen import MisiPwGen
+except Exception:  # noqa: BLE001
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from misipwgen import MisiPwGen  # type: ignore
+
+
+def throughput(gen, threads: int, words: int, length: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def work():
+        barrier.wait()
+        for _ in range(words):
+            gen.generate(length)
+
+    pool = [threading.Thread(target=work) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    return threads * words / (time.perf_counter() - start)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--lang", default="it")
+    p.add_argument("--length", type=int, default=10)
+    p.add_argument("--words", type=int, default=20000, help="Words per thread")
+    args = p.parse_args()
+
+    shared = MisiPwGen.from_language(args.lang, rng=random.Random())
+    per_thread = MisiPwGen.from_language(args.lang, rng_factory=random.Random)
+    for threads in (1, 2, 4, 8):
+        a = throughput(shared, threads, args.words, args.length)
+        b = throughput(per_thread, threads, args.words, args.length)
+        print(f"{threads} threads   shared rng {a:12,.0f} words/s   per-thread rng {b:12,.0f} words/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Flask against ASGI on this machine, both under gunicorn, with concurrent keep-alive clients.
+
+Usage: python benchmarks/bench_web.py [--processes 2] [--clients 64] [--duration 5]
+                                      [--slow-clients 0] [--only flask|asgi]
+
+Starts `gunicorn webapp:app` and `gunicorn -k uvicorn_worker.UvicornWorker asgiapp:app`
+with the same number of processes on free local ports, waits for `/readyz`, then
+drives each with `--clients` connections sending a mix of word, phrase and sentence
+requests (reconnecting when the server closes the connection). `--slow-clients` extra
+connections send an incomplete request and hold it, like clients on a slow
+network. Needs gunicorn, uvicorn and uvicorn-worker installed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:  # pragma: no cover - convenience for local script execution
+    from misipwgen import loadtest
+except Exception:  # noqa: BLE001
+    sys.path.append(ROOT)
+    from misipwgen import loadtest  # type: ignore
+
+MIX = "word=1,phrase=1,sentence=1"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(kind: str, port: int, processes: int) -> subprocess.Popen:
+    # Both under gunicorn (and gunicorn.conf.py): `uvicorn --workers` leaves Nagle's
+    # algorithm on for accepted connections, which adds ~40 ms to every response
+    cmd = ["gunicorn", "-w", str(processes), "-b", f"127.0.0.1:{port}"]
+    if kind == "flask":
+        cmd += ["webapp:app"]
+    else:
+        cmd += ["-k", "uvicorn_worker.UvicornWorker", "asgiapp:app"]
+    proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/readyz", timeout=1) as r:
+                if r.status == 200:
+                    return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError(f"{kind} server did not become ready")
+
+
+async def slow_client(port: int, stop: float) -> None:
+    """Send half a request and keep the connection open until `stop`."""
+    try:
+        _, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"POST /api/generate/word HTTP/1.1\r\nHost: 127.0.0.1\r\n")
+        await asyncio.sleep(max(0.0, stop - time.perf_counter()))
+        writer.close()
+    except OSError:
+        pass
+
+
+async def load(port: int, clients: int, slow_clients: int, duration: float) -> dict:
+    url = f"http://127.0.0.1:{port}"
+    stop = time.perf_counter() + duration
+    slow = [asyncio.create_task(slow_client(port, stop)) for _ in range(slow_clients)]
+    await asyncio.sleep(0.2 if slow_clients else 0)
+    start = time.perf_counter()
+    samples = await loadtest.run_asyncio(
+        url, loadtest.parse_mix(MIX), loadtest.request_bodies("it"), clients, stop, itertools.repeat(1)
+    )
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*slow)
+    return loadtest.summarize(samples, elapsed)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--processes", type=int, default=2, help="Workers per server (default 2)")
+    p.add_argument("--clients", type=int, default=64, help="Concurrent connections (default 64)")
+    p.add_argument("--slow-clients", type=int, default=0, help="Connections that stall mid-request")
+    p.add_argument("--duration", type=float, default=5.0, help="Seconds per server (default 5)")
+    p.add_argument("--only", choices=("flask", "asgi"))
+    args = p.parse_args()
+
+    for kind in ("flask", "asgi"):
+        if args.only and kind != args.only:
+            continue
+        port = free_port()
+        proc = start_server(kind, port, args.processes)
+        try:
+            r = asyncio.run(load(port, args.clients, args.slow_clients, args.duration))
+        finally:
+            proc.terminate()
+            proc.wait()
+        latency = r["latency_ms"] or {}
+        print(
+            f"{kind:6s} {r['throughput_rps']:9,.0f} req/s   p50 {latency.get('p50', 0):7.2f} ms   "
+            f"p99 {latency.get('p99', 0):7.2f} ms   max {latency.get('max', 0):8.1f} ms   "
+            f"{r['requests']} requests, {r['errors']} errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
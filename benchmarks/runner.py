@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""Benchmark suite: import, table loading, generation and the web endpoints.
+
+Usage: python -m benchmarks [--quick] [--group generate] [--filter len8]
+                            [--output results.json] [--baseline benchmarks/baseline.json]
+                            [--threshold 0.2] [--save-baseline]
+
+Results are JSON ({"meta": ..., "results": {name: {"seconds": ...}}}, seconds per
+operation, median of the repeats) written to stdout or `--output`; the report goes
+to stderr. With a baseline, each result is compared with it and the exit status is
+1 if any is slower by more than `--threshold` (0.2 = 20%).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+try:  # pragma: no cover - convenience for local script execution
+    import misipwgen
+except Exception:  # noqa: BLE001
+    sys.path.append(ROOT)
+    import misipwgen  # type: ignore
+
+LENGTHS = (4, 8, 12, 16, 24, 32)
+
+Case = Tuple[str, Callable[[], dict]]
+
+
+def timed(fn: Callable[[], object], number: int, repeat: int, setup=None) -> dict:
+    """Time `number` calls of `fn`, `repeat` times; per-call median and best, in seconds.
+
+    `setup()` runs before every call, outside the timing. One untimed call comes
+    first, so lazily built tables are not counted.
+    """
+    if setup is not None:
+        setup()
+    fn()
+    runs = []
+    for _ in range(repeat):
+        elapsed = 0.0
+        for _ in range(number):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            fn()
+            elapsed += time.perf_counter() - start
+        runs.append(elapsed / number)
+    return {
+        "seconds": statistics.median(runs),
+        "best": min(runs),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def bench_import(quick: bool) -> Iterator[Case]:
+    """Cold interpreter runs: bare Python, `import misipwgen`, and the CLI."""
+    commands = {
+        "import.python": ["-c", "pass"],
+        "import.misipwgen": ["-c", "import misipwgen"],
+        "import.cli": ["-m", "misipwgen", "8"],
+    }
+    for name, args in commands.items():
+
+        def run(args=args):
+            subprocess.run([sys.executable, *args], cwd=ROOT, check=True, capture_output=True)
+
+        run()  # warm the bytecode cache
+        yield name, lambda run=run: timed(run, 1, 3 if quick else 9)
+
+
+def bench_load(quick: bool) -> Iterator[Case]:
+    """Generator construction with cold (just cleared) and warm table caches."""
+    MisiPwGen = misipwgen.MisiPwGen
+    makers = {
+        "v2.it": lambda: MisiPwGen.from_language("it"),
+        "v2.es": lambda: MisiPwGen.from_language("es"),
+        "legacy.it": lambda: MisiPwGen.legacy(lang="it"),
+    }
+    for label, make in makers.items():
+        repeat = 3 if quick else 7
+        yield f"load.{label}.cold", lambda make=make: timed(make, 1, repeat, setup=misipwgen.clear_cache)
+        yield f"load.{label}.warm", lambda make=make: timed(make, 100, repeat)
+
+
+def _generators() -> Dict[str, object]:
+    MisiPwGen = misipwgen.MisiPwGen
+    return {
+        "v2": MisiPwGen.from_language("it", rng=random.Random(1)),
+        "legacy": MisiPwGen.legacy(lang="it", rng=random.Random(1)),
+    }
+
+
+def bench_generate(quick: bool) -> Iterator[Case]:
+    """`generate(n)` per word, v2 against legacy (Italian)."""
+    number = 200 if quick else 2000
+    for kind, gen in _generators().items():
+        for n in LENGTHS:
+            yield f"generate.{kind}.len{n}", lambda gen=gen, n=n: timed(
+                lambda: gen.generate(n), number, 3 if quick else 5
+            )
+
+
+def bench_phrase(quick: bool) -> Iterator[Case]:
+    """`phrase(6, 6, 6)` and `sentence(24)`, v2 against legacy (Italian)."""
+    number = 100 if quick else 1000
+    for kind, gen in _generators().items():
+        calls = {
+            "phrase": lambda gen=gen: gen.phrase(6, 6, 6),
+            "sentence": lambda gen=gen: gen.sentence(24),
+        }
+        for label, call in calls.items():
+            yield f"{label}.{kind}", lambda call=call: timed(call, number, 3 if quick else 5)
+
+
+def bench_web(quick: bool) -> Iterator[Case]:
+    """Requests through the Flask test client against `webapp.app` (needs Flask)."""
+    try:
+        sys.path.insert(0, ROOT)
+        from webapp import app
+    except ImportError as exc:
+        print(f"skipping web benchmarks: {exc}", file=sys.stderr)
+        return
+    finally:
+        sys.path.remove(ROOT)
+
+    client = app.test_client()
+    requests = {
+        "web.index": ("GET", "/", None),
+        "web.word": ("POST", "/api/generate/word", {"length": 12, "language": "it"}),
+        "web.phrase": ("POST", "/api/generate/phrase", {"word_lengths": [6, 6, 6]}),
+        "web.sentence": ("POST", "/api/generate/sentence", {"total_length": 24}),
+        "web.batch1000": ("POST", "/api/generate/batch", {"count": 1000, "length": 10}),
+    }
+    number = 30 if quick else 300
+    for name, (method, path, body) in requests.items():
+
+        def call(method=method, path=path, body=body):
+            response = client.open(path, method=method, json=body)
+            response.get_data()  # consume streamed bodies
+            if response.status_code != 200:
+                raise RuntimeError(f"{method} {path} returned {response.status_code}")
+
+        call()  # first request loads templates and tables
+        yield name, lambda call=call: timed(call, number, 3 if quick else 5)
+
+
+GROUPS = {
+    "import": bench_import,
+    "load": bench_load,
+    "generate": bench_generate,
+    "phrase": bench_phrase,
+    "web": bench_web,
+}
+
+
+def run(groups: List[str], quick: bool = False, pattern: Optional[str] = None) -> Dict[str, dict]:
+    """Run the named groups; only cases whose name contains `pattern`, if given."""
+    results = {}
+    for group in groups:
+        for name, case in GROUPS[group](quick):
+            if pattern and pattern not in name:
+                continue
+            results[name] = result = case()
+            print(f"{name:28s} {format_seconds(result['seconds']):>10s}", file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[dict]:
+    """Compare median times with a baseline.
+
+    A result is a "regression" when it takes more than `1 + threshold` times its
+    baseline, a "speedup" when it takes less than `1 / (1 + threshold)` times it,
+    else "ok"; results missing from the baseline are "new".
+    """
+    rows = []
+    for name, result in results.items():
+        row = {"name": name, "seconds": result["seconds"], "baseline": None, "ratio": None}
+        base = baseline.get(name)
+        if base is None:
+            row["status"] = "new"
+        else:
+            ratio = result["seconds"] / base["seconds"]
+            row.update(baseline=base["seconds"], ratio=ratio)
+            if ratio > 1 + threshold:
+                row["status"] = "regression"
+            elif ratio < 1 / (1 + threshold):
+                row["status"] = "speedup"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def metadata() -> dict:
+    return {
+        "version": misipwgen.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--quick", action="store_true", help="Fewer iterations (smoke run)")
+    p.add_argument(
+        "--group", action="append", choices=sorted(GROUPS), help="Run only this group (repeatable)"
+    )
+    p.add_argument("--filter", help="Run only cases whose name contains this text")
+    p.add_argument("--output", help="Write JSON results here (default: stdout)")
+    p.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare with")
+    p.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed slowdown before failing (default 0.2)"
+    )
+    p.add_argument(
+        "--save-baseline", action="store_true", help="Also write the results as the new baseline"
+    )
+    args = p.parse_args(argv)
+
+    results = run(args.group or list(GROUPS), quick=args.quick, pattern=args.filter)
+    report = {"meta": metadata(), "results": results}
+
+    regressions = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        rows = compare(results, baseline, args.threshold)
+        report["comparison"] = {"baseline": args.baseline, "threshold": args.threshold, "rows": rows}
+        print(f"\nagainst {args.baseline} (threshold {args.threshold:.0%}):", file=sys.stderr)
+        for row in rows:
+            change = "" if row["ratio"] is None else f"{row['ratio'] - 1:+8.1%}"
+            print(f"{row['name']:28s} {change:>8s}  {row['status']}", file=sys.stderr)
+        regressions = sum(row["status"] == "regression" for row in rows)
+
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"saved baseline to {args.baseline}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
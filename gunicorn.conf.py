@@ -0,0 +1,37 @@
+"""Gunicorn settings (read automatically from the working directory).
+
+The app and the syllable tables of every packaged language are loaded once in
+the master and shared copy-on-write by the forked workers (see
+`misipwgen.preload`). Each worker logs its memory right after the fork and
+when it exits; set MISIPWGEN_PRELOAD=0 to load everything per worker instead
+and compare.
+"""
+
+import os
+
+from misipwgen import preload
+
+preload_app = os.environ.get("MISIPWGEN_PRELOAD", "1") != "0"
+
+
+def when_ready(server):
+    if preload_app:
+        langs = preload.warm()
+        preload.freeze()
+        server.log.info("Preloaded syllable tables: %s", ", ".join(sorted(langs)))
+    server.log.info("Master memory: %s", preload.format_memory(preload.memory_usage()))
+
+
+def post_fork(server, worker):
+    server.log.info(
+        "Worker %s memory after fork: %s", worker.pid, preload.format_memory(preload.memory_usage())
+    )
+
+
+def worker_exit(server, worker):
+    server.log.info(
+        "Worker %s memory after %s requests: %s",
+        worker.pid,
+        worker.nr,
+        preload.format_memory(preload.memory_usage()),
+    )
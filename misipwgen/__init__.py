@@ -1,14 +1,32 @@
-from .misipwgen import MisiPwGen as _LegacyMisiPwGen
-from .generator_v2 import MisiPwGenV2
-
 __version__ = "0.2.0"
 
-# Friendlier alias for v2 (default public name)
-class MisiPwGenPositional(MisiPwGenV2):
-    @classmethod
-    def legacy(cls, *args, **kwargs):
-        return _LegacyMisiPwGen(*args, **kwargs)
+# Public names are resolved on first access (PEP 562) so that `import misipwgen`
+# stays cheap: the generator and data modules load only when they are used.
+# `MisiPwGen` is the public default: the modern positional generator.
+_LAZY = {
+    "MisiPwGen": ("generator_v2", "MisiPwGenPositional"),
+    "MisiPwGenPositional": ("generator_v2", "MisiPwGenPositional"),
+    "MisiPwGenV2": ("generator_v2", "MisiPwGenV2"),
+    "BufferedSystemRandom": ("secure", "BufferedSystemRandom"),
+    "WordReservoir": ("reservoir", "WordReservoir"),
+    "cache_info": ("cache", "cache_info"),
+    "clear_cache": ("cache", "clear_cache"),
+    "set_cache_limit": ("cache", "set_cache_limit"),
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    # `__import__` rather than `importlib.import_module`, so `-X importtime` sees it
+    value = getattr(__import__(module, globals(), None, [attr], 1), attr)
+    globals()[name] = value
+    return value
 
 
-# Public default: modern positional generator
-MisiPwGen = MisiPwGenPositional
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
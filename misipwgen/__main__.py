@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from typing import List
 
@@ -14,6 +15,18 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     p.add_argument("lengths", nargs="*", type=int, help="Word lengths (one or more)")
     p.add_argument("--lang", default="it", help="Language code (default: it)")
     p.add_argument("--sep", default="_", help="Separator for multiple words (default: _)")
+    p.add_argument(
+        "-n", "--count", type=int, default=1, help="Number of results, one per line (default: 1)"
+    )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for --count (default: 1, 0 = one per CPU)",
+    )
+    p.add_argument("--ordered", action="store_true", help="With --jobs, keep the output in chunk order")
+    p.add_argument("--seed", help="Seed for reproducible output (testing only, not for real passwords)")
     return p.parse_args(argv)
 
 
@@ -21,14 +34,18 @@ def main(argv: List[str] | None = None) -> int:
     ns = parse_args(argv or sys.argv[1:])
     gen = MisiPwGen.from_language(ns.lang)
 
+    if ns.sentence is None and not ns.lengths:
+        print("error: provide either --sentence TOTAL or one or more lengths", file=sys.stderr)
+        return 2
+
+    if ns.count != 1 or ns.jobs != 1 or ns.seed is not None:
+        # The tables are already loaded: forked workers share them
+        return bulk(ns)
+
     if ns.sentence is not None:
         print(gen.sentence(ns.sentence, sep=ns.sep))
         return 0
 
-    if not ns.lengths:
-        print("error: provide either --sentence TOTAL or one or more lengths", file=sys.stderr)
-        return 2
-
     if len(ns.lengths) == 1:
         print(gen.generate_word(ns.lengths[0]))
         return 0
@@ -37,6 +54,26 @@ def main(argv: List[str] | None = None) -> int:
     return 0
 
 
+def bulk(ns: argparse.Namespace) -> int:
+    """Stream `--count` results in chunks, from `--jobs` processes."""
+    if ns.count < 1 or ns.jobs < 0:
+        print("error: --count must be >= 1 and --jobs >= 0", file=sys.stderr)
+        return 2
+    from .bulk import Spec, chunks
+
+    spec = Spec(MisiPwGen, ns.lang, ns.lengths, ns.sentence, ns.sep, ns.seed)
+    try:
+        for text in chunks(spec, ns.count, jobs=ns.jobs, ordered=ns.ordered):
+            sys.stdout.write(text)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`): silence the final flush at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -0,0 +1,113 @@
+from array import array
+from random import randbytes, randrange
+
+
+class AliasTable:
+    """Walker/Vose alias table over non-negative integer weights.
+
+    The table is built once; each draw then costs one random integer and one
+    table lookup, independently of the number of entries. Probabilities are kept
+    as exact integers so the sampled distribution matches the cumulative bisect
+    it replaces, with no floating point rounding.
+    """
+
+    __slots__ = ("indices", "weights", "total", "_span", "_columns", "_prob", "_alias")
+
+    def __init__(self, weights, indices=None):
+        # Only entries with positive weight take part in sampling
+        pairs = [
+            (index, int(weight))
+            for index, weight in zip(range(len(weights)) if indices is None else indices, weights)
+            if weight > 0
+        ]
+        self.indices = [index for index, _ in pairs]
+        self.weights = [weight for _, weight in pairs]
+        self.total = sum(self.weights)
+
+        columns = list(self.indices)
+        column_weights = list(self.weights)
+        if pairs:
+            # Pad with empty columns so the random span sits just below a power of two:
+            # `randrange` then almost never has to reject and redraw.
+            span_bits = (len(pairs) * self.total).bit_length()
+            padding = ((1 << span_bits) - 1) // self.total - len(pairs)
+            columns.extend([columns[0]] * padding)
+            column_weights.extend([0] * padding)
+        self._columns = columns
+        self._span = len(columns) * self.total
+        self._prob, self._alias = self._build(column_weights, self.total)
+
+    @staticmethod
+    def _build(weights, total):
+        # Scale weights by the number of columns so each column holds `total` units
+        n = len(weights)
+        scaled = [weight * n for weight in weights]
+        prob = [total] * n
+        alias = list(range(n))
+        small = [i for i, s in enumerate(scaled) if s < total]
+        large = [i for i, s in enumerate(scaled) if s >= total]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= total - scaled[less]
+            if scaled[more] < total:
+                small.append(more)
+            else:
+                large.append(more)
+        return prob, alias
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def span(self):
+        """Size of the random integer range consumed by `sample`."""
+        return self._span
+
+    def sample(self, rnd=randrange):
+        """Return one index drawn proportionally to its weight.
+
+        `rnd` must behave like `random.randrange(start, stop)`.
+        """
+        if not self._span:
+            raise ValueError("Empty alias table")
+        column, threshold = divmod(rnd(0, self._span), self.total)
+        if threshold < self._prob[column]:
+            return self._columns[column]
+        return self._columns[self._alias[column]]
+
+    def sample_many(self, k, rng=None):
+        """Return `k` independent draws, taking random bits in one block.
+
+        `rng` is a `random.Random`-like object (the `random` module when None).
+        Each draw uses the top bits of a 64-bit word read from `randbytes`; words
+        outside the span are rejected and redrawn, so the result has exactly the
+        same distribution as `k` calls to `sample`.
+        """
+        if not self._span:
+            raise ValueError("Empty alias table")
+        bits = self._span.bit_length()
+        if bits > 64:
+            rnd = rng.randrange if rng else randrange
+            return [self.sample(rnd) for _ in range(k)]
+        rnd_bytes = rng.randbytes if rng else randbytes
+        shift = 64 - bits
+        span, total = self._span, self.total
+        prob, alias, columns = self._prob, self._alias, self._columns
+        out = []
+        while len(out) < k:
+            for word in array("Q", rnd_bytes(8 * (k - len(out)))):
+                u = word >> shift
+                if u < span:
+                    column, threshold = divmod(u, total)
+                    out.append(columns[column] if threshold < prob[column] else columns[alias[column]])
+        return out
+
+    def lookup(self, u):
+        """Map a uniform integer in `[0, span)` to an index."""
+        column, threshold = divmod(u, self.total)
+        if threshold < self._prob[column]:
+            return self._columns[column]
+        return self._columns[self._alias[column]]
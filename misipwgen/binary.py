@@ -0,0 +1,186 @@
+"""Versioned, memory-mappable binary syllable data (`.bin` files).
+
+One format serves both generators. All integers are little-endian and every
+section is aligned to its item size:
+
+    header   "<4sHHII": magic b"MSYL", format version, flags, count, pool bytes
+    uint32   weight columns, `count` each: start, middle, end (positional data)
+             or a single weight column (legacy data)
+    uint32   offsets[count + 1]: character offsets of each syllable in the pool
+    uint8    lengths[count]: number of columns (letters) per syllable
+    uint8    kinds[count]: MULTI_CHOICE and STARTING bits
+    bytes    pool: UTF-8 text; a single-choice syllable is stored rendered, a
+             multi-choice one as its columns joined by SEPARATOR
+
+Rows are stored in the generators' order (by length, then by columns), so a
+loader can use the arrays as they are. `read()` maps the file and returns
+zero-copy `memoryview` columns on little-endian hosts (byte-swapped copies
+elsewhere); only the pool is decoded, into a single string.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import List, Sequence, Tuple
+
+MAGIC = b"MSYL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+
+# Header flags
+POSITIONAL = 1
+
+# Per-syllable kind bits
+MULTI_CHOICE = 1
+STARTING = 2
+
+SEPARATOR = "\x1f"
+
+
+class BinaryFormatError(ValueError):
+    pass
+
+
+class SyllableData:
+    """Columns of a `.bin` file, as read by `read()`."""
+
+    def __init__(
+        self, positional: bool, weights: tuple, offsets, lengths, kinds, pool: str, buffer=None
+    ):
+        self.positional = positional
+        self.weights = weights
+        self.offsets = offsets
+        self.lengths = lengths
+        self.kinds = kinds
+        self.pool = pool
+        # Keeps the mapping alive for as long as the views are in use
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def columns(self, index: int) -> Tuple[str, ...]:
+        """Column strings of syllable `index`: one letter each unless multi-choice."""
+        entry = self.pool[self.offsets[index] : self.offsets[index + 1]]
+        if self.kinds[index] & MULTI_CHOICE:
+            return tuple(entry.split(SEPARATOR))
+        return tuple(entry)
+
+
+def _section(buffer: memoryview, start: int, count: int, fmt: str):
+    size = struct.calcsize(fmt)
+    view = buffer[start : start + count * size]
+    if len(view) != count * size:
+        raise BinaryFormatError("Truncated syllable data")
+    if size == 1 or (sys.byteorder == "little" and array(fmt).itemsize == size):
+        return view.cast(fmt)
+    out = array(fmt)
+    out.frombytes(view)
+    if sys.byteorder != "little":
+        out.byteswap()
+    return out
+
+
+def parse(buffer) -> SyllableData:
+    """Read syllable data from a bytes-like object (see the module docstring)."""
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise BinaryFormatError("Truncated syllable data")
+    magic, version, flags, count, pool_size = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise BinaryFormatError("Not a misipwgen syllable file")
+    if version != VERSION:
+        raise BinaryFormatError(f"Unsupported syllable file version {version}")
+    positional = bool(flags & POSITIONAL)
+
+    pos = HEADER.size
+    weights = []
+    for _ in range(3 if positional else 1):
+        weights.append(_section(view, pos, count, "I"))
+        pos += 4 * count
+    offsets = _section(view, pos, count + 1, "I")
+    pos += 4 * (count + 1)
+    lengths = _section(view, pos, count, "B")
+    pos += count
+    kinds = _section(view, pos, count, "B")
+    pos += count
+    pool = bytes(view[pos : pos + pool_size])
+    if len(pool) != pool_size:
+        raise BinaryFormatError("Truncated syllable data")
+    return SyllableData(
+        positional, tuple(weights), offsets, lengths, kinds, pool.decode("utf-8"), buffer
+    )
+
+
+def read(path) -> SyllableData:
+    """Memory-map and parse the `.bin` file at `path`."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise BinaryFormatError("Truncated syllable data")
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return parse(mapping)
+
+
+def dumps(rows: Sequence[tuple], positional: bool) -> bytes:
+    """Encode rows as `.bin` content.
+
+    Positional rows are `(w_start, w_middle, w_end, sequence)`, legacy rows
+    `(starting, weight, sequence)`. Rows are sorted like the generators sort them
+    and negative weights are stored as 0.
+    """
+    rows = sorted(rows, key=lambda r: (len(r[-1]), "-".join(r[-1])))
+    weights: List[array] = [array("I") for _ in range(3 if positional else 1)]
+    offsets = array("I", [0])
+    lengths = array("B")
+    kinds = array("B")
+    entries = []
+    for row in rows:
+        sequence = list(row[-1])
+        if positional:
+            for column, weight in zip(weights, row[:3]):
+                column.append(max(0, int(weight)))
+            kind = 0
+        else:
+            weights[0].append(max(0, int(row[1])))
+            kind = STARTING if row[0] else 0
+        if len(sequence) > 255:
+            raise BinaryFormatError("Syllables are limited to 255 columns")
+        if any(len(column) != 1 for column in sequence):
+            kind |= MULTI_CHOICE
+            entry = SEPARATOR.join(sequence)
+        else:
+            entry = "".join(sequence)
+        entries.append(entry)
+        offsets.append(offsets[-1] + len(entry))
+        lengths.append(len(sequence))
+        kinds.append(kind)
+
+    pool = "".join(entries).encode("utf-8")
+    parts = [HEADER.pack(MAGIC, VERSION, POSITIONAL if positional else 0, len(rows), len(pool))]
+    for column in (*weights, offsets):
+        if sys.byteorder != "little":
+            column.byteswap()
+        parts.append(column.tobytes())
+    parts += [lengths.tobytes(), kinds.tobytes(), pool]
+    return b"".join(parts)
+
+
+def write(path, rows: Sequence[tuple], positional: bool) -> None:
+    """Write rows (see `dumps`) to `path` atomically."""
+    data = dumps(rows, positional)
+    # Not mkstemp: the file gets the usual umask permissions, as data files should
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "xb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
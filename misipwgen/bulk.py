@@ -0,0 +1,80 @@
+"""Bulk generation in chunks, for `python -m misipwgen --count` and the batch endpoint.
+
+Items are built `CHUNK` at a time from `generate_many()`, one line each. Every
+chunk gets its own RNG, seeded from the OS, or from `--seed` and the chunk
+index. The output of a seeded, ordered run is therefore the same for any
+number of jobs. With `jobs > 1` the chunks are generated in a process pool,
+with at most two chunks per worker in flight, so memory stays flat however
+slowly the output is read.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+# Items generated (and written) per chunk
+CHUNK = 10_000
+
+
+class Spec(NamedTuple):
+    """What to generate: words or phrases of `lengths`, or sentences of `sentence` letters."""
+
+    cls: type
+    lang: str
+    lengths: Sequence[int]
+    sentence: Optional[int]
+    sep: str
+    seed: Optional[str]
+
+
+def generate_chunk(pwg, layouts: List[List[int]], sep: str) -> List[str]:
+    """Build one item per layout (a list of word lengths) from bulk-generated words."""
+    words = {
+        length: iter(pwg.generate_many(length, n))
+        for length, n in Counter(n for layout in layouts for n in layout).items()
+    }
+    return [sep.join(next(words[n]) for n in layout) for layout in layouts]
+
+
+def render(spec: Spec, index: int, size: int) -> str:
+    """Lines of chunk `index`: `size` items, each followed by a newline."""
+    rng = random.Random(f"{spec.seed}:{index}") if spec.seed is not None else random.Random()
+    pwg = spec.cls.from_language(spec.lang, rng=rng)
+    if spec.sentence is not None:
+        layouts = [pwg.generate_sentence_parts(spec.sentence) for _ in range(size)]
+    else:
+        layouts = [list(spec.lengths)] * size
+    return "\n".join(generate_chunk(pwg, layouts, spec.sep)) + "\n"
+
+
+def chunks(spec: Spec, count: int, jobs: int = 1, ordered: bool = False) -> Iterator[str]:
+    """Yield the output of `count` items chunk by chunk; `jobs=0` uses one process per CPU."""
+    sizes = [(i, min(CHUNK, count - start)) for i, start in enumerate(range(0, count, CHUNK))]
+    jobs = min(jobs or os.cpu_count() or 1, len(sizes))
+    if jobs <= 1:
+        for index, size in sizes:
+            yield render(spec, index, size)
+        return
+
+    todo = iter(sizes)
+    pool = ProcessPoolExecutor(jobs)
+    try:
+        pending = deque(pool.submit(render, spec, i, n) for i, n in islice(todo, 2 * jobs))
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            text = future.result()
+            for index, size in islice(todo, 1):
+                pending.append(pool.submit(render, spec, index, size))
+            yield text
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,160 @@
+"""Process-wide cache of loaded syllable tables.
+
+Generators keep their syllables, sampling tables and renderings in immutable
+table objects. Building them means importing or parsing the data and sorting it,
+so tables are built once per data source and shared by every generator instance
+created afterwards; instances themselves only hold a reference and their RNG.
+
+Parsed data can also be kept on disk across processes (`load_compiled`), keyed
+by a hash of the source content and the package version. That cache is opt-in:
+its files are pickles, so it is only used when `$MISIPWGEN_CACHE_DIR` names a
+directory that only trusted users can write to.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TableCache:
+    """Thread-safe LRU mapping of data source keys to built tables.
+
+    `maxsize=None` keeps every table resident; otherwise the least recently used
+    tables are dropped once more than `maxsize` are loaded (generators already
+    holding them keep working).
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: Optional[int]) -> None:
+        if value is not None and value < 1:
+            raise ValueError("maxsize must be >= 1 or None")
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Return the tables for `key`, calling `build()` once if they are not cached."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value  # type: ignore[return-value]
+            # Build under the lock so concurrent first requests load only once
+            value = build()
+            self._entries[key] = value
+            self._evict()
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+                "keys": list(self._entries),
+            }
+
+    def _evict(self) -> None:
+        while self._maxsize is not None and len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+TABLES = TableCache()
+
+
+def clear_cache() -> None:
+    """Drop every cached table; the next generator built for a source reloads it."""
+    TABLES.clear()
+
+
+def set_cache_limit(maxsize: Optional[int]) -> None:
+    """Bound how many data sources (languages, modules, files) stay resident."""
+    TABLES.maxsize = maxsize
+
+
+def cache_info() -> Dict[str, object]:
+    return TABLES.info()
+
+
+CACHE_DIR_ENV = "MISIPWGEN_CACHE_DIR"
+
+
+def compiled_cache_dir() -> Optional[str]:
+    """Directory holding compiled data files: `$MISIPWGEN_CACHE_DIR`, or None if unset or empty."""
+    return os.environ.get(CACHE_DIR_ENV) or None
+
+
+def load_compiled(kind: str, data: bytes, build: Callable[[], T]) -> T:
+    """Return `build()` for source `data`, reusing a pickle from `compiled_cache_dir()`.
+
+    Without a cache directory this is just `build()`. Cached files are unpickled,
+    so the directory must not be writable by untrusted users.
+
+    Files are named after a SHA-256 of the package version and `data`, so an edited
+    source or a new release never reuses stale results. Unreadable files are
+    rebuilt; files are written atomically, and a missing or read-only directory
+    only means the result is not kept.
+    """
+    directory = compiled_cache_dir()
+    if directory is None:
+        return build()
+    # Only needed on this path; kept out of the package's import time
+    import hashlib
+    import pickle
+    import tempfile
+
+    from . import __version__
+
+    digest = hashlib.sha256(f"{kind}\0{__version__}\0".encode() + data).hexdigest()
+    path = os.path.join(directory, f"{kind}-{digest}.pickle")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:  # noqa: BLE001 - missing, truncated or incompatible: rebuild
+        pass
+
+    value = build()
+    tmp = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{kind}-", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        tmp = None
+    except OSError:
+        pass
+    finally:
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+    return value
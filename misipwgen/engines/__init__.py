@@ -0,0 +1,5 @@
+"""Optional batch generation backends.
+
+Engines expose the same `generate_many(length, count)` as the generators and are
+built from an existing `MisiPwGenV2`, sharing its compiled sampling plans.
+"""
@@ -0,0 +1,130 @@
+"""Vectorized batch generation for `MisiPwGenV2` on top of NumPy (optional).
+
+Words of one length are generated column-wise: every row keeps its own residual,
+rows sharing a state draw their syllables with one `searchsorted` over the plan's
+cumulative weights, and letters are gathered from a packed code point table.
+Each word follows exactly the distribution of `MisiPwGenV2.generate`.
+
+The engine draws from NumPy's PCG64, seeded from the generator's RNG. PCG64 is
+not a CSPRNG, so generators backed by `random.SystemRandom` (including
+`BufferedSystemRandom`) are refused by `NumpyEngine`; `get_engine` and
+`generate_many` keep them on the pure Python path instead.
+
+Install with `pip install misipwgen[numpy]`. Without NumPy, `get_engine` and
+`generate_many` fall back to the pure Python `MisiPwGenV2.generate_many`.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised by patching in tests
+    np = None
+
+from ..generator_v2 import GenerationError, MisiPwGenV2
+from ..secure import BufferedSystemRandom
+
+AVAILABLE = np is not None
+
+
+def _is_csprng(gen: MisiPwGenV2) -> bool:
+    return isinstance(gen.current_rng(), (random.SystemRandom, BufferedSystemRandom))
+
+
+class NumpyEngine:
+    def __init__(self, gen: MisiPwGenV2, *, seed=None):
+        if np is None:
+            raise ImportError("NumpyEngine requires numpy (pip install misipwgen[numpy])")
+        if _is_csprng(gen):
+            raise ValueError("NumpyEngine would downgrade a SystemRandom-backed generator to PCG64")
+        rng = gen.current_rng()
+        if seed is None and hasattr(rng, "getrandbits"):
+            # Derive the stream from the generator's RNG to keep seeded runs reproducible
+            seed = rng.getrandbits(128)
+        self.rng = np.random.default_rng(seed)
+
+        syllables = gen.syllables
+        self.max_length = max(s.length() for s in syllables)
+        max_options = max(len(col) for s in syllables for col in s.sequence)
+        self.lengths = np.array([s.length() for s in syllables], dtype=np.int64)
+        # options[i, j, k]: k-th letter allowed in column j of syllable i
+        self.options = np.zeros((len(syllables), self.max_length, max_options), dtype="<u4")
+        self.option_counts = np.ones((len(syllables), self.max_length), dtype=np.int64)
+        for i, s in enumerate(syllables):
+            for j, col in enumerate(s.sequence):
+                self.options[i, j, : len(col)] = [ord(ch) for ch in col]
+                self.option_counts[i, j] = len(col)
+        self.single_choice = max_options == 1
+
+        # plans[first][residual] -> (cumulative weights, syllable indices) or None
+        self.plans = tuple(
+            [
+                None if t is None else (np.cumsum(t.weights, dtype=np.int64), np.array(t.indices))
+                for t in p
+            ]
+            for p in gen.plans
+        )
+
+    def generate_many(self, length: int, count: int, *, batch_size: int = 1 << 16) -> List[str]:
+        """Generate `count` words of `length` letters, `batch_size` rows at a time."""
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        if length <= 0:
+            return [""] * count
+        words: List[str] = []
+        for start in range(0, count, batch_size):
+            words.extend(self._batch(length, min(batch_size, count - start)))
+        return words
+
+    def _batch(self, length: int, count: int) -> List[str]:
+        out = np.zeros((count, length), dtype="<u4")
+        residual = np.full(count, length, dtype=np.int64)
+        position = np.zeros(count, dtype=np.int64)
+        active = np.arange(count)
+        plans = self.plans[True]
+        last = len(plans) - 1
+
+        while active.size:
+            state = np.minimum(residual[active], last)
+            picked = np.empty(active.size, dtype=np.int64)
+            for key in np.unique(state):
+                plan = plans[int(key)]
+                if plan is None:
+                    raise GenerationError("No available syllables for current residual")
+                cum, indices = plan
+                rows = state == key
+                w = self.rng.integers(0, cum[-1], size=int(rows.sum()))
+                picked[rows] = indices[np.searchsorted(cum, w, side="right")]
+
+            lengths = self.lengths[picked]
+            for j in range(int(lengths.max())):
+                rows = lengths > j
+                syllable = picked[rows]
+                if self.single_choice:
+                    letters = self.options[syllable, j, 0]
+                else:
+                    choice = self.rng.integers(0, self.option_counts[syllable, j])
+                    letters = self.options[syllable, j, choice]
+                out[active[rows], position[active[rows]] + j] = letters
+
+            position[active] += lengths
+            residual[active] -= lengths
+            active = active[residual[active] > 0]
+            plans = self.plans[False]
+
+        return out.view(f"<U{length}").ravel().tolist()
+
+
+def get_engine(gen: MisiPwGenV2, *, seed=None):
+    """Return a `NumpyEngine` for `gen`, or `gen` itself without NumPy or for a SystemRandom RNG."""
+    if np is None or _is_csprng(gen):
+        return gen
+    return NumpyEngine(gen, seed=seed)
+
+
+def generate_many(gen: MisiPwGenV2, length: int, count: int, *, seed: Optional[int] = None) -> List[str]:
+    """Generate `count` words with NumPy when available, else with `gen.generate_many`."""
+    return get_engine(gen, seed=seed).generate_many(length, count)
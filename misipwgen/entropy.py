@@ -0,0 +1,37 @@
+"""Helpers for entropy computations over generator states.
+
+Generators are Markov chains over a small state (residual length plus, for the
+legacy generator, the previous letter). Each step picks a rendered syllable; the
+entropy of the choices is the expected sum of the step entropies along the chain
+and is computed by dynamic programming over residuals. Different choices can
+spell the same word, so this is an upper bound on the entropy of the word.
+"""
+
+from __future__ import annotations
+
+from math import log2
+from typing import Callable, Dict, Hashable, Iterable, Tuple
+
+
+def step_entropy(
+    outcomes: Iterable[Tuple[str, float]], key: Callable[[str], Hashable]
+) -> Tuple[float, Dict[Hashable, float]]:
+    """Entropy of one generation step and where it leads.
+
+    `outcomes` are `(rendered text, weight)` pairs; equal texts are merged since
+    they produce the same word. Returns the entropy in bits of the merged choice
+    and the probability of each next state, as given by `key(text)`.
+    """
+    merged: Dict[str, float] = {}
+    for text, weight in outcomes:
+        if weight > 0:
+            merged[text] = merged.get(text, 0.0) + weight
+    total = sum(merged.values())
+    bits = 0.0
+    transitions: Dict[Hashable, float] = {}
+    for text, weight in merged.items():
+        p = weight / total
+        bits -= p * log2(p)
+        state = key(text)
+        transitions[state] = transitions.get(state, 0.0) + p
+    return bits, transitions
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import random
+import sys
+import threading
+from array import array
 from bisect import bisect_left
-from random import randrange
-from typing import Iterable, List, Optional, Sequence
+from itertools import product
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import binary
+from .alias import AliasTable
+from .cache import TABLES
+from .entropy import step_entropy
+from .secure import ThreadLocalRng
+
+# Packaged language data (`data/<lang>/syllables_v2.bin` and `.py`)
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 
 
 class SyllableCollectionV2(list):
@@ -20,25 +33,50 @@ class SyllableCollectionV2(list):
         self.max_syllable_length = self[-1].length()
 
     def last_index(self, length: int) -> int:
-        length = 1 if length < 1 else (self.max_syllable_length if length >= self.max_syllable_length else length)
+        length = max(1, min(length, self.max_syllable_length))
         return self.last_syllable_by_length[length]
 
 
-@dataclass
 class SyllableV2:
-    w_start: int
-    w_middle: int
-    w_end: int
-    sequence: Sequence[str]
+    # A plain class rather than a dataclass: importing `dataclasses` (and `inspect`
+    # behind it) would dominate the package's import time. Equality and repr
+    # cover the four fields only.
+    __slots__ = ("w_start", "w_middle", "w_end", "sequence", "text", "variants")
+
+    def __init__(self, w_start: int, w_middle: int, w_end: int, sequence: Sequence[str]):
+        self.w_start = w_start
+        self.w_middle = w_middle
+        self.w_end = w_end
+        self.sequence = sequence
+        # Rendering tables computed once: `text` when every column is a single letter,
+        # else `variants` lists every concrete rendering (all equally likely).
+        self.text: Optional[str] = None
+        if all(len(col) == 1 for col in sequence):
+            self.text = sys.intern("".join(sequence))
+            self.variants: Tuple[str, ...] = (self.text,)
+        else:
+            self.variants = tuple(sys.intern("".join(p)) for p in product(*sequence))
+
+    def _fields(self) -> tuple:
+        return (self.w_start, self.w_middle, self.w_end, self.sequence)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
 
-    def random(self) -> str:
-        from random import randint
+    __hash__ = None
 
-        s = ""
-        for i in range(0, self.length()):
-            pos = randint(0, len(self.sequence[i]) - 1)
-            s += self.sequence[i][pos]
-        return s
+    def __repr__(self) -> str:
+        return (
+            f"SyllableV2(w_start={self.w_start!r}, w_middle={self.w_middle!r}, "
+            f"w_end={self.w_end!r}, sequence={self.sequence!r})"
+        )
+
+    def random(self, rng=None) -> str:
+        if self.text is not None:
+            return self.text
+        return (rng or random).choice(self.variants)
 
     def length(self) -> int:
         return len(self.sequence)
@@ -47,6 +85,161 @@ class SyllableV2:
         return "-".join(self.sequence)
 
 
+class CompactSyllableCollectionV2:
+    """Struct-of-arrays syllable collection, sorted like `SyllableCollectionV2`.
+
+    Weights are kept in `array('I')` columns (negative weights stored as 0), column
+    counts in an `array('B')`, and rendered texts in a single string pool addressed
+    by `offsets`. Syllables with multi-choice columns keep their sequence aside.
+    Indexing returns a lightweight `SyllableViewV2` for existing callers.
+    """
+
+    def __init__(self):
+        self.w_start = array("I")
+        self.w_middle = array("I")
+        self.w_end = array("I")
+        self.lengths = array("B")
+        self.offsets = array("I", [0])
+        self.pool = ""
+        self.columns: Dict[int, Tuple[str, ...]] = {}
+        self.variants: Dict[int, Tuple[str, ...]] = {}
+        self.last_syllable_by_length: Dict[int, int] = {}
+        self.max_syllable_length = 0
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "CompactSyllableCollectionV2":
+        """Build from `(w_start, w_middle, w_end, sequence)` rows, as in `SYLLABLES_V2`."""
+        coll = cls()
+        texts = []
+        for ws, wm, we, seq in sorted(rows, key=lambda r: (len(r[3]), "-".join(r[3]))):
+            i = len(coll.lengths)
+            coll.w_start.append(max(0, int(ws)))
+            coll.w_middle.append(max(0, int(wm)))
+            coll.w_end.append(max(0, int(we)))
+            coll.lengths.append(len(seq))
+            text = "".join(seq)
+            if len(text) != len(seq):
+                coll.columns[i] = tuple(seq)
+                coll.variants[i] = tuple(sys.intern("".join(p)) for p in product(*seq))
+                text = ""
+            texts.append(text)
+            coll.offsets.append(coll.offsets[-1] + len(text))
+            coll.last_syllable_by_length[len(seq)] = i
+        coll.pool = "".join(texts)
+        coll.max_syllable_length = coll.lengths[-1] if coll.lengths else 0
+        return coll
+
+    @classmethod
+    def from_binary(cls, data: "binary.SyllableData") -> "CompactSyllableCollectionV2":
+        """Wrap positional data read by `misipwgen.binary`, using its columns in place."""
+        if not data.positional:
+            raise ValueError("Binary syllable data is not positional (v2)")
+        coll = cls()
+        coll.w_start, coll.w_middle, coll.w_end = data.weights
+        coll.lengths = data.lengths
+        # Multi-choice entries keep their columns in the pool; `text()` skips them
+        coll.offsets = data.offsets
+        coll.pool = data.pool
+        for i, kind in enumerate(data.kinds):
+            if kind & binary.MULTI_CHOICE:
+                coll.columns[i] = seq = data.columns(i)
+                coll.variants[i] = tuple(sys.intern("".join(p)) for p in product(*seq))
+        for i, length in enumerate(coll.lengths):
+            coll.last_syllable_by_length[length] = i
+        coll.max_syllable_length = coll.lengths[-1] if len(coll.lengths) else 0
+        return coll
+
+    @classmethod
+    def from_syllables(cls, syllables: Iterable[SyllableV2]) -> "CompactSyllableCollectionV2":
+        return cls.from_rows((s.w_start, s.w_middle, s.w_end, s.sequence) for s in syllables)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __getitem__(self, index: int) -> "SyllableViewV2":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("syllable index out of range")
+        return SyllableViewV2(self, index)
+
+    def __iter__(self):
+        return (SyllableViewV2(self, i) for i in range(len(self)))
+
+    def weights(self, which: str) -> array:
+        return {"start": self.w_start, "middle": self.w_middle, "end": self.w_end}[which]
+
+    def text(self, index: int) -> Optional[str]:
+        """Rendered text of a single-choice syllable, None for multi-choice ones."""
+        if index in self.columns:
+            return None
+        return self.pool[self.offsets[index] : self.offsets[index + 1]]
+
+    def texts(self) -> List[Optional[str]]:
+        """Interned rendered texts for every syllable (see `text`)."""
+        return [None if i in self.columns else sys.intern(self.text(i)) for i in range(len(self))]
+
+    def sequence(self, index: int) -> Tuple[str, ...]:
+        return self.columns.get(index) or tuple(self.text(index))
+
+    def last_index(self, length: int) -> int:
+        length = max(1, min(length, self.max_syllable_length))
+        return self.last_syllable_by_length[length]
+
+
+class SyllableViewV2:
+    """Read-only `SyllableV2`-like view of one row of a `CompactSyllableCollectionV2`."""
+
+    __slots__ = ("_coll", "_index")
+
+    def __init__(self, coll: CompactSyllableCollectionV2, index: int):
+        self._coll = coll
+        self._index = index
+
+    @property
+    def w_start(self) -> int:
+        return self._coll.w_start[self._index]
+
+    @property
+    def w_middle(self) -> int:
+        return self._coll.w_middle[self._index]
+
+    @property
+    def w_end(self) -> int:
+        return self._coll.w_end[self._index]
+
+    @property
+    def sequence(self) -> List[str]:
+        return list(self._coll.sequence(self._index))
+
+    @property
+    def text(self) -> Optional[str]:
+        return self._coll.text(self._index)
+
+    @property
+    def variants(self) -> Tuple[str, ...]:
+        text = self.text
+        if text is not None:
+            return (text,)
+        return self._coll.variants[self._index]
+
+    def random(self, rng=None) -> str:
+        text = self.text
+        return text if text is not None else (rng or random).choice(self.variants)
+
+    def length(self) -> int:
+        return self._coll.lengths[self._index]
+
+    def __str__(self) -> str:
+        return "-".join(self._coll.sequence(self._index))
+
+    def __repr__(self) -> str:
+        return (
+            f"SyllableViewV2(w_start={self.w_start}, w_middle={self.w_middle}, "
+            f"w_end={self.w_end}, sequence={self.sequence!r})"
+        )
+
+
 class SyllablesLoaderV2Py:
     """Load v2 syllables from a Python module exporting SYLLABLES_V2.
 
@@ -68,6 +261,11 @@ class SyllablesLoaderV2Py:
         coll.finalize()
         return coll
 
+    def load_compact(self) -> CompactSyllableCollectionV2:
+        """Load straight into a `CompactSyllableCollectionV2`, without per-row objects."""
+        mod = __import__(self.module, fromlist=[self.symbol])
+        return CompactSyllableCollectionV2.from_rows(getattr(mod, self.symbol))
+
 
 class CumulativeV2:
     def __init__(self, syllables: Sequence[SyllableV2]):
@@ -113,84 +311,282 @@ class CumulativeV2:
         return {"start": self.cum_start, "middle": self.cum_middle, "end": self.cum_end}[which]
 
 
-class MisiPwGenV2:
-    def __init__(self, lang: Optional[str] = None, syllables_path: Optional[str] = None, *, rng=None):
+class AliasV2:
+    """Alias-method samplers per (position, length bucket), each built on first use.
+
+    - `upto(which, length)` samples among syllables not longer than `length`.
+    - `exact(which, length)` samples among syllables of exactly `length` letters.
+    """
+
+    POSITIONS = ("start", "middle", "end")
+
+    def __init__(self, syllables: Sequence[SyllableV2]):
+        self._syllables = syllables
+        self._compact = isinstance(syllables, CompactSyllableCollectionV2)
+        self._lengths = syllables.lengths if self._compact else [s.length() for s in syllables]
+        self.max_length = max(self._lengths, default=0)
+        # Tables are built on first use: compiled plans only need a few of them
+        self._tables: Dict[Tuple[str, str, int], AliasTable] = {}
+
+    def upto(self, which: str, length: int) -> AliasTable:
+        length = 1 if length < 1 else min(length, self.max_length)
+        return self._table("upto", which, length)
+
+    def exact(self, which: str, length: int) -> Optional[AliasTable]:
+        if length < 1 or length > self.max_length:
+            return None
+        return self._table("exact", which, length)
+
+    def _table(self, kind: str, which: str, length: int) -> AliasTable:
+        key = (kind, which, length)
+        table = self._tables.get(key)
+        if table is None:
+            if which not in self.POSITIONS:
+                raise KeyError(which)
+            if self._compact:
+                weights = self._syllables.weights(which)
+            else:
+                weights = [max(0, getattr(s, "w_" + which)) for s in self._syllables]
+            if kind == "upto":
+                picked = [i for i, n in enumerate(self._lengths) if n <= length]
+            else:
+                picked = [i for i, n in enumerate(self._lengths) if n == length]
+            table = self._tables[key] = AliasTable([weights[i] for i in picked], picked)
+        return table
+
+    def plan(self, residual: int, first: bool) -> Optional[AliasTable]:
+        """Return the table `generate()` draws from in this state, or None if nothing fits."""
+        # If we can finish now, pick end-weighted among exact-length syllables
+        table = self.exact("end", residual)
+        if table is None or table.total == 0:
+            table = self.upto("start" if first else "middle", residual)
+            if table.total == 0:
+                # Fallback to any end if available (shouldn't happen with good data)
+                table = self.upto("end", residual)
+        return table if table.total > 0 else None
+
+    def compile_plans(self) -> tuple:
+        """Precompute `plan()` for every state, indexed as `plans[first][residual]`.
+
+        Residuals above the longest syllable all share the last entry.
+        """
+        return tuple(
+            [None] + [self.plan(residual, first) for residual in range(1, self.max_length + 2)]
+            for first in (False, True)
+        )
+
+
+class TablesV2:
+    """Sampling tables for one v2 data module, shared read-only by generators."""
+
+    def __init__(self, syllables: CompactSyllableCollectionV2):
+        self.syllables = syllables
+        self.alias = AliasV2(syllables)
+        self.plans = self.alias.compile_plans()
+        # Pre-rendered syllables; None where columns offer alternatives
+        self.texts = syllables.texts()
+        self._cumulative: Optional[CumulativeV2] = None
+        self._entropy_lock = threading.Lock()
+        self._entropy_steps: Optional[tuple] = None
+        # Entropy of the rest of a word by residual, after its first syllable
+        self._entropy_rest: List[Optional[float]] = [0.0]
+
+    @property
+    def cumulative(self) -> CumulativeV2:
+        """Cumulative weights (bisect path), built on first use for compatibility."""
+        if self._cumulative is None:
+            self._cumulative = CumulativeV2(self.syllables)
+        return self._cumulative
+
+    def choice_entropy_bits(self, n: int) -> float:
+        """Upper bound in bits on the entropy of a word from `generate(n)`.
+
+        This is the entropy of the generator's choices: syllable splits that spell
+        the same word are counted separately, so it can exceed the word entropy.
+        Dynamic programming over the `(residual, first)` state: each state adds the
+        entropy of its plan (renderings included) plus the expected entropy of the
+        states it leads to. Results are memoized, so a whole range of lengths costs
+        little more than the longest one.
+        """
+        if n < 1:
+            return 0.0
+        with self._entropy_lock:
+            if self._entropy_steps is None:
+                self._entropy_steps = tuple(
+                    [self._plan_entropy(table) for table in self.plans[first]] for first in (False, True)
+                )
+            rest = self._entropy_rest
+            while len(rest) < n:
+                rest.append(self._state_entropy(len(rest), False))
+            bits = self._state_entropy(n, True)
+        if bits is None:
+            raise GenerationError("No available syllables for current residual")
+        return bits
+
+    def _plan_entropy(self, table: Optional[AliasTable]):
+        if table is None:
+            return None
+        outcomes = (
+            (text, weight / len(variants))
+            for index, weight in zip(table.indices, table.weights)
+            for variants in (self.syllables[index].variants,)
+            for text in variants
+        )
+        return step_entropy(outcomes, len)
+
+    def _state_entropy(self, residual: int, first: bool) -> Optional[float]:
+        # None marks states generate() cannot leave; an error only if they are reachable
+        steps = self._entropy_steps[first]
+        step = steps[min(residual, len(steps) - 1)]
+        if step is None:
+            return None
+        bits, transitions = step
+        for length, p in transitions.items():
+            rest = self._entropy_rest[residual - length]
+            if rest is None:
+                return None
+            bits += p * rest
+        return bits
+
+    @classmethod
+    def load(cls, module: str) -> "TablesV2":
+        """Return the process-wide tables for `module`, loading them on first use."""
+        return TABLES.get(("v2", module), lambda: cls(SyllablesLoaderV2Py(module).load_compact()))
+
+    @classmethod
+    def load_binary(cls, path: str) -> "TablesV2":
+        """Return the process-wide tables for the `.bin` file at `path` (reloaded if it changes)."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = ("v2", path, stat.st_mtime_ns, stat.st_size)
+        return TABLES.get(key, lambda: cls(CompactSyllableCollectionV2.from_binary(binary.read(path))))
+
+
+class MisiPwGenV2(ThreadLocalRng):
+    def __init__(
+        self,
+        lang: Optional[str] = None,
+        syllables_path: Optional[str] = None,
+        *,
+        rng=None,
+        rng_factory: Optional[Callable[[], object]] = None,
+    ):
         """Position-aware generator using schema v2 data from a Python module.
 
         - If `syllables_path` is provided, it must be an importable Python module path
-          exporting `SYLLABLES_V2` (e.g. `misipwgen.data.it.syllables_v2`).
-        - Else if `lang` is provided, tries module candidates:
+          exporting `SYLLABLES_V2` (e.g. `misipwgen.data.it.syllables_v2`), or the
+          path of a binary `.bin` file (see `misipwgen.binary`).
+        - Else if `lang` is provided, loads the packaged `data/{lang}/syllables_v2.bin`
+          if present, else tries module candidates:
           `misipwgen.data.{lang}.syllables_v2` and `misipwgen.data.{lang}_syllables_v2`.
+
+        Randomness comes from `rng` (shared by all threads), or from one
+        `rng_factory()` instance per thread, else from the `random` module.
+        Tables are read-only, so one instance can serve many threads.
         """
-        self.rng = rng
+        self._init_rng(rng, rng_factory)
 
-        if syllables_path:
+        if syllables_path and str(syllables_path).endswith(".bin"):
+            self.tables = TablesV2.load_binary(str(syllables_path))
+        elif syllables_path:
             # Interpret syllables_path as module path
-            self.syllables = SyllablesLoaderV2Py(syllables_path).load()
+            self.tables = TablesV2.load(syllables_path)
         elif lang:
-            # Prefer Python module if present (best performance)
+            tables = None
+            path = os.path.join(DATA_DIR, str(lang), "syllables_v2.bin")
+            if str(lang).isidentifier() and os.path.isfile(path):
+                # Packaged binary data is mapped rather than imported (see `misipwgen.binary`)
+                tables = TablesV2.load_binary(path)
+            # Else the Python modules it is built from
             module_candidates = [
                 f"misipwgen.data.{lang}.syllables_v2",
                 f"misipwgen.data.{lang}_syllables_v2",
             ]
-            self.syllables = None
-            for module_name in module_candidates:
+            for module_name in module_candidates if tables is None else ():
                 try:
-                    self.syllables = SyllablesLoaderV2Py(module_name).load()
+                    tables = TablesV2.load(module_name)
                     break
                 except Exception:
                     continue
-            if self.syllables is None:
+            if tables is None:
                 raise ValueError(
-                    f"Could not import Python module for v2 syllables. Tried: {', '.join(module_candidates)}"
+                    "Could not import Python module for v2 syllables. "
+                    f"Tried: {', '.join(module_candidates)}"
                 )
+            self.tables = tables
         else:
             raise ValueError("Specify either lang or syllables_path for v2 generator")
-        self.cumulative = CumulativeV2(self.syllables)
+        # Shared, read-only tables (see `misipwgen.cache`)
+        self.syllables = self.tables.syllables
+        self.alias = self.tables.alias
+        self.plans = self.tables.plans
+        self.texts = self.tables.texts
+
+    @property
+    def cumulative(self) -> CumulativeV2:
+        """Cumulative weights (bisect path), built on first use for compatibility."""
+        return self.tables.cumulative
 
     def generate(self, n: int = 8) -> str:
-        word = ""
+        parts = []
         residual = n
+        rng = self.current_rng()
+        rnd = rng.randrange
+        plans = self.plans[True]
+        last = len(plans) - 1
+        texts = self.texts
 
         while residual > 0:
-            first = len(word) == 0
-            # Determine length bounds
-            last_idx = self.syllables.last_index(residual)
-
-            # If we can finish now, try end-weighted pick among exact-length syllables
-            end_idx = self.syllables.last_syllable_by_length.get(residual)
-            prev_len_idx = self.syllables.last_syllable_by_length.get(residual - 1, -1)
-
-            picked_index: Optional[int] = None
-
-            if end_idx is not None:
-                total_end = self.cumulative.weight_at("end", end_idx) - (
-                    self.cumulative.weight_at("end", prev_len_idx) if prev_len_idx >= 0 else 0
-                )
-                if total_end > 0:
-                    rnd = self.rng.randrange if self.rng else randrange
-                    w = rnd(1, total_end + 1)
-                    picked_index = self.cumulative.invert_in_range("end", w, prev_len_idx, end_idx)
-
-            if picked_index is None:
-                which = "start" if first else "middle"
-                total = self.cumulative.weight_at(which, last_idx)
-                if total == 0:
-                    # Fallback to any end if available (shouldn't happen with good data)
-                    total = self.cumulative.weight_at("end", last_idx)
-                    which = "end"
-                    if total == 0:
-                        raise GenerationError("No available syllables for current residual")
-                rnd = self.rng.randrange if self.rng else randrange
-                w = rnd(1, total + 1)
-                picked_index = self.cumulative.invert(which, w)
-
-            syllable = self.syllables[picked_index]
-            letters = self._render_syllable(syllable)
-            word += letters
-            residual = n - len(word)
-
-        return word
+            table = plans[residual if residual < last else last]
+            if table is None:
+                raise GenerationError("No available syllables for current residual")
+            index = table.sample(rnd)
+            letters = texts[index] or self._render_syllable(self.syllables[index], rng)
+            parts.append(letters)
+            residual -= len(letters)
+            plans = self.plans[False]
+
+        return "".join(parts)
+
+    def generate_many(self, length: int, count: int) -> List[str]:
+        """Generate `count` words of `length` letters.
+
+        Words advance column by column: all words sharing a residual draw their next
+        syllables in one block from the compiled plan, so random numbers are taken
+        in bulk. Each word follows exactly the same distribution as `generate()`.
+        """
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        parts: List[List[str]] = [[] for _ in range(count)]
+        pending: Dict[int, List[int]] = {length: list(range(count))} if length > 0 and count else {}
+        rng = self.current_rng()
+        plans = self.plans[True]
+        last = len(plans) - 1
+
+        while pending:
+            advanced: Dict[int, List[int]] = {}
+            for residual, word_ids in pending.items():
+                table = plans[residual if residual < last else last]
+                if table is None:
+                    raise GenerationError("No available syllables for current residual")
+                for word_id, index in zip(word_ids, table.sample_many(len(word_ids), rng)):
+                    letters = self.texts[index] or self._render_syllable(self.syllables[index], rng)
+                    parts[word_id].append(letters)
+                    if residual > len(letters):
+                        advanced.setdefault(residual - len(letters), []).append(word_id)
+            pending = advanced
+            plans = self.plans[False]
+
+        return ["".join(p) for p in parts]
+
+    def choice_entropy_bits(self, n: int) -> float:
+        """Upper bound in bits on the entropy of a word from `generate(n)`.
+
+        Counts the generator's choices (syllables and their renderings), not the
+        words: when two syllable splits spell the same word, the word entropy is
+        lower. Cached per language and length.
+        """
+        return self.tables.choice_entropy_bits(n)
 
     # Convenience API parity with legacy
     def phrase(self, *lengths: int, sep: str = "_") -> str:
@@ -201,12 +597,12 @@ class MisiPwGenV2:
     def sentence(self, total_length: int, sep: str = "_") -> str:
         if total_length < 1:
             raise ValueError("total_length must be >= 1")
-        parts = self._partition_length(total_length)
+        parts = self._partition_length(total_length, self.current_rng())
         return self.phrase(*parts, sep=sep)
 
     @staticmethod
-    def _partition_length(n: int) -> list:
-        from random import randint
+    def _partition_length(n: int, rng=None) -> list:
+        randint = (rng or random).randint
         if n <= 3:
             return [n]
         avg_target = 6
@@ -239,25 +635,22 @@ class MisiPwGenV2:
                 rem -= 1
                 i += 1
             return [max(1, x) for x in base]
-        return self._partition_length(total_length)
+        return self._partition_length(total_length, self.current_rng())
 
     # Factories
     @classmethod
-    def from_language(cls, lang: str, *, rng=None) -> "MisiPwGenV2":
-        return cls(lang=lang, rng=rng)
+    def from_language(cls, lang: str, *, rng=None, rng_factory=None) -> "MisiPwGenV2":
+        return cls(lang=lang, rng=rng, rng_factory=rng_factory)
 
     @classmethod
-    def from_module(cls, module: str, *, rng=None) -> "MisiPwGenV2":
-        return cls(syllables_path=module, rng=rng)
-
-    def _render_syllable(self, syllable):
-        if self.rng is None:
-            return syllable.random()
-        letters = ""
-        for seq in syllable.sequence:
-            idx = self.rng.randrange(0, len(seq))
-            letters += seq[idx]
-        return letters
+    def from_module(cls, module: str, *, rng=None, rng_factory=None) -> "MisiPwGenV2":
+        return cls(syllables_path=module, rng=rng, rng_factory=rng_factory)
+
+    def _render_syllable(self, syllable, rng=None):
+        if syllable.text is not None:
+            return syllable.text
+        rng = rng or self.current_rng()
+        return syllable.variants[rng.randrange(0, len(syllable.variants))]
 
     # Legacy access
     @classmethod
@@ -268,5 +661,10 @@ class MisiPwGenV2:
         return _Legacy(*args, **kwargs)
 
 
+# Friendlier alias for v2 (default public name)
+class MisiPwGenPositional(MisiPwGenV2):
+    pass
+
+
 class GenerationError(Exception):
     pass
@@ -0,0 +1,316 @@
+"""Load test for the web API, in-process or against a local server.
+
+    python -m misipwgen.loadtest                       # webapp:app via the Flask test client
+    python -m misipwgen.loadtest --url http://127.0.0.1:8000 --mode asyncio -c 64
+
+Workers (threads, or asyncio connections with `--mode asyncio`) send a fixed
+mix of word, phrase and sentence requests over keep-alive connections. The run
+stops after `--duration` seconds or `--requests` requests. The JSON report
+gives throughput and p50/p95/p99 latency, overall and per endpoint. Only the
+standard library is used (plus Flask for in-process runs); nothing leaves the
+machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.client
+import importlib
+import itertools
+import json
+import math
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+ENDPOINTS = {
+    "word": ("/api/generate/word", {"length": 10}),
+    "phrase": ("/api/generate/phrase", {"word_lengths": [6, 6, 6]}),
+    "sentence": ("/api/generate/sentence", {"total_length": 24}),
+}
+
+DEFAULT_MIX = "word=6,phrase=3,sentence=1"
+
+# One sample per request: (endpoint, seconds, status code or exception name)
+Sample = Tuple[str, float, object]
+
+
+def parse_mix(text: str) -> List[str]:
+    """Expand "word=6,phrase=3" into the cycle of endpoint names each worker follows."""
+    slots = []
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"unknown endpoint {name!r} (choose from {', '.join(ENDPOINTS)})")
+        n = int(weight or 1)
+        # Spread each endpoint evenly over the cycle, so short runs follow the weights too
+        slots += [((k + 0.5) / n, name) for k in range(n)]
+    if not slots:
+        raise ValueError("the mix is empty")
+    return [name for _, name in sorted(slots)]
+
+
+def request_bodies(language: str) -> dict:
+    """Encoded JSON body of each endpoint, for `language`."""
+    return {
+        name: json.dumps({**body, "language": language}).encode()
+        for name, (_, body) in ENDPOINTS.items()
+    }
+
+
+def load_app(spec: str):
+    """Import `module:attribute` (e.g. "webapp:app") from the current directory."""
+    module, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module), attr or "app")
+
+
+def flask_sender(app) -> Callable[[], Callable[[str, bytes], int]]:
+    """Per-worker factory of senders posting through the Flask test client."""
+
+    def factory():
+        client = app.test_client()
+
+        def send(path: str, body: bytes) -> int:
+            response = client.post(path, data=body, content_type="application/json")
+            response.get_data()
+            return response.status_code
+
+        return send
+
+    return factory
+
+
+def http_sender(url: str) -> Callable[[], Callable[[str, bytes], int]]:
+    """Per-worker factory of senders posting over one keep-alive HTTP connection."""
+    parts = urlsplit(url)
+    headers = {"Content-Type": "application/json"}
+
+    def factory():
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+
+        def send(path: str, body: bytes) -> int:
+            try:
+                conn.request("POST", parts.path.rstrip("/") + path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                return response.status
+            except (OSError, http.client.HTTPException):
+                conn.close()  # reconnects on the next request
+                raise
+
+        return send
+
+    return factory
+
+
+def run_threads(factory, plan, bodies, concurrency, deadline, budget) -> List[Sample]:
+    samples: List[Sample] = []
+
+    def worker(offset: int) -> None:
+        send = factory()
+        local = []
+        for i in itertools.count(offset):
+            if time.perf_counter() >= deadline or next(budget) <= 0:
+                break
+            name = plan[i % len(plan)]
+            start = time.perf_counter()
+            try:
+                status = send(ENDPOINTS[name][0], bodies[name])
+            except Exception as e:
+                status = type(e).__name__
+            local.append((name, time.perf_counter() - start, status))
+        samples.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return samples
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, bool]:
+    """Return (status, keep_alive) after reading one response with a Content-Length."""
+    status = int((await reader.readline()).split()[1])
+    length, keep_alive = 0, True
+    while True:
+        line = (await reader.readline()).strip().lower()
+        if not line:
+            break
+        name, _, value = line.partition(b":")
+        if name == b"content-length":
+            length = int(value)
+        elif name == b"connection" and value.strip() == b"close":
+            keep_alive = False
+    await reader.readexactly(length)
+    return status, keep_alive
+
+
+async def run_asyncio(url, plan, bodies, concurrency, deadline, budget) -> List[Sample]:
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    requests = {
+        name: (
+            f"POST {parts.path.rstrip('/')}{path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(bodies[name])}\r\n\r\n"
+        ).encode()
+        + bodies[name]
+        for name, (path, _) in ENDPOINTS.items()
+    }
+    samples: List[Sample] = []
+
+    async def worker(offset: int) -> None:
+        writer = None
+        for i in itertools.count(offset):
+            if time.perf_counter() >= deadline or next(budget) <= 0:
+                break
+            name = plan[i % len(plan)]
+            start = time.perf_counter()
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(host, port)
+                writer.write(requests[name])
+                status, keep_alive = await read_response(reader)
+            except (OSError, asyncio.IncompleteReadError, IndexError, ValueError) as e:
+                status, keep_alive = type(e).__name__, False
+            samples.append((name, time.perf_counter() - start, status))
+            if not keep_alive and writer is not None:
+                writer.close()
+                writer = None
+        if writer is not None:
+            writer.close()
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return samples
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted (non-empty) values."""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def summarize(samples: List[Sample], elapsed: float) -> dict:
+    latencies = sorted(seconds for _, seconds, _ in samples)
+    summary = {
+        "requests": len(samples),
+        "errors": sum(status != 200 for _, _, status in samples),
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": None,
+    }
+    if latencies:
+        summary["latency_ms"] = {
+            "p50": round(percentile(latencies, 0.50) * 1e3, 3),
+            "p95": round(percentile(latencies, 0.95) * 1e3, 3),
+            "p99": round(percentile(latencies, 0.99) * 1e3, 3),
+            "max": round(latencies[-1] * 1e3, 3),
+            "mean": round(sum(latencies) / len(latencies) * 1e3, 3),
+        }
+    return summary
+
+
+def run(
+    target,
+    mode: str = "threads",
+    concurrency: int = 8,
+    duration: Optional[float] = 10.0,
+    requests: Optional[int] = None,
+    mix: str = DEFAULT_MIX,
+    language: str = "it",
+) -> dict:
+    """Drive `target` (a WSGI app, or the base URL of a server) and return the report."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if mode == "asyncio" and not isinstance(target, str):
+        raise ValueError("asyncio mode needs a URL")
+    plan = parse_mix(mix)
+    bodies = request_bodies(language)
+    # Shared countdown of the requests left (next() is atomic under the GIL)
+    budget = itertools.count(requests, -1) if requests else itertools.repeat(1)
+    start = time.perf_counter()
+    deadline = start + duration if duration else math.inf
+
+    if mode == "asyncio":
+        samples = asyncio.run(run_asyncio(target, plan, bodies, concurrency, deadline, budget))
+    elif mode == "threads":
+        factory = http_sender(target) if isinstance(target, str) else flask_sender(target)
+        samples = run_threads(factory, plan, bodies, concurrency, deadline, budget)
+    else:
+        raise ValueError("mode must be 'threads' or 'asyncio'")
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "target": target if isinstance(target, str) else "in-process",
+        "mode": mode,
+        "concurrency": concurrency,
+        "mix": mix,
+        "language": language,
+        "elapsed_s": round(elapsed, 3),
+        **summarize(samples, elapsed),
+        "statuses": dict(Counter(str(status) for _, _, status in samples)),
+        "endpoints": {},
+    }
+    for name in ENDPOINTS:
+        subset = [s for s in samples if s[0] == name]
+        if subset:
+            report["endpoints"][name] = summarize(subset, elapsed)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m misipwgen.loadtest", description=__doc__.splitlines()[0])
+    target = p.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Base URL of a running server, e.g. http://127.0.0.1:8000")
+    target.add_argument(
+        "--app", default="webapp:app", help="WSGI app run in-process (default: webapp:app)"
+    )
+    p.add_argument(
+        "--mode", choices=("threads", "asyncio"), default="threads", help="Client concurrency model"
+    )
+    p.add_argument("-c", "--concurrency", type=int, default=8, help="Concurrent clients (default 8)")
+    p.add_argument("-d", "--duration", type=float, default=10.0, help="Seconds to run (default 10)")
+    p.add_argument("-n", "--requests", type=int, help="Stop after this many requests instead")
+    p.add_argument("--mix", default=DEFAULT_MIX, help=f"Request weights (default {DEFAULT_MIX})")
+    p.add_argument("--lang", default="it", help="Language of the requests (default: it)")
+    p.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    args = p.parse_args(argv)
+    if args.mode == "asyncio" and not args.url:
+        p.error("--mode asyncio needs --url")
+
+    try:
+        target = args.url or load_app(args.app)
+        report = run(
+            target,
+            mode=args.mode,
+            concurrency=args.concurrency,
+            duration=None if args.requests else args.duration,
+            requests=args.requests,
+            mix=args.mix,
+            language=args.lang,
+        )
+    except (ImportError, AttributeError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    latency = report["latency_ms"] or {}
+    print(
+        f"{report['throughput_rps']:,.0f} req/s  "
+        f"p50 {latency.get('p50')} ms  p95 {latency.get('p95')} ms  p99 {latency.get('p99')} ms  "
+        f"({report['requests']} requests, {report['errors']} errors)",
+        file=sys.stderr,
+    )
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,177 @@
+"""Counters and latency histograms for the web apps, in Prometheus text format.
+
+Each thread updates its own shard of plain dicts, so recording a sample takes
+no lock. A shard is registered once per thread, and `render()` sums the
+shards. Gauges (table load times, readiness) change rarely and are set under
+a lock. Metric names and types come from `DEFINITIONS`:
+
+    metrics = Metrics()
+    metrics.inc("misipwgen_requests_total", (("endpoint", "word"), ("status", "200")))
+    metrics.observe("misipwgen_request_seconds", (("endpoint", "word"),), 0.0004)
+    metrics.render()
+
+Counters are per process: with several gunicorn workers, each scrape reports
+the worker that answered it.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implied
+BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+DEFINITIONS = {
+    "misipwgen_requests_total": ("counter", "API requests by endpoint, language and status."),
+    "misipwgen_request_seconds": (
+        "histogram",
+        "Time to handle an API request, generation and serialization.",
+    ),
+    "misipwgen_generation_seconds": (
+        "histogram",
+        "Time spent validating a request and generating words.",
+    ),
+    "misipwgen_serialization_seconds": (
+        "histogram",
+        "Time spent encoding generated words into the response.",
+    ),
+    "misipwgen_words_generated_total": ("counter", "Words generated, by language."),
+    "misipwgen_characters_generated_total": (
+        "counter",
+        "Letters generated (separators excluded), by language.",
+    ),
+    "misipwgen_table_load_seconds": (
+        "gauge",
+        "Time to load and warm the syllable tables of a language.",
+    ),
+    "misipwgen_ready": ("gauge", "1 once every generator is loaded."),
+    "misipwgen_reservoir_hits_total": ("counter", "Words served from the reservoir."),
+    "misipwgen_reservoir_fallbacks_total": (
+        "counter",
+        "Words generated inline because a buffer was empty.",
+    ),
+    "misipwgen_reservoir_words": ("gauge", "Words buffered in the reservoir, by language and length."),
+}
+
+
+class Metrics:
+    """Per-thread counters and histograms plus gauges, rendered for Prometheus."""
+
+    def __init__(self, definitions: Dict[str, Tuple[str, str]] = DEFINITIONS, buckets=BUCKETS):
+        self.definitions = definitions
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[dict, dict]] = []
+        self._gauges: Dict[Tuple[str, Labels], float] = {}
+
+    def _shard(self) -> Tuple[dict, dict]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = ({}, {})
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1) -> None:
+        """Add `value` to a counter."""
+        counters = self._shard()[0]
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Labels, seconds: float) -> None:
+        """Record one sample in a histogram."""
+        histograms = self._shard()[1]
+        key = (name, labels)
+        entry = histograms.get(key)
+        if entry is None:
+            # One count per bucket, then +Inf, then the sum
+            entry = histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        entry[bisect_left(self.buckets, seconds)] += 1
+        entry[-1] += seconds
+
+    def set(self, name: str, labels: Labels, value: float) -> None:
+        """Set a gauge (or a total kept elsewhere)."""
+        with self._lock:
+            self._gauges[(name, labels)] = value
+
+    def collect(self) -> Tuple[dict, dict]:
+        """Sum the shards: counters (and gauges) by key, and histogram entries by key."""
+        with self._lock:
+            shards = list(self._shards)
+            values = dict(self._gauges)
+        histograms: Dict[Tuple[str, Labels], list] = {}
+        for counters, entries in shards:
+            for key, value in list(counters.items()):
+                values[key] = values.get(key, 0) + value
+            for key, entry in list(entries.items()):
+                total = histograms.setdefault(key, [0] * len(entry[:-1]) + [0.0])
+                for i, n in enumerate(entry):
+                    total[i] += n
+        return values, histograms
+
+    def render(self) -> str:
+        """Every metric in Prometheus text exposition format (version 0.0.4)."""
+        values, histograms = self.collect()
+        lines = []
+        for name, (kind, help_text) in self.definitions.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "histogram":
+                for (metric, labels), entry in sorted(histograms.items()):
+                    if metric == name:
+                        lines.extend(self._histogram(name, labels, entry))
+            else:
+                for (metric, labels), value in sorted(values.items()):
+                    if metric == name:
+                        lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _histogram(self, name: str, labels: Labels, entry: list) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), entry):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(labels + (('le', _number(bound)),))} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {_number(entry[-1])}")
+        lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+        return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
@@ -1,46 +1,296 @@
-from random import randrange
-from typing import Iterable, Optional
-
-from importlib import resources
-
+import os
+import random
+import sys
+import threading
+from typing import Callable, Iterable, List, Optional
+
+from .alias import AliasTable
+from .cache import TABLES, load_compiled
 from .cumulative import CumulativeDistribution
+from .entropy import step_entropy
+from .generator_v2 import GenerationError
+from .secure import ThreadLocalRng
 from .settings import SYLLABLES_FILE
+from .stats import GenerationStats
+from .syllable_collection import SyllableCollection
 from .syllables_loader import SyllablesLoader
 
 
-class MisiPwGen:
-    def __init__(self, lang: Optional[str] = None, syllables_path: Optional[str] = None, *, rng=None):
+class SyllableTables:
+    """Syllables and cumulative weights for one legacy CSV, shared read-only by generators."""
+
+    def __init__(self, syllables, cumulative=None):
+        self.syllables = syllables
+        if cumulative is None:
+            cumulative = CumulativeDistribution(weights=[s.weight for s in syllables])
+        self.cumulative = cumulative
+        self._alias_by_index = {}
+        self._renderings = None
+        self._boundary = {}
+        # Boundary tables that only exist because the vowel-vowel rule was relaxed
+        self.relaxed = set()
+        self._entropy_lock = threading.Lock()
+        self._entropy_letters = None
+        self._entropy_steps = {}
+        # Entropy of the rest of a word by (residual, previous letter)
+        self._entropy_rest = {}
+
+    def alias_upto(self, index):
+        """Alias table over syllables `[0, index]`, built on first use."""
+        table = self._alias_by_index.get(index)
+        if table is None:
+            table = AliasTable([s.weight for s in self.syllables[: index + 1]])
+            self._alias_by_index[index] = table
+        return table
+
+    @property
+    def renderings(self):
+        """Every rendering of every syllable as `(texts, weights, starting)` lists.
+
+        Built from `SyllablesLoader.expand_variants`: each syllable weight is split
+        evenly among its renderings.
+        """
+        if self._renderings is None:
+            expanded = SyllablesLoader.expand_variants(self.syllables)
+            self._renderings = (
+                [sys.intern("".join(s.sequence)) for s in expanded],
+                [max(0, s.weight) for s in expanded],
+                [s.starting for s in expanded],
+            )
+        return self._renderings
+
+    def boundary_table(self, residual: int, prev: str):
+        """Alias table over the renderings accepted after `prev` ("" at the start).
+
+        Indices point into `renderings`; the draw has the distribution `generate()`
+        gets by rejection. The vowel-vowel rule is relaxed where nothing passes it.
+        Tables are built on first use per previous letter and residual bucket
+        (residuals above the longest syllable share one); None if nothing fits.
+        """
+        bucket = min(residual, self.syllables.max_syllable_length + 1)
+        key = (bucket, prev)
+        if key not in self._boundary:
+            texts, weights, starting = self.renderings
+            reject = MisiPwGen._reject_by_boundary
+            candidates = [
+                i
+                for i, text in enumerate(texts)
+                if len(text) <= bucket and weights[i] and (prev or starting[i])
+            ]
+            accepted = [i for i in candidates if not reject(prev, texts[i], bucket)]
+            relaxed = not accepted
+            if relaxed:
+                accepted = [
+                    i for i in candidates if not reject(prev, texts[i], bucket, relax_vowel_vowel=True)
+                ]
+            table = AliasTable([weights[i] for i in accepted], accepted) if accepted else None
+            if relaxed and table is not None:
+                self.relaxed.add(table)
+            self._boundary[key] = table
+        return self._boundary[key]
+
+    def choice_entropy_bits(self, n: int) -> float:
+        """Upper bound in bits on the entropy of a word from `MisiPwGen.generate(n)`.
+
+        This is the entropy of the generator's choices: syllable splits that spell
+        the same word are counted separately, so it can exceed the word entropy.
+        The state is the residual length and the previous letter, which is all the
+        boundary rules look at; each step draws from `boundary_table()`.
+        """
+        if n < 1:
+            return 0.0
+        with self._entropy_lock:
+            if self._entropy_letters is None:
+                self._entropy_letters = sorted({text[-1] for text in self.renderings[0]})
+            # Bottom-up over shorter residuals, for every letter a word can end with so far
+            for residual in range(1, n):
+                for letter in self._entropy_letters:
+                    if (residual, letter) not in self._entropy_rest:
+                        self._entropy_rest[residual, letter] = self._step_entropy(residual, letter)
+            bits = self._step_entropy(n, "")
+        if bits is None:
+            raise GenerationError(f"No syllables can complete a word of length {n}")
+        return bits
+
+    def _step_entropy(self, residual: int, prev: str):
+        # None marks states generate() cannot leave; an error only if they are reachable
+        key = (min(residual, self.syllables.max_syllable_length + 1), prev)
+        step = self._entropy_steps.get(key)
+        if step is None and key not in self._entropy_steps:
+            table = self.boundary_table(residual, prev)
+            if table is not None:
+                texts = self.renderings[0]
+                outcomes = ((texts[i], w) for i, w in zip(table.indices, table.weights))
+                step = step_entropy(outcomes, lambda text: (len(text), text[-1]))
+            self._entropy_steps[key] = step
+        if step is None:
+            return None
+        bits, transitions = step
+        for (length, letter), p in transitions.items():
+            if residual > length:
+                rest = self._entropy_rest.get((residual - length, letter))
+                if rest is None:
+                    return None
+                bits += p * rest
+        return bits
+
+    @classmethod
+    def compile(cls, data: bytes, parse: Callable[[], SyllableCollection]) -> "SyllableTables":
+        """Tables for CSV content `data`, parsed by `parse()` unless compiled on disk before."""
+
+        def build():
+            syllables = parse()
+            return syllables, CumulativeDistribution(weights=[s.weight for s in syllables])
+
+        return cls(*load_compiled("v1", data, build))
+
+    @classmethod
+    def load(cls, path) -> "SyllableTables":
+        """Return the process-wide tables for the CSV at `path` (reloaded if the file changes)."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = ("v1", path, stat.st_mtime_ns, stat.st_size)
+
+        def build():
+            if path.endswith(".bin"):
+                # Already compiled: nothing to gain from the pickle cache
+                return cls(SyllablesLoader(path).load())
+            with open(path, "rb") as f:
+                return cls.compile(f.read(), SyllablesLoader(path).load)
+
+        return TABLES.get(key, build)
+
+    @classmethod
+    def load_language(cls, lang: str) -> "SyllableTables":
+        """Return the process-wide tables for the packaged `data/{lang}/syllables.csv`."""
+        from importlib import resources
+
+        res = resources.files("misipwgen").joinpath(f"data/{lang}/syllables.csv")
+
+        def parse():
+            # Ensure a real filesystem path (works under zipimport)
+            with resources.as_file(res) as p:
+                return SyllablesLoader(str(p)).load()
+
+        return TABLES.get(("v1", "lang", lang), lambda: cls.compile(res.read_bytes(), parse))
+
+
+class MisiPwGen(ThreadLocalRng):
+    def __init__(
+        self,
+        lang: Optional[str] = None,
+        syllables_path: Optional[str] = None,
+        *,
+        rng=None,
+        rng_factory: Optional[Callable[[], object]] = None,
+        rejection_sampling: bool = False,
+        stats: Optional[GenerationStats] = None,
+    ):
         """
         Create a password/word generator.
 
-        - If `syllables_path` is provided, load from that CSV (tests can override).
+        - If `syllables_path` is provided, load from that CSV or `.bin` file (tests can override).
         - Else if `lang` is provided, load package data from `misipwgen/data/{lang}/syllables.csv`.
         - Else fall back to legacy path from settings (`SYLLABLES_FILE`).
+
+        Randomness comes from `rng` (shared by all threads), or from one
+        `rng_factory()` instance per thread, else from the `random` module.
+
+        Syllables are drawn from tables already filtered by the boundary rules, so
+        every draw is accepted. `rejection_sampling=True` restores the original
+        draw/render/reject loop (same distribution, unbounded attempts).
+
+        Pass a `misipwgen.stats.GenerationStats` as `stats` to record attempts,
+        rejections per rule and relaxed-rule fallbacks.
         """
-        self.rng = rng
+        self._init_rng(rng, rng_factory)
+        self.rejection_sampling = rejection_sampling
+        self.stats = stats
 
         if syllables_path:
-            self.syllables = SyllablesLoader(syllables_path).load()
+            self.tables = SyllableTables.load(syllables_path)
         elif lang:
-            res = resources.files("misipwgen").joinpath(f"data/{lang}/syllables.csv")
-            # Ensure a real filesystem path (works under zipimport)
-            with resources.as_file(res) as p:
-                self.syllables = SyllablesLoader(str(p)).load()
+            self.tables = SyllableTables.load_language(lang)
         else:
-            self.syllables = SyllablesLoader(SYLLABLES_FILE).load()
-        self.cumulative = CumulativeDistribution(weights=[s.weight for s in self.syllables])
+            self.tables = SyllableTables.load(SYLLABLES_FILE)
+        # Shared, read-only tables (see `misipwgen.cache`)
+        self.syllables = self.tables.syllables
+        self.cumulative = self.tables.cumulative
 
     def generate(self, n=8):
+        if self.rejection_sampling:
+            return self._generate_word(n, self._random_syllable)
+        rnd = self.current_rng().randrange
+        return self._generate_word(n, lambda table: table.sample(rnd))
+
+    def generate_many(self, length: int, count: int) -> List[str]:
+        """Generate `count` words of `length` letters.
+
+        Draws are taken in blocks per table and consumed in order, so words keep
+        the distribution of `generate()`.
+        """
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        block = max(256, min(count * 2, 1 << 16))
+        pool = _SyllablePool(self, block) if self.rejection_sampling else _DrawPool(self, block)
+        return [self._generate_word(length, pool.draw) for _ in range(count)]
+
+    def _generate_word(self, n, draw):
+        if self.stats is not None:
+            return self._generate_recorded(n, draw)
+        if self.rejection_sampling:
+            return self._generate(n, draw)
+        return self._generate_filtered(n, draw)
+
+    def _generate_recorded(self, n, draw):
+        recorder = self.stats.word(n)
+        if self.rejection_sampling:
+            word = self._generate(n, recorder.draws(draw), recorder.checks(self._boundary_violation))
+        else:
+            word = self._generate_filtered(n, recorder.draws(draw, self.tables.relaxed))
+        recorder.commit()
+        return word
+
+    def _generate_filtered(self, n, draw):
+        # `draw(table)` returns an index into `tables.renderings` sampled from `table`
+        texts = self.tables.renderings[0]
+        boundary_table = self.tables.boundary_table
+        parts = []
+        prev = ""
+        residual = n
+        while residual > 0:
+            table = boundary_table(residual, prev)
+            if table is None:
+                raise GenerationError(
+                    f"No syllables can continue a word of length {n} after {''.join(parts)!r}"
+                )
+            letters = texts[draw(table)]
+            parts.append(letters)
+            residual -= len(letters)
+            prev = letters[-1]
+        return "".join(parts)
+
+    def choice_entropy_bits(self, n: int) -> float:
+        """Upper bound in bits on the entropy of a word from `generate(n)`.
+
+        Counts the generator's choices (syllables and their renderings), not the
+        words: when two syllable splits spell the same word, the word entropy is
+        lower. Cached per syllable table and length.
+        """
+        return self.tables.choice_entropy_bits(n)
+
+    def _generate(self, n, random_syllable, reject=None):
+        reject = reject or self._reject_by_boundary
         word = ""
         residual = n
 
         attempts = 0
         while residual > 0:
-            syllable = self._random_syllable(residual)
+            syllable = random_syllable(residual)
 
             if syllable.is_usable(first_position=(residual == n)):
                 syllable_letters = self._render_syllable(syllable)
-                if not self._reject_by_boundary(word, syllable_letters, residual):
+                if not reject(word, syllable_letters, residual):
                     word += syllable_letters
                     residual = n - len(word)
                     attempts = 0
@@ -49,7 +299,7 @@ class MisiPwGen:
                     # Safeguard to avoid infinite loops under strict constraints
                     if attempts > 10000:
                         # Relax only the vowel-vowel rule to allow progress
-                        if not self._reject_by_boundary(word, syllable_letters, residual, relax_vowel_vowel=True):
+                        if not reject(word, syllable_letters, residual, relax_vowel_vowel=True):
                             word += syllable_letters
                             residual = n - len(word)
                             attempts = 0
@@ -59,27 +309,40 @@ class MisiPwGen:
     def _random_syllable(self, residual):
         index = self.syllables.last_index(residual)
         max_weight = self.cumulative.weight_at(index)
-        rnd = self.rng.randrange if self.rng else randrange
-        weight = rnd(1, max_weight + 1)
+        weight = self.current_rng().randrange(1, max_weight + 1)
         choice = self.cumulative.invert(weight)
         return self.syllables[choice]
 
     @staticmethod
-    def _reject_by_boundary(current: str, candidate: str, residual: int, *, relax_vowel_vowel: bool = False) -> bool:
+    def _reject_by_boundary(
+        current: str, candidate: str, residual: int, *, relax_vowel_vowel: bool = False
+    ) -> bool:
         """Enforce simple pronounceability rules at syllable joins.
 
         - Avoid doubling the boundary letter.
         - Avoid vowel-vowel and consonant-consonant joins.
         - Accented vowels are only allowed in the final syllable.
         """
+        return (
+            MisiPwGen._boundary_violation(
+                current, candidate, residual, relax_vowel_vowel=relax_vowel_vowel
+            )
+            is not None
+        )
+
+    @staticmethod
+    def _boundary_violation(
+        current: str, candidate: str, residual: int, *, relax_vowel_vowel: bool = False
+    ) -> Optional[str]:
+        """Return the name of the first boundary rule `candidate` breaks, or None."""
         if not candidate:
-            return True
+            return "empty_candidate"
         prev = current[-1:] if current else ""
         first = candidate[0]
 
         # Rule 1: avoid repeated boundary letter
         if prev and first == prev:
-            return True
+            return "repeated_letter"
 
         V = set("aeiouàèéìòóù")
         ACC = set("àèéìòóù")
@@ -87,11 +350,11 @@ class MisiPwGen:
         # Rule 2: disallow accent before final syllable
         if any(ch in ACC for ch in candidate):
             if residual != len(candidate):
-                return True
+                return "accent_not_final"
 
         # If there is no previous letter, accept
         if not prev:
-            return False
+            return None
 
         prev_is_v = prev in V
         next_is_v = first in V
@@ -100,14 +363,14 @@ class MisiPwGen:
         # or if we are explicitly relaxing this rule to make progress.
         if prev_is_v == next_is_v:
             if next_is_v and (residual == len(candidate) or relax_vowel_vowel):
-                return False
-            return True
+                return None
+            return "vowel_vowel" if next_is_v else "consonant_consonant"
 
         # Additional guard: disallow single-vowel syllables in middle positions
         if residual != len(candidate) and len(candidate) == 1 and next_is_v:
-            return True
+            return "single_vowel_middle"
 
-        return False
+        return None
 
     # --- Phrase/Sentence helpers (feature: sentence mode) ---
     def phrase(self, *lengths: int, sep: str = "_") -> str:
@@ -127,13 +390,13 @@ class MisiPwGen:
         """
         if total_length < 1:
             raise ValueError("total_length must be >= 1")
-        parts = self._partition_length(total_length)
+        parts = self._partition_length(total_length, self.current_rng())
         return self.phrase(*parts, sep=sep)
 
     @staticmethod
-    def _partition_length(n: int) -> list:
+    def _partition_length(n: int, rng=None) -> list:
         """Partition n into 2-6 positive integers, biased around 4-8 per word."""
-        from random import randint
+        randint = (rng or random).randint
 
         if n <= 3:
             return [n]
@@ -170,23 +433,71 @@ class MisiPwGen:
                 rem -= 1
                 i += 1
             return [max(1, x) for x in base]
-        return self._partition_length(total_length)
+        return self._partition_length(total_length, self.current_rng())
 
     # Factories
     @classmethod
-    def from_language(cls, lang: str, *, rng=None) -> "MisiPwGen":
-        return cls(lang=lang, rng=rng)
+    def from_language(
+        cls, lang: str, *, rng=None, rng_factory=None, rejection_sampling=False, stats=None
+    ) -> "MisiPwGen":
+        return cls(
+            lang=lang,
+            rng=rng,
+            rng_factory=rng_factory,
+            rejection_sampling=rejection_sampling,
+            stats=stats,
+        )
 
     @classmethod
-    def from_csv(cls, path, *, rng=None) -> "MisiPwGen":
-        return cls(syllables_path=str(path), rng=rng)
+    def from_csv(
+        cls, path, *, rng=None, rng_factory=None, rejection_sampling=False, stats=None
+    ) -> "MisiPwGen":
+        return cls(
+            syllables_path=str(path),
+            rng=rng,
+            rng_factory=rng_factory,
+            rejection_sampling=rejection_sampling,
+            stats=stats,
+        )
 
     def _render_syllable(self, syllable):
-        if self.rng is None:
-            return syllable.random()
         # Deterministic per provided RNG
+        rng = self.current_rng()
         letters = ""
         for seq in syllable.sequence:
-            idx = self.rng.randrange(0, len(seq))
+            idx = rng.randrange(0, len(seq))
             letters += seq[idx]
         return letters
+
+
+class _SyllablePool:
+    """Pre-drawn syllable indices per length bucket, refilled in blocks."""
+
+    def __init__(self, gen: MisiPwGen, block: int):
+        self.gen = gen
+        self.block = block
+        self.draws = {}
+
+    def draw(self, residual):
+        index = self.gen.syllables.last_index(residual)
+        draws = self.draws.get(index)
+        if not draws:
+            draws = self.gen.tables.alias_upto(index).sample_many(self.block, self.gen.current_rng())
+            self.draws[index] = draws
+        return self.gen.syllables[draws.pop()]
+
+
+class _DrawPool:
+    """Pre-drawn rendering indices per boundary table, refilled in blocks."""
+
+    def __init__(self, gen: MisiPwGen, block: int):
+        self.gen = gen
+        self.block = block
+        self.draws = {}
+
+    def draw(self, table):
+        draws = self.draws.get(table)
+        if not draws:
+            draws = table.sample_many(self.block, self.gen.current_rng())
+            self.draws[table] = draws
+        return draws.pop()
@@ -0,0 +1,86 @@
+"""Build tables once in a pre-fork server's master process and share them with workers.
+
+Forked workers (gunicorn with `preload_app`, see `gunicorn.conf.py`) inherit
+the master's memory copy-on-write. Syllable data loaded from the packaged
+`.bin` files is a read-only file mapping, shared by every process through the
+page cache; the tables built from it live on the heap. `warm()` builds them
+before the fork, so workers find them in the process-wide cache
+(`misipwgen.cache`) instead of building private copies, and `freeze()` moves
+them out of the garbage collector's reach so that collections in a worker do
+not write to (and so copy) the pages that hold them.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+from typing import Dict, List
+
+from .generator_v2 import DATA_DIR, MisiPwGenV2
+
+# Fields of /proc/<pid>/smaps_rollup reported by `memory_usage`, in kB
+_SMAPS_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared_clean",
+    "Shared_Dirty": "shared_dirty",
+    "Private_Clean": "private_clean",
+    "Private_Dirty": "private_dirty",
+}
+
+
+def languages() -> List[str]:
+    """Language codes with packaged v2 data (`data/<lang>/syllables_v2.{bin,py}`)."""
+    found = []
+    for name in sorted(os.listdir(DATA_DIR)):
+        if any(
+            os.path.isfile(os.path.join(DATA_DIR, name, f"syllables_v2.{ext}")) for ext in ("bin", "py")
+        ):
+            found.append(name)
+    return found
+
+
+def warm(langs: List[str] = None) -> Dict[str, MisiPwGenV2]:
+    """Load the tables of `langs` (default: every packaged language) into the cache."""
+    return {lang: MisiPwGenV2.from_language(lang) for lang in (langs or languages())}
+
+
+def freeze() -> None:
+    """Collect garbage, then exclude every surviving object from future collections.
+
+    Call it in the master right before forking; objects created afterwards are
+    collected as usual.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def memory_usage(pid: str = "self") -> Dict[str, int]:
+    """Resident memory of a process in kB: `rss`, `pss` and the shared/private split.
+
+    Read from /proc (Linux); elsewhere only `rss` (peak resident size) is known.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+            lines = f.readlines()
+    except OSError:
+        lines = None
+    if lines is not None:
+        usage = {}
+        for line in lines:
+            key, _, value = line.partition(":")
+            if key in _SMAPS_FIELDS:
+                usage[_SMAPS_FIELDS[key]] = int(value.split()[0])
+        return usage
+    if pid != "self":
+        return {}
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kB, macOS bytes
+    return {"rss": peak // 1024 if sys.platform == "darwin" else peak}
+
+
+def format_memory(usage: Dict[str, int]) -> str:
+    return " ".join(f"{key}={value / 1024:.1f}MiB" for key, value in usage.items())
@@ -0,0 +1,173 @@
+"""Pre-generated words for latency-sensitive callers.
+
+`WordReservoir` keeps a ring buffer of words per (language, length), topped up
+by a background thread with `generate_many()`, so a request only pops a word:
+
+    reservoir = WordReservoir({"it": MisiPwGen.from_language("it")}, capacity=1024)
+    reservoir.get("it", 10)
+
+Each word is handed out at most once: pops are atomic under the GIL, and words
+pushed out of a full buffer are dropped. When a buffer is empty (or cannot be
+created), the word is generated synchronously. That counts as a fallback in
+`stats()`. Buffers are wiped in forked children so that parent and child never
+share words, and the refill thread is restarted on the next `get()`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional, Tuple
+
+# Instances are wiped in forked children so parent and child never hand out the same words
+_INSTANCES: "weakref.WeakSet[WordReservoir]" = weakref.WeakSet()
+
+
+class WordReservoir:
+    """Per-(language, length) ring buffers of words, refilled between watermarks.
+
+    - `capacity`: most words kept per buffer.
+    - `low`: a buffer is refilled once it holds `low` words or fewer (default `capacity // 4`).
+    - `high`: refills stop at `high` words (default `capacity`).
+    - `max_buffers`: most (language, length) pairs buffered; other lengths always fall back.
+
+    `generators` maps a language to its generator and is read on every call, so a
+    dict that is filled later (e.g. `GeneratorRegistry.generators`) works. With
+    `background=False` no thread is started; call `refill()` to top up the buffers.
+    """
+
+    def __init__(
+        self,
+        generators: Mapping[str, object],
+        capacity: int = 1024,
+        low: Optional[int] = None,
+        high: Optional[int] = None,
+        max_buffers: int = 64,
+        background: bool = True,
+    ):
+        low = capacity // 4 if low is None else low
+        high = capacity if high is None else high
+        if not 0 <= low < high <= capacity:
+            raise ValueError("watermarks must satisfy 0 <= low < high <= capacity")
+        if max_buffers < 0:
+            raise ValueError("max_buffers must be >= 0")
+        self.generators = generators
+        self.capacity = capacity
+        self.low = low
+        self.high = high
+        self.max_buffers = max_buffers
+        self.background = background
+        self._closed = False
+        self._reset()
+        _INSTANCES.add(self)
+
+    def _reset(self) -> None:
+        self._buffers: Dict[Tuple[str, int], Deque[str]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._hits = self._fallbacks = self._refills = self._generated = 0
+
+    def get(self, language: str, length: int) -> str:
+        """Pop a word of `length` letters, or generate one if its buffer is empty."""
+        key = (language, length)
+        # No lock: `_buffers` is replaced, never cleared in place, so a get() racing close()
+        # or a fork reset pops from the old buffers, and each word is still handed out once
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._add(key)
+        if buffer is not None:
+            try:
+                word = buffer.popleft()
+            except IndexError:
+                word = None
+            if len(buffer) <= self.low:
+                self._wake.set()
+            if word is not None:
+                with self._lock:
+                    self._hits += 1
+                return word
+        word = self.generators[language].generate(length)
+        with self._lock:
+            self._fallbacks += 1
+        return word
+
+    def _add(self, key: Tuple[str, int]) -> Optional[Deque[str]]:
+        if key[0] not in self.generators:
+            raise KeyError(key[0])
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is None and len(self._buffers) < self.max_buffers and not self._closed:
+                buffer = self._buffers[key] = deque(maxlen=self.capacity)
+            if self.background and self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="misipwgen-reservoir", daemon=True
+                )
+                self._thread.start()
+        return buffer
+
+    def _run(self) -> None:
+        wake = self._wake
+        while not self._closed:
+            wake.wait()
+            wake.clear()
+            if self._closed or self._thread is not threading.current_thread():
+                return
+            self.refill()
+
+    def refill(self) -> int:
+        """Top up every buffer at or below `low` to `high` words; return the words added.
+
+        Words are counted by how much each buffer grew, so words popped meanwhile or
+        pushed out of a full buffer are not counted.
+        """
+        with self._lock:
+            buffers = list(self._buffers.items())
+        added = 0
+        for (language, length), buffer in buffers:
+            before = len(buffer)
+            missing = self.high - before
+            if before > self.low or missing <= 0:
+                continue
+            buffer.extend(self.generators[language].generate_many(length, missing))
+            grown = max(len(buffer) - before, 0)
+            added += grown
+            with self._lock:
+                self._refills += 1
+                self._generated += grown
+        return added
+
+    def close(self) -> None:
+        """Stop the refill thread and drop the buffered words."""
+        self._closed = True
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._lock:
+            self._buffers = {}
+
+    def stats(self) -> dict:
+        """Return hits, synchronous fallbacks, refills and the buffered words per language."""
+        buffers: Dict[str, Dict[int, int]] = {}
+        with self._lock:
+            for (language, length), buffer in sorted(self._buffers.items()):
+                buffers.setdefault(language, {})[length] = len(buffer)
+            return {
+                "hits": self._hits,
+                "fallbacks": self._fallbacks,
+                "refills": self._refills,
+                "generated": self._generated,
+                "buffers": buffers,
+            }
+
+
+def _reset_after_fork() -> None:
+    for reservoir in list(_INSTANCES):
+        reservoir._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
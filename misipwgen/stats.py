@@ -0,0 +1,95 @@
+"""Opt-in statistics for the legacy generator's accept/reject loop.
+
+Pass a `GenerationStats` to `MisiPwGen(stats=...)` (one instance can be shared
+by several generators and threads). Generators without stats run the plain
+loop and pay nothing. Each word is recorded locally while it is generated and
+merged under a lock once it is complete.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+
+class GenerationStats:
+    """Attempts per word, rejections per boundary rule and relaxed-rule fallbacks.
+
+    - `attempts`: per word length, how many words took each number of syllable draws.
+    - `rejections`: how many drawn renderings each rule of `_reject_by_boundary` refused.
+    - `fallbacks`: syllables accepted only because the vowel-vowel rule was relaxed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._attempts: Dict[int, Counter] = {}
+            self._rejections: Counter = Counter()
+            self._fallbacks = 0
+
+    def word(self, length: int) -> "WordRecorder":
+        """Return a recorder for one word; call its `commit()` once the word is done."""
+        return WordRecorder(self, length)
+
+    def _merge(self, recorder: "WordRecorder") -> None:
+        with self._lock:
+            self._attempts.setdefault(recorder.length, Counter())[recorder.attempts] += 1
+            self._rejections.update(recorder.rejections)
+            self._fallbacks += recorder.fallbacks
+
+    def snapshot(self) -> dict:
+        """Return a copy of the counters as plain dicts."""
+        with self._lock:
+            return {
+                "words": sum(sum(c.values()) for c in self._attempts.values()),
+                "attempts": {
+                    length: dict(sorted(c.items())) for length, c in sorted(self._attempts.items())
+                },
+                "rejections": dict(self._rejections),
+                "fallbacks": self._fallbacks,
+            }
+
+
+class WordRecorder:
+    """Counters for a single word, wrapping the generator's draw and check functions."""
+
+    __slots__ = ("stats", "length", "attempts", "rejections", "fallbacks")
+
+    def __init__(self, stats: GenerationStats, length: int):
+        self.stats = stats
+        self.length = length
+        self.attempts = 0
+        self.rejections: Counter = Counter()
+        self.fallbacks = 0
+
+    def draws(self, draw: Callable, relaxed: Optional[set] = None) -> Callable:
+        """Count calls to `draw`; with `relaxed`, also count draws from those tables."""
+
+        def counted(arg):
+            self.attempts += 1
+            if relaxed is not None and arg in relaxed:
+                self.fallbacks += 1
+            return draw(arg)
+
+        return counted
+
+    def checks(self, violation: Callable) -> Callable:
+        """Turn a `_boundary_violation`-like function into a counting reject predicate."""
+
+        def reject(current, candidate, residual, *, relax_vowel_vowel=False):
+            rule = violation(current, candidate, residual, relax_vowel_vowel=relax_vowel_vowel)
+            if relax_vowel_vowel:
+                if rule is None:
+                    self.fallbacks += 1
+            elif rule is not None:
+                self.rejections[rule] += 1
+            return rule is not None
+
+        return reject
+
+    def commit(self) -> None:
+        self.stats._merge(self)
@@ -1,3 +1,4 @@
+from itertools import product
 from random import randint
 
 
@@ -7,13 +8,18 @@ class Syllable:
         self.weight = weight
         self.sequence = sequence
 
-    def random(self):
+    def random(self, rng=None):
+        rnd = rng.randint if rng else randint
         s = ""
         for i in range(0, self.length()):
-            pos = randint(0, len(self.sequence[i]) - 1)
+            pos = rnd(0, len(self.sequence[i]) - 1)
             s += self.sequence[i][pos]
         return s
 
+    def variants(self):
+        """Every rendering of the syllable, one letter per column; each is equally likely."""
+        return tuple("".join(p) for p in product(*self.sequence))
+
     def is_usable(self, first_position):
         return not first_position or self.starting
 
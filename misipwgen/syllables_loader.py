@@ -1,21 +1,63 @@
 import csv
+from math import lcm
 
+from . import binary
 from .syllable import Syllable
 from .syllable_collection import SyllableCollection
 
 
 class SyllablesLoader:
-    def __init__(self, file):
+    def __init__(self, file, expand=False):
+        """Load syllables from a `;`-separated CSV.
+
+        With `expand=True` every syllable is replaced by its concrete renderings
+        (see `expand_variants`), so each column holds a single letter. Files ending
+        in `.bin` are read as binary data (see `misipwgen.binary`).
+        """
         self.file = file
+        self.expand = expand
 
     def load(self):
+        if str(self.file).endswith(".bin"):
+            collection = self._load_binary()
+        else:
+            collection = SyllableCollection()
+            with open(self.file, newline="", encoding="utf-8") as csv_file:
+                syllable_definitions = csv.reader(csv_file, delimiter=";", quotechar="|")
+                for row in self._only_data(syllable_definitions):
+                    s = Syllable(starting=int(row[0]) == 1, weight=int(row[1]), sequence=row[2:])
+                    collection.append(s)
+        collection.finalize()
+        if self.expand:
+            return self.expand_variants(collection)
+        return collection
+
+    @staticmethod
+    def expand_variants(syllables):
+        """Return a collection with one syllable per rendering of `syllables`.
+
+        Each rendering gets an equal share of its syllable's weight. Weights are
+        scaled by the lcm of the rendering counts so they stay integers; relative
+        weights, and so the generated distribution, are unchanged.
+        """
+        variants = [s.variants() for s in syllables]
+        scale = lcm(*(len(v) for v in variants)) if variants else 1
+        collection = SyllableCollection()
+        for s, texts in zip(syllables, variants):
+            weight = s.weight * (scale // len(texts))
+            for text in texts:
+                collection.append(Syllable(starting=s.starting, weight=weight, sequence=list(text)))
+        collection.finalize()
+        return collection
+
+    def _load_binary(self):
+        data = binary.read(self.file)
+        if data.positional:
+            raise ValueError(f"{self.file} holds positional (v2) syllables, not legacy ones")
         collection = SyllableCollection()
-        with open(self.file, newline="", encoding="utf-8") as csv_file:
-            syllable_definitions = csv.reader(csv_file, delimiter=";", quotechar="|")
-            for row in self._only_data(syllable_definitions):
-                s = Syllable(starting=int(row[0]) == 1, weight=int(row[1]), sequence=row[2:])
-                collection.append(s)
-            collection.finalize()
+        for i, weight in enumerate(data.weights[0]):
+            starting = bool(data.kinds[i] & binary.STARTING)
+            collection.append(Syllable(starting=starting, weight=weight, sequence=list(data.columns(i))))
         return collection
 
     def _only_data(self, rows):
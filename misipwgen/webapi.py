@@ -0,0 +1,294 @@
+"""Request handling shared by the web frontends (`webapp.py` and `asgiapp.py`).
+
+Handlers take the registry and a decoded JSON body and return the response
+body, or raise `ApiError` with the HTTP status to answer; the frontends only
+parse requests and send responses. Handlers are synchronous and may run on
+any thread. `call()` runs a handler for a frontend and records the request
+in the registry's `metrics`.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bulk import generate_chunk
+from .generator_v2 import MisiPwGenPositional as MisiPwGen
+from .metrics import Metrics
+from .preload import languages as available_languages
+from .reservoir import WordReservoir
+
+# Batch endpoint limits: items per request, and items generated per streamed chunk
+MAX_BATCH = 100_000
+BATCH_CHUNK = 1_000
+
+
+class ApiError(Exception):
+    """A request the API refuses, with the HTTP status to answer."""
+
+    status = 400
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        if status is not None:
+            self.status = status
+
+
+class NotReady(ApiError):
+    """Generators did not finish loading in time."""
+
+    status = 503
+
+
+class GeneratorRegistry:
+    """One warm generator per language pack, shared by every request.
+
+    With `reservoir` (a buffer capacity, 0 to disable) single words are popped
+    from a `WordReservoir` refilled in the background.
+    """
+
+    def __init__(
+        self, languages: Optional[Iterable[str]] = None, timeout: float = 30.0, reservoir: int = 0
+    ):
+        self.languages = sorted(languages or available_languages())
+        self.timeout = timeout
+        self.generators: Dict[str, MisiPwGen] = {}
+        self.ready = threading.Event()
+        self.reservoir = WordReservoir(self.generators, capacity=reservoir) if reservoir else None
+        self.metrics = Metrics()
+
+    def warm(self) -> None:
+        """Load the tables of every language, then flag the registry as ready."""
+        for language in self.languages:
+            start = time.perf_counter()
+            pwg = MisiPwGen.from_language(language)
+            pwg.generate(8)
+            self.generators[language] = pwg
+            seconds = time.perf_counter() - start
+            self.metrics.set("misipwgen_table_load_seconds", (("language", language),), seconds)
+        self.ready.set()
+
+    def get(self, language: str, timeout: Optional[float] = None) -> MisiPwGen:
+        """Return the generator for `language`, waiting up to `timeout` s for warm-up.
+
+        Raises `ApiError` for an unknown language and `NotReady` on time-out.
+        """
+        if language not in self.languages:
+            # The default language first, as in the original "Language must be 'it' or 'es'"
+            ordered = sorted(self.languages, key=lambda lang: (lang != "it", lang))
+            choices = " or ".join(f"'{lang}'" for lang in ordered)
+            raise ApiError(f"Language must be {choices}")
+        if not self.ready.wait(self.timeout if timeout is None else timeout):
+            raise NotReady("Generators are still loading")
+        return self.generators[language]
+
+    def word(self, language: str, length: int) -> str:
+        """Generate a word, from the reservoir when there is one."""
+        pwg = self.get(language)
+        if self.reservoir is not None:
+            return self.reservoir.get(language, length)
+        return pwg.generate_word(length)
+
+    def status(self) -> Tuple[int, dict]:
+        """Readiness probe body: 200 once every generator is loaded, else 503."""
+        if not self.ready.is_set():
+            return 503, {"status": "loading"}
+        return 200, {"status": "ready", "languages": self.languages}
+
+    def language_label(self, data) -> str:
+        """The request's language as a metrics label; unknown values share one label."""
+        language = data.get("language", "it") if isinstance(data, dict) else None
+        return language if language in self.languages else "other"
+
+    def count_words(self, language: str, lengths: Iterable[int]) -> None:
+        lengths = list(lengths)
+        labels = (("language", language),)
+        self.metrics.inc("misipwgen_words_generated_total", labels, len(lengths))
+        self.metrics.inc("misipwgen_characters_generated_total", labels, sum(lengths))
+
+    def render_metrics(self) -> str:
+        """Prometheus text for `/metrics`, with the readiness and reservoir figures."""
+        metrics = self.metrics
+        metrics.set("misipwgen_ready", (), int(self.ready.is_set()))
+        if self.reservoir is not None:
+            stats = self.reservoir.stats()
+            metrics.set("misipwgen_reservoir_hits_total", (), stats["hits"])
+            metrics.set("misipwgen_reservoir_fallbacks_total", (), stats["fallbacks"])
+            for language, buffers in stats["buffers"].items():
+                for length, words in buffers.items():
+                    labels = (("language", language), ("length", str(length)))
+                    metrics.set("misipwgen_reservoir_words", labels, words)
+        return metrics.render()
+
+
+def call(
+    registry: GeneratorRegistry, handler: Callable, load: Callable[[], dict], serialize: Callable
+) -> Tuple[int, object]:
+    """Run `handler` on the body returned by `load()`; return the status and response body.
+
+    Dict bodies (and errors) are passed through `serialize`; the batch handler's
+    (mimetype, chunks) is returned as is and its chunks are timed as they stream.
+    Records the request count and the generation and serialization times.
+    """
+    data = None
+    start = time.perf_counter()
+    try:
+        data = load()
+        body, status = handler(registry, data), 200
+    except ApiError as e:
+        body, status = {"error": str(e)}, e.status
+    except Exception as e:
+        body, status = {"error": str(e)}, 500
+    generated = time.perf_counter()
+    if isinstance(body, dict):
+        body = serialize(body)
+    done = time.perf_counter()
+
+    metrics = registry.metrics
+    endpoint = handler.__name__
+    labels = (("endpoint", endpoint), ("language", registry.language_label(data)))
+    metrics.inc("misipwgen_requests_total", labels + (("status", str(status)),))
+    if status != 200 or endpoint != "batch":
+        metrics.observe("misipwgen_request_seconds", labels, done - start)
+        metrics.observe("misipwgen_generation_seconds", labels, generated - start)
+        metrics.observe("misipwgen_serialization_seconds", labels, done - generated)
+    return status, body
+
+
+def word(registry: GeneratorRegistry, data: dict) -> dict:
+    """Generate a single word."""
+    length = int(data.get("length", 7))
+    language = data.get("language", "it")
+
+    # Validate inputs
+    if length < 1 or length > 50:
+        raise ApiError("Length must be between 1 and 50")
+    result = registry.word(language, length)
+    registry.count_words(language, [length])
+
+    return {"result": result, "type": "word", "language": language}
+
+
+def phrase(registry: GeneratorRegistry, data: dict) -> dict:
+    """Generate a phrase with multiple words."""
+    word_lengths = data.get("word_lengths", [5, 5, 5])
+    separator = data.get("separator", "_")
+    language = data.get("language", "it")
+
+    # Validate inputs
+    if not word_lengths or len(word_lengths) > 10:
+        raise ApiError("Provide 1-10 word lengths")
+    if any(n < 1 or n > 50 for n in word_lengths):
+        raise ApiError("Each word length must be between 1 and 50")
+    result = separator.join(registry.word(language, int(n)) for n in word_lengths)
+    registry.count_words(language, word_lengths)
+
+    return {
+        "result": result,
+        "type": "phrase",
+        "language": language,
+        "word_count": len(word_lengths),
+    }
+
+
+def sentence(registry: GeneratorRegistry, data: dict) -> dict:
+    """Generate a sentence with automatic word splitting."""
+    total_length = int(data.get("total_length", 24))
+    separator = data.get("separator", "_")
+    language = data.get("language", "it")
+
+    # Validate inputs
+    if total_length < 1 or total_length > 100:
+        raise ApiError("Total length must be between 1 and 100")
+    pwg = registry.get(language)
+    parts = pwg.generate_sentence_parts(total_length)
+    result = separator.join(pwg.generate_words(parts))
+    registry.count_words(language, parts)
+
+    return {
+        "result": result,
+        "type": "sentence",
+        "language": language,
+        "total_length": total_length,
+    }
+
+
+def stream_batch(
+    registry: GeneratorRegistry,
+    language: str,
+    count: int,
+    layout: Callable[[], List[int]],
+    sep: str,
+    fmt: str,
+) -> Iterator[str]:
+    """Yield `count` items as NDJSON or text lines, `BATCH_CHUNK` items at a time."""
+    pwg = registry.get(language)
+    metrics = registry.metrics
+    labels = (("endpoint", "batch"), ("language", language))
+    for start in range(0, count, BATCH_CHUNK):
+        began = time.perf_counter()
+        layouts = [layout() for _ in range(min(BATCH_CHUNK, count - start))]
+        items = generate_chunk(pwg, layouts, sep)
+        generated = time.perf_counter()
+        if fmt == "ndjson":
+            chunk = "".join(json.dumps({"result": item}, ensure_ascii=False) + "\n" for item in items)
+        else:
+            chunk = "\n".join(items) + "\n"
+        metrics.observe("misipwgen_generation_seconds", labels, generated - began)
+        metrics.observe("misipwgen_serialization_seconds", labels, time.perf_counter() - generated)
+        registry.count_words(language, (n for lay in layouts for n in lay))
+        yield chunk
+
+
+def batch(registry: GeneratorRegistry, data: dict) -> Tuple[str, Iterator[str]]:
+    """Validate a batch request; return the mimetype and the lazy chunks of the body."""
+    count = int(data.get("count", 100))
+    kind = data.get("type", "word")
+    separator = data.get("separator", "_")
+    language = data.get("language", "it")
+    fmt = data.get("format", "ndjson")
+
+    # Validate inputs
+    if count < 1 or count > MAX_BATCH:
+        raise ApiError(f"Count must be between 1 and {MAX_BATCH}")
+    if fmt not in ("ndjson", "text"):
+        raise ApiError("Format must be 'ndjson' or 'text'")
+    pwg = registry.get(language)
+
+    if kind == "word":
+        min_length = int(data.get("min_length", data.get("length", 7)))
+        max_length = int(data.get("max_length", data.get("length", min_length)))
+        if not 1 <= min_length <= max_length <= 50:
+            raise ApiError("Lengths must satisfy 1 <= min_length <= max_length <= 50")
+        if min_length == max_length:
+            layout = lambda: [min_length]  # noqa: E731
+        else:
+            # The body may be produced on another thread: use that thread's RNG
+            layout = lambda: [pwg.current_rng().randint(min_length, max_length)]  # noqa: E731
+    elif kind == "phrase":
+        word_lengths = [int(n) for n in data.get("word_lengths", [5, 5, 5])]
+        if not word_lengths or len(word_lengths) > 10:
+            raise ApiError("Provide 1-10 word lengths")
+        if any(n < 1 or n > 50 for n in word_lengths):
+            raise ApiError("Each word length must be between 1 and 50")
+        layout = lambda: word_lengths  # noqa: E731
+    elif kind == "sentence":
+        total_length = int(data.get("total_length", 24))
+        if total_length < 1 or total_length > 100:
+            raise ApiError("Total length must be between 1 and 100")
+        layout = lambda: pwg.generate_sentence_parts(total_length)  # noqa: E731
+    else:
+        raise ApiError("Type must be 'word', 'phrase' or 'sentence'")
+
+    mimetype = "application/x-ndjson" if fmt == "ndjson" else "text/plain"
+    return mimetype, stream_batch(registry, language, count, layout, separator, fmt)
+
+
+# Endpoint paths of the JSON handlers
+HANDLERS = {
+    "/api/generate/word": word,
+    "/api/generate/phrase": phrase,
+    "/api/generate/sentence": sentence,
+}
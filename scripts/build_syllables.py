@@ -12,12 +12,14 @@ from typing import Dict, Iterable, List, Tuple
 
 # Local imports via relative path when run from repo; falls back to package when installed
 try:  # pragma: no cover - convenience for local script execution
+    from misipwgen import binary
     from misipwgen.lang.core import LanguagePack
     from misipwgen.lang.core import to_sequence
 except Exception:  # noqa: BLE001
     import sys
 
     sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+    from misipwgen import binary  # type: ignore
     from misipwgen.lang.core import LanguagePack, to_sequence  # type: ignore
 
 
@@ -27,12 +29,16 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--corpus", required=True, help="Path to corpus text file")
     p.add_argument("--output", help=(
         "Output path. For v2 generates a Python module at misipwgen/data/{lang}/syllables_v2.py "
-        "by default; for legacy (v1) a CSV at misipwgen/data/{lang}/syllables.csv."
+        "by default; for legacy (v1) a CSV at misipwgen/data/{lang}/syllables.csv. "
+        "With --format binary the extension is .bin."
     ))
     p.add_argument("--alpha", type=float, default=0.7, help="Power transform exponent (0<alpha<=1)")
     p.add_argument("--k", type=float, default=1.0, help="Additive smoothing constant (>=0)")
     p.add_argument("--min-count", type=int, default=3, help="Minimum raw count to include a syllable")
     p.add_argument("--schema", choices=["v1", "v2"], default="v2", help="Output schema version")
+    p.add_argument("--format", choices=["text", "binary"], default="text", help=(
+        "text: Python module (v2) or CSV (v1); binary: memory-mappable .bin file (see misipwgen.binary)"
+    ))
     return p.parse_args()
 
 
@@ -153,37 +159,58 @@ def _is_open_syllable_es(s: str) -> bool:
     return onset in allowed_onsets
 
 
+def legacy_rows(
+    start: Dict[str, int], middle: Dict[str, int], *, k: float, alpha: float
+) -> List[Tuple[int, int, List[str]]]:
+    """Rows `(starting, weight, sequence)` of the legacy schema, in CSV order."""
+    rows: List[Tuple[int, int, List[str]]] = []
+
+    # One-letter vowels (nucleus-only) based on presence in data
+    vowels = set([s for s in list(start.keys()) + list(middle.keys()) if len(s) == 1])
+    if vowels:
+        w = weight_transform(sum(start.get(v, 0) + middle.get(v, 0) for v in vowels), k, alpha)
+        rows.append((1, w, ["".join(sorted(vowels))]))
+
+    # Two+ letters: merge start and middle counts (legacy format has single weight)
+    all_sylls = set(start) | set(middle)
+    others: List[Tuple[Tuple[int, int, str], Tuple[int, int, List[str]]]] = []
+    for syl in all_sylls:
+        if len(syl) < 1:
+            continue
+        total = start.get(syl, 0) + middle.get(syl, 0)
+        if total <= 0:
+            continue
+        w = weight_transform(total, k, alpha)
+        seq = to_sequence(syl)
+        starting_flag = 1 if start.get(syl, 0) > 0 else 0
+        line = f"{starting_flag};{w};" + ";".join(seq)
+        others.append(((starting_flag, len(line), line), (starting_flag, w, seq)))
+
+    # Stable sort: longer syllables later to match existing style
+    others.sort(key=lambda x: x[0])
+    return rows + [row for _, row in others]
+
+
 def write_legacy_csv(output_path: str, start: Dict[str, int], middle: Dict[str, int], *, k: float, alpha: float) -> None:
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    rows = legacy_rows(start, middle, k=k, alpha=alpha)
+    # The one-letter vowel row, when present, comes first and is set apart
+    has_vowel_row = any(len(s) == 1 for s in list(start) + list(middle))
     with open(output_path, "w", encoding="utf-8") as out:
         out.write("# schema=1; lang=legacy; generated=" + ts + "\n")
         out.write("# starting;weight;sequence1[;sequence2;...;sequenceN]\n\n")
+        for i, (starting_flag, w, seq) in enumerate(rows):
+            out.write(f"{starting_flag};{w};" + ";".join(seq) + "\n")
+            if i == 0 and has_vowel_row:
+                out.write("\n")
+
 
-        # One-letter vowels (nucleus-only) based on presence in data
-        vowels = set([s for s in list(start.keys()) + list(middle.keys()) if len(s) == 1])
-        if vowels:
-            w = weight_transform(sum(start.get(v, 0) + middle.get(v, 0) for v in vowels), k, alpha)
-            out.write(f"1;{w};" + "".join(sorted(vowels)) + "\n\n")
-
-        # Two+ letters: merge start and middle counts (legacy format has single weight)
-        all_sylls = set(start) | set(middle)
-        rows: List[Tuple[int, str]] = []
-        for syl in all_sylls:
-            if len(syl) < 1:
-                continue
-            total = start.get(syl, 0) + middle.get(syl, 0)
-            if total <= 0:
-                continue
-            w = weight_transform(total, k, alpha)
-            seq = ";".join(to_sequence(syl))
-            starting_flag = 1 if start.get(syl, 0) > 0 else 0
-            rows.append((starting_flag, f"{starting_flag};{w};{seq}"))
-
-        # Stable sort: longer syllables later to match existing style
-        rows.sort(key=lambda x: (x[0], len(x[1]), x[1]))
-        for _, line in rows:
-            out.write(line + "\n")
+def write_legacy_bin(
+    output_path: str, start: Dict[str, int], middle: Dict[str, int], *, k: float, alpha: float
+) -> None:
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    binary.write(output_path, legacy_rows(start, middle, k=k, alpha=alpha), positional=False)
 
 
 def write_v2_py(output_path: str, start: Dict[str, int], middle: Dict[str, int], end: Dict[str, int], *, k: float, alpha: float) -> None:
@@ -193,11 +220,24 @@ def write_v2_py(output_path: str, start: Dict[str, int], middle: Dict[str, int],
     lines.append("# Generated syllables (schema v2)\n")
     lines.append(f"# generated: {ts}\n\n")
     lines.append("SYLLABLES_V2 = [\n")
+    for ws, wm, we, sequence in v2_rows(start, middle, end, alpha=alpha):
+        seq = ", ".join(repr(ch) for ch in sequence)
+        lines.append(f"    ({ws}, {wm}, {we}, [{seq}]),\n")
+
+    lines.append("]\n")
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("".join(lines))
 
+
+def v2_rows(
+    start: Dict[str, int], middle: Dict[str, int], end: Dict[str, int], *, alpha: float
+) -> List[Tuple[int, int, int, List[str]]]:
+    """Rows `(w_start, w_middle, w_end, sequence)` of the v2 schema, zero-weight syllables dropped."""
     all_sylls = set(start) | set(middle) | set(end)
     def w(v):
         return max(0, int(round(math.pow(v + 1.0, alpha)))) if v > 0 else 0
 
+    rows = []
     # Stable sort by length then representation
     for syl in sorted(all_sylls, key=lambda s: (len(s), s)):
         ws = w(start.get(syl, 0))
@@ -205,12 +245,21 @@ def write_v2_py(output_path: str, start: Dict[str, int], middle: Dict[str, int],
         we = w(end.get(syl, 0))
         if ws == 0 and wm == 0 and we == 0:
             continue
-        seq = ", ".join(repr(ch) for ch in to_sequence(syl))
-        lines.append(f"    ({ws}, {wm}, {we}, [{seq}]),\n")
+        rows.append((ws, wm, we, to_sequence(syl)))
+    return rows
 
-    lines.append("]\n")
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("".join(lines))
+
+def write_v2_bin(
+    output_path: str,
+    start: Dict[str, int],
+    middle: Dict[str, int],
+    end: Dict[str, int],
+    *,
+    k: float,
+    alpha: float,
+) -> None:
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    binary.write(output_path, v2_rows(start, middle, end, alpha=alpha), positional=True)
 
 
 def main() -> None:
@@ -223,6 +272,8 @@ def main() -> None:
 
     lang = LanguagePack(code=args.lang, vowels=_default_vowels(args.lang))
     default_name = ("syllables_v2.py" if args.schema == "v2" else "syllables.csv")
+    if args.format == "binary":
+        default_name = os.path.splitext(default_name)[0] + ".bin"
     out_path = args.output or os.path.join("misipwgen", "data", args.lang, default_name)
 
     tokens = read_corpus_tokens(lang, args.corpus)
@@ -273,16 +324,32 @@ def main() -> None:
             "All syllables filtered out by min-count. Lower --min-count or use a larger corpus."
         )
 
-    if args.schema == "v2":
+    if args.format == "binary":
+        if not out_path.endswith(".bin"):
+            out_path = os.path.splitext(out_path)[0] + ".bin"
+        if args.schema == "v2":
+            write_v2_bin(out_path, start, middle, end, k=args.k, alpha=args.alpha)
+            kept = len(set(start) | set(middle) | set(end))
+        else:
+            write_legacy_bin(out_path, start, middle, k=args.k, alpha=args.alpha)
+            kept = len(set(start) | set(middle))
+    elif args.schema == "v2":
         # Ensure .py extension for module output
         if not out_path.endswith(".py"):
             out_path = os.path.splitext(out_path)[0] + ".py"
         write_v2_py(out_path, start, middle, end, k=args.k, alpha=args.alpha)
+        # The generator loads the sibling .bin first (faster start-up): keep it in sync
+        write_v2_bin(
+            os.path.splitext(out_path)[0] + ".bin", start, middle, end, k=args.k, alpha=args.alpha
+        )
         kept = len(set(start) | set(middle) | set(end))
     else:
         write_legacy_csv(out_path, start, middle, k=args.k, alpha=args.alpha)
         kept = len(set(start) | set(middle))
-    print(f"Wrote syllables to {out_path} (raw={total_raw}, kept={kept}, schema={args.schema})")
+    print(
+        f"Wrote syllables to {out_path} "
+        f"(raw={total_raw}, kept={kept}, schema={args.schema}, format={args.format})"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+from array import array
+from collections import Counter
+from random import Random
+from unittest import TestCase
+
+from misipwgen.alias import AliasTable
+
+
+class AliasTableTestCase(TestCase):
+    def _exhaustive_counts(self, table):
+        # Feed every possible random integer once: counts must match weights exactly
+        counts = Counter(table.sample(lambda start, stop, u=u: u) for u in range(table.span))
+        columns = table.span // table.total
+        return {index: count / columns for index, count in counts.items()}
+
+    def test_exact_distribution(self):
+        table = AliasTable([10, 20, 15, 1])
+        counts = self._exhaustive_counts(table)
+        self.assertEqual(counts, {0: 10, 1: 20, 2: 15, 3: 1})
+
+    def test_zero_weights_are_never_drawn(self):
+        table = AliasTable([0, 3, 0, 5, -2])
+        counts = self._exhaustive_counts(table)
+        self.assertEqual(set(counts), {1, 3})
+        self.assertEqual(counts[1] * 5, counts[3] * 3)
+
+    def test_custom_indices(self):
+        table = AliasTable([2, 0, 6], indices=[7, 8, 9])
+        self.assertEqual(table.indices, [7, 9])
+        self.assertEqual(table.total, 8)
+        counts = self._exhaustive_counts(table)
+        self.assertEqual(counts, {7: 2, 9: 6})
+
+    def test_span_close_to_power_of_two(self):
+        table = AliasTable([5, 7, 11])
+        bits = table.span.bit_length()
+        self.assertGreaterEqual(table.span, (1 << bits) - table.total)
+        self.assertEqual(table.span % table.total, 0)
+
+    def test_single_entry(self):
+        table = AliasTable([4])
+        self.assertEqual(table.sample(), 0)
+
+    def test_empty_raises(self):
+        table = AliasTable([0, 0])
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.total, 0)
+        with self.assertRaises(ValueError) as ctx:
+            table.sample()
+        self.assertIn("Empty alias table", str(ctx.exception))
+
+
+class _FeedRandom:
+    """Fake RNG whose randbytes returns 64-bit words carrying the given values in their top bits."""
+
+    def __init__(self, values, bits):
+        self.values = list(values)
+        self.shift = 64 - bits
+
+    def randbytes(self, n):
+        words, self.values = self.values[: n // 8], self.values[n // 8 :]
+        return array("Q", [v << self.shift for v in words]).tobytes()
+
+
+class AliasTableSampleManyTestCase(TestCase):
+    def test_block_draws_match_lookup(self):
+        table = AliasTable([3, 1, 4])
+        bits = table.span.bit_length()
+        # First word is out of span and must be rejected and redrawn
+        rng = _FeedRandom([table.span] + list(range(table.span)), bits)
+
+        drawn = table.sample_many(table.span, rng)
+
+        self.assertEqual(drawn, [table.lookup(u) for u in range(table.span)])
+
+    def test_counts_and_seeded_determinism(self):
+        table = AliasTable([3, 1, 4])
+
+        first = table.sample_many(500, Random(7))
+        second = table.sample_many(500, Random(7))
+
+        self.assertEqual(len(first), 500)
+        self.assertEqual(first, second)
+        self.assertTrue(set(first) <= {0, 1, 2})
+
+    def test_empty_raises(self):
+        with self.assertRaises(ValueError):
+            AliasTable([]).sample_many(3)
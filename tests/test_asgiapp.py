@@ -0,0 +1,125 @@
+import asyncio
+import json
+from unittest import TestCase, mock
+
+import asgiapp
+from misipwgen import webapi
+
+
+def call(app, method, path, body=b"", chunk=None):
+    """Run one HTTP request through the ASGI app; return (status, headers, body chunks)."""
+    chunk = chunk or len(body) or 1
+    parts = [body[i : i + chunk] for i in range(0, len(body), chunk)] or [b""]
+    messages = [
+        {"type": "http.request", "body": part, "more_body": i < len(parts) - 1}
+        for i, part in enumerate(parts)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    asyncio.run(app(scope, receive, send))
+    start, *bodies = sent
+    return start["status"], dict(start["headers"]), [m["body"] for m in bodies]
+
+
+def post(app, path, data, **kwargs):
+    return call(app, "POST", path, json.dumps(data).encode(), **kwargs)
+
+
+class AsgiAppTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = asgiapp.create_app(["it"], max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.executor.shutdown()
+
+    def test_word(self):
+        status, headers, body = post(self.app, "/api/generate/word", {"length": 9}, chunk=5)
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"application/json")
+        result = json.loads(b"".join(body))
+        self.assertEqual(result["type"], "word")
+        self.assertEqual(len(result["result"]), 9)
+
+    def test_readyz(self):
+        post(self.app, "/api/generate/word", {})
+        status, _, body = call(self.app, "GET", "/readyz")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(b"".join(body)), {"status": "ready", "languages": ["it"]})
+
+    def test_errors(self):
+        status, _, body = post(self.app, "/api/generate/sentence", {"language": "es"})
+        self.assertEqual((status, json.loads(body[0])), (400, {"error": "Language must be 'it'"}))
+        self.assertEqual(call(self.app, "POST", "/api/generate/word", b"[1]")[0], 400)
+        self.assertEqual(call(self.app, "POST", "/api/generate/word", b"{")[0], 400)
+        big = b" " * (asgiapp.MAX_BODY + 1)
+        self.assertEqual(call(self.app, "POST", "/api/generate/word", big, chunk=4096)[0], 413)
+        self.assertEqual(call(self.app, "GET", "/api/generate/word")[0], 405)
+        self.assertEqual(call(self.app, "GET", "/nope")[0], 404)
+
+    def test_batch_streams_chunks(self):
+        count = webapi.BATCH_CHUNK + 5
+        status, headers, body = post(
+            self.app, "/api/generate/batch", {"count": count, "length": 6, "format": "text"}
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"text/plain; charset=utf-8")
+        self.assertEqual(len(body), 3)  # two chunks and the final empty message
+        lines = b"".join(body).decode().splitlines()
+        self.assertEqual(len(lines), count)
+        self.assertTrue(all(len(line) == 6 for line in lines))
+
+        status, _, body = post(self.app, "/api/generate/batch", {"count": 0})
+        self.assertEqual(status, 400)
+
+    def test_metrics(self):
+        post(self.app, "/api/generate/sentence", {"total_length": 20})
+        status, headers, body = call(self.app, "GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertTrue(headers[b"content-type"].startswith(b"text/plain; version=0.0.4"))
+        text = b"".join(body).decode()
+        self.assertIn(
+            'misipwgen_requests_total{endpoint="sentence",language="it",status="200"} 1\n', text
+        )
+
+    def test_lifespan_warms_registry(self):
+        app = asgiapp.create_app(["it"], max_workers=1)
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+            if message["type"] == "lifespan.startup.complete":
+                self.assertTrue(app.registry.ready.is_set())
+
+        asyncio.run(app({"type": "lifespan"}, receive, send))
+        self.assertEqual(sent, ["lifespan.startup.complete", "lifespan.shutdown.complete"])
+
+    def test_failed_warm_is_retried(self):
+        app = asgiapp.create_app(["it"], max_workers=1)
+        self.addCleanup(app.executor.shutdown)
+        warm = app.registry.warm
+        app.registry.warm = mock.Mock(side_effect=[RuntimeError("boom"), None])
+
+        async def scenario():
+            failed = app.warm()  # started by a request, never awaited
+            await asyncio.wait([failed])
+            self.assertIsInstance(failed.exception(), RuntimeError)
+            self.assertIsNone(app._warming)
+            app.registry.warm.side_effect = warm
+            await app.warm()
+
+        asyncio.run(scenario())
+        self.assertEqual(app.registry.warm.call_count, 2)
+        self.assertTrue(app.registry.ready.is_set())
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from benchmarks.runner import compare, run, timed
+
+
+class CompareTestCase(TestCase):
+    def test_statuses(self):
+        baseline = {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}, "c": {"seconds": 1.0}}
+        results = {
+            "a": {"seconds": 1.3},
+            "b": {"seconds": 0.7},
+            "c": {"seconds": 1.1},
+            "d": {"seconds": 1.0},
+        }
+
+        rows = {row["name"]: row for row in compare(results, baseline, 0.2)}
+
+        self.assertEqual(rows["a"]["status"], "regression")
+        self.assertEqual(rows["b"]["status"], "speedup")
+        self.assertEqual(rows["c"]["status"], "ok")
+        self.assertEqual(rows["d"]["status"], "new")
+        self.assertAlmostEqual(rows["a"]["ratio"], 1.3)
+        self.assertIsNone(rows["d"]["baseline"])
+
+
+class RunTestCase(TestCase):
+    def test_timed_counts_calls(self):
+        calls = []
+        setups = []
+
+        result = timed(lambda: calls.append(1), 4, 2, setup=lambda: setups.append(1))
+
+        # One untimed warm-up call, then `number` calls per repeat
+        self.assertEqual(len(calls), 9)
+        self.assertEqual(len(setups), 9)
+        self.assertLessEqual(result["best"], result["seconds"])
+
+    def test_run_filters_cases(self):
+        results = run(["generate"], quick=True, pattern="v2.len4")
+
+        self.assertEqual(list(results), ["generate.v2.len4"])
+        self.assertGreater(results["generate.v2.len4"]["seconds"], 0)
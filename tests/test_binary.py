@@ -0,0 +1,102 @@
+import os
+import tempfile
+from random import Random
+from unittest import TestCase, mock
+
+from misipwgen import binary
+from misipwgen.generator_v2 import CompactSyllableCollectionV2, MisiPwGenV2
+from misipwgen.misipwgen import MisiPwGen
+from tests.fixtures.test_syllables_v2 import SYLLABLES_V2
+
+
+class BinaryFormatTestCase(TestCase):
+    def test_positional_round_trip(self):
+        data = binary.parse(binary.dumps(SYLLABLES_V2, positional=True))
+        expected = CompactSyllableCollectionV2.from_rows(SYLLABLES_V2)
+
+        self.assertTrue(data.positional)
+        self.assertEqual(len(data), len(SYLLABLES_V2))
+        self.assertEqual(list(data.weights[0]), list(expected.w_start))
+        self.assertEqual(list(data.weights[2]), list(expected.w_end))
+        self.assertEqual(list(data.lengths), list(expected.lengths))
+        self.assertEqual(
+            [data.columns(i) for i in range(len(data))], [expected.sequence(i) for i in range(len(data))]
+        )
+
+    def test_legacy_round_trip(self):
+        rows = [(1, 7, ["aeiou"]), (0, 2, ["t", "r", "aeiou"]), (1, 5, ["b", "à"]), (0, -1, ["c", "a"])]
+        data = binary.parse(binary.dumps(rows, positional=False))
+
+        self.assertFalse(data.positional)
+        self.assertEqual(list(data.weights[0]), [7, 5, 0, 2])
+        self.assertEqual(
+            [data.columns(i) for i in range(4)],
+            [("aeiou",), ("b", "à"), ("c", "a"), ("t", "r", "aeiou")],
+        )
+        self.assertEqual([bool(k & binary.STARTING) for k in data.kinds], [True, True, False, False])
+        self.assertEqual([bool(k & binary.MULTI_CHOICE) for k in data.kinds], [True, False, False, True])
+
+    def test_columns_are_views_of_the_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "s.bin")
+            binary.write(path, SYLLABLES_V2, positional=True)
+            data = binary.read(path)
+
+            self.assertIsInstance(data.weights[0], memoryview)
+            self.assertEqual(os.listdir(td), ["s.bin"])
+            del data
+
+    def test_big_endian_host(self):
+        with mock.patch.object(binary.sys, "byteorder", "big"):
+            data = binary.parse(binary.dumps(SYLLABLES_V2, positional=True))
+
+        self.assertNotIsInstance(data.weights[0], memoryview)
+        self.assertEqual(sorted(data.weights[1]), sorted(row[1] for row in SYLLABLES_V2))
+
+    def test_invalid_data(self):
+        good = binary.dumps(SYLLABLES_V2, positional=True)
+        for blob, message in [
+            (b"", "Truncated"),
+            (b"XXXX" + good[4:], "Not a misipwgen"),
+            (good[:4] + b"\x09\x00" + good[6:], "version 9"),
+            (good[:-3], "Truncated"),
+            (good[:40], "Truncated"),
+        ]:
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(binary.BinaryFormatError, message):
+                    binary.parse(blob)
+
+
+class BinaryGeneratorsTestCase(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_v2_generator_matches_module(self):
+        path = os.path.join(self.tmp.name, "syllables_v2.bin")
+        binary.write(path, SYLLABLES_V2, positional=True)
+
+        from_module = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2", rng=Random(8))
+        from_binary = MisiPwGenV2(syllables_path=path, rng=Random(8))
+
+        self.assertEqual(from_binary.syllables.columns, from_module.syllables.columns)
+        self.assertEqual(from_binary.texts, from_module.texts)
+        self.assertEqual(from_binary.generate_many(6, 50), from_module.generate_many(6, 50))
+
+    def test_legacy_generator_reads_binary(self):
+        rows = [(1, 5, ["b", "ae"]), (1, 5, ["c", "io"]), (1, 5, ["d", "ua"]), (1, 5, ["f", "ai"])]
+        path = os.path.join(self.tmp.name, "syllables.bin")
+        binary.write(path, rows, positional=False)
+
+        from_csv = MisiPwGen.from_csv("tests/fixtures/syllables2.csv", rng=Random(1))
+        from_binary = MisiPwGen.from_csv(path, rng=Random(1))
+
+        self.assertEqual([str(s) for s in from_binary.syllables], [str(s) for s in from_csv.syllables])
+        self.assertEqual(from_binary.generate_many(4, 30), from_csv.generate_many(4, 30))
+
+    def test_kind_mismatch(self):
+        path = os.path.join(self.tmp.name, "syllables.bin")
+        binary.write(path, [(1, 5, ["b", "a"])], positional=False)
+
+        with self.assertRaises(ValueError):
+            MisiPwGenV2(syllables_path=path)
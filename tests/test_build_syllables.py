@@ -7,6 +7,7 @@ import types
 import gzip
 import bz2
 import unittest
+import unittest.mock
 
 
 def load_build_module() -> types.ModuleType:
@@ -130,6 +131,8 @@ class BuildSyllablesTests(unittest.TestCase):
             finally:
                 sys.argv = old_argv
             self.assertTrue(os.path.exists(out + ".py"))
+            # Sibling binary data, loaded first by the generator
+            self.assertTrue(os.path.exists(out + ".bin"))
 
     def test_main_end_to_end_v1_it(self):
         text = "ciao mondo bella casa prato strada"
@@ -163,6 +166,30 @@ class BuildSyllablesTests(unittest.TestCase):
                 sys.argv = old_argv
             self.assertTrue(os.path.exists(out))
 
+    def test_main_binary_output(self):
+        from misipwgen import binary
+
+        text = "ciao mondo bella casa prato strada"
+        with tempfile.TemporaryDirectory() as td:
+            corpus = os.path.join(td, "corpus.txt")
+            with open(corpus, "w", encoding="utf-8") as f:
+                f.write(text)
+            for schema, positional in (("v2", True), ("v1", False)):
+                with self.subTest(schema=schema):
+                    out = os.path.join(td, f"syllables_{schema}")  # script adds .bin
+                    argv = ["build_syllables", "--lang", "it", "--corpus", corpus, "--output", out]
+                    argv += ["--schema", schema, "--format", "binary", "--min-count", "1"]
+                    old_argv = sys.argv[:]
+                    try:
+                        sys.argv = argv
+                        with unittest.mock.patch("sys.stdout", new_callable=io.StringIO):
+                            self.mod.main()
+                    finally:
+                        sys.argv = old_argv
+                    data = binary.read(out + ".bin")
+                    self.assertEqual(data.positional, positional)
+                    self.assertGreater(len(data), 0)
+
     def test_main_errors(self):
         # Empty corpus -> no tokens
         with tempfile.TemporaryDirectory() as td:
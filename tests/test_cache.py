@@ -0,0 +1,192 @@
+import os
+import tempfile
+from random import Random
+from unittest import TestCase, mock, skipIf
+
+from misipwgen import cache_info, clear_cache, set_cache_limit
+from misipwgen.cache import CACHE_DIR_ENV, TABLES, TableCache, compiled_cache_dir, load_compiled
+from misipwgen.generator_v2 import MisiPwGenV2
+from misipwgen.misipwgen import MisiPwGen
+
+
+class TableCacheTestCase(TestCase):
+    def test_builds_once(self):
+        cache = TableCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return object()
+
+        first = cache.get("a", build)
+        second = cache.get("a", build)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_lru_eviction(self):
+        cache = TableCache(maxsize=2)
+        cache.get("a", object)
+        cache.get("b", object)
+        cache.get("a", object)  # refresh "a"
+        cache.get("c", object)
+
+        self.assertEqual(cache.info()["keys"], ["a", "c"])
+
+    def test_shrinking_maxsize_evicts(self):
+        cache = TableCache()
+        for key in "abc":
+            cache.get(key, object)
+
+        cache.maxsize = 1
+
+        self.assertEqual(cache.info()["keys"], ["c"])
+        with self.assertRaises(ValueError):
+            cache.maxsize = 0
+
+    def test_failed_build_is_not_cached(self):
+        cache = TableCache()
+
+        def fail():
+            raise ImportError("boom")
+
+        with self.assertRaises(ImportError):
+            cache.get("a", fail)
+        self.assertEqual(cache.info()["size"], 0)
+
+    def test_clear(self):
+        cache = TableCache()
+        cache.get("a", object)
+        cache.clear()
+        self.assertEqual(cache.info()["size"], 0)
+
+
+class GeneratorCacheTestCase(TestCase):
+    def setUp(self):
+        clear_cache()
+        self.addCleanup(set_cache_limit, None)
+        self.addCleanup(clear_cache)
+
+    def test_v2_generators_share_tables(self):
+        gen1 = MisiPwGenV2.from_language("it", rng=Random(1))
+        gen2 = MisiPwGenV2.from_language("it", rng=Random(2))
+
+        self.assertIs(gen1.tables, gen2.tables)
+        self.assertIs(gen1.syllables, gen2.syllables)
+        self.assertIsNot(gen1.rng, gen2.rng)
+        self.assertEqual(cache_info()["misses"], 1)
+
+    def test_legacy_generators_share_tables(self):
+        gen1 = MisiPwGen.from_language("it")
+        gen2 = MisiPwGen.from_language("it")
+        gen3 = MisiPwGen.from_csv("tests/fixtures/syllables2.csv")
+        gen4 = MisiPwGen.from_csv("tests/fixtures/syllables2.csv")
+
+        self.assertIs(gen1.tables, gen2.tables)
+        self.assertIs(gen3.tables, gen4.tables)
+        self.assertIsNot(gen1.tables, gen3.tables)
+
+    def test_clear_cache_reloads(self):
+        gen1 = MisiPwGenV2.from_language("it")
+        clear_cache()
+        gen2 = MisiPwGenV2.from_language("it")
+
+        self.assertIsNot(gen1.tables, gen2.tables)
+        self.assertEqual(len(gen1.generate(8)), 8)
+
+    def test_cache_limit(self):
+        set_cache_limit(1)
+        MisiPwGenV2.from_language("it")
+        MisiPwGenV2.from_language("es")
+
+        (key,) = TABLES.info()["keys"]
+        self.assertTrue(key[1].endswith(os.path.join("es", "syllables_v2.bin")))
+
+
+class CompiledCacheTestCase(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.env = mock.patch.dict(os.environ, {CACHE_DIR_ENV: self.tmp.name})
+        self.env.start()
+        self.addCleanup(self.env.stop)
+        self.calls = []
+
+    def build(self):
+        self.calls.append(1)
+        return {"value": len(self.calls)}
+
+    def test_reuses_file(self):
+        first = load_compiled("t", b"data", self.build)
+        second = load_compiled("t", b"data", self.build)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)  # no temporary files left
+
+    def test_keyed_by_content(self):
+        load_compiled("t", b"data", self.build)
+        load_compiled("t", b"other", self.build)
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_keyed_by_version(self):
+        load_compiled("t", b"data", self.build)
+        with mock.patch("misipwgen.__version__", "0.0.0-test"):
+            load_compiled("t", b"data", self.build)
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_corrupt_file_is_rebuilt(self):
+        load_compiled("t", b"data", self.build)
+        (name,) = os.listdir(self.tmp.name)
+        with open(os.path.join(self.tmp.name, name), "wb") as f:
+            f.write(b"not a pickle")
+
+        self.assertEqual(load_compiled("t", b"data", self.build), {"value": 2})
+        self.assertEqual(load_compiled("t", b"data", self.build), {"value": 2})
+
+    def test_unwritable_directory(self):
+        blocker = os.path.join(self.tmp.name, "file")
+        with open(blocker, "w"):
+            pass
+        with mock.patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(blocker, "cache")}):
+            self.assertEqual(load_compiled("t", b"data", self.build), {"value": 1})
+            self.assertEqual(load_compiled("t", b"data", self.build), {"value": 2})
+
+    def test_disabled(self):
+        with mock.patch.dict(os.environ, {CACHE_DIR_ENV: ""}):
+            self.assertIsNone(compiled_cache_dir())
+            load_compiled("t", b"data", self.build)
+            load_compiled("t", b"data", self.build)
+
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_legacy_tables_use_compiled_file(self):
+        clear_cache()
+        self.addCleanup(clear_cache)
+        first = MisiPwGen.from_csv("tests/fixtures/syllables2.csv")
+        clear_cache()
+        with mock.patch("misipwgen.misipwgen.SyllablesLoader.load", side_effect=AssertionError):
+            second = MisiPwGen.from_csv("tests/fixtures/syllables2.csv")
+
+        self.assertIsNot(second.tables, first.tables)
+        self.assertEqual([str(s) for s in second.syllables], [str(s) for s in first.syllables])
+        self.assertEqual(second.cumulative.cumulative, first.cumulative.cumulative)
+        self.assertEqual(len(second.generate(4)), 4)
+
+
+@skipIf(CACHE_DIR_ENV in os.environ, f"{CACHE_DIR_ENV} is set")
+class CompiledCacheDefaultTestCase(TestCase):
+    def test_off_by_default(self):
+        calls = []
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp}):
+                self.assertIsNone(compiled_cache_dir())
+                load_compiled("t", b"data", lambda: calls.append(1))
+                load_compiled("t", b"data", lambda: calls.append(1))
+            self.assertEqual(os.listdir(tmp), [])
+
+        self.assertEqual(len(calls), 2)
@@ -0,0 +1,96 @@
+from collections import Counter
+from itertools import product
+from unittest import TestCase, mock, skipUnless
+
+from misipwgen.engines import numpy as numpy_engine
+from misipwgen.generator_v2 import MisiPwGenV2
+
+
+@skipUnless(numpy_engine.AVAILABLE, "numpy not installed")
+class NumpyEngineTestCase(TestCase):
+    def test_generate_many_lengths(self):
+        engine = numpy_engine.NumpyEngine(MisiPwGenV2(lang="it"), seed=1)
+
+        words = engine.generate_many(9, 1000)
+
+        self.assertEqual(len(words), 1000)
+        self.assertTrue(all(len(w) == 9 and w.isalpha() for w in words))
+
+    def test_small_batches(self):
+        engine = numpy_engine.NumpyEngine(MisiPwGenV2(lang="es"), seed=1)
+
+        words = engine.generate_many(5, 25, batch_size=7)
+
+        self.assertEqual(len(words), 25)
+        self.assertTrue(all(len(w) == 5 for w in words))
+
+    def test_multi_choice_columns(self):
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+        renderings = {"".join(p) for s in gen.syllables for p in product(*s.sequence)}
+        engine = numpy_engine.NumpyEngine(gen, seed=2)
+
+        for word in engine.generate_many(4, 200):
+            self.assertIn(word[:2], renderings)
+            self.assertIn(word[2:], renderings)
+
+    def test_end_distribution_matches_weights(self):
+        # Two-letter words are a single end-weighted draw among two-letter syllables
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+        engine = numpy_engine.NumpyEngine(gen, seed=3)
+        table = gen.plans[True][2]
+        expected = {"".join(gen.syllables[i].sequence): w for i, w in zip(table.indices, table.weights)}
+
+        counts = Counter(engine.generate_many(2, 40000))
+
+        for word, weight in expected.items():
+            with self.subTest(word=word):
+                self.assertAlmostEqual(counts[word] / 40000, weight / table.total, delta=0.01)
+
+    def test_seeded_generator_is_reproducible(self):
+        from random import Random
+
+        words1 = numpy_engine.NumpyEngine(MisiPwGenV2(lang="it", rng=Random(4))).generate_many(6, 20)
+        words2 = numpy_engine.NumpyEngine(MisiPwGenV2(lang="it", rng=Random(4))).generate_many(6, 20)
+        self.assertEqual(words1, words2)
+
+    def test_seeded_from_thread_rng(self):
+        from random import Random
+
+        words1 = numpy_engine.NumpyEngine(MisiPwGenV2(lang="it", rng_factory=lambda: Random(5)))
+        words2 = numpy_engine.NumpyEngine(MisiPwGenV2(lang="it", rng_factory=lambda: Random(5)))
+        self.assertEqual(words1.generate_many(6, 20), words2.generate_many(6, 20))
+
+    def test_refuses_system_random(self):
+        from random import SystemRandom
+
+        from misipwgen.secure import BufferedSystemRandom
+
+        for gen in (
+            MisiPwGenV2(lang="it", rng=SystemRandom()),
+            MisiPwGenV2(lang="it", rng_factory=BufferedSystemRandom),
+        ):
+            with self.assertRaises(ValueError):
+                numpy_engine.NumpyEngine(gen)
+            self.assertIs(numpy_engine.get_engine(gen), gen)
+            self.assertEqual(len(numpy_engine.generate_many(gen, 6, 3)), 3)
+
+    def test_edge_counts(self):
+        engine = numpy_engine.NumpyEngine(MisiPwGenV2(lang="it"))
+
+        self.assertEqual(engine.generate_many(8, 0), [])
+        self.assertEqual(engine.generate_many(0, 2), ["", ""])
+        with self.assertRaises(ValueError):
+            engine.generate_many(8, -1)
+
+
+class NumpyFallbackTestCase(TestCase):
+    def test_get_engine_without_numpy(self):
+        gen = MisiPwGenV2(lang="it")
+        with mock.patch.object(numpy_engine, "np", None):
+            self.assertIs(numpy_engine.get_engine(gen), gen)
+            words = numpy_engine.generate_many(gen, 6, 10)
+            with self.assertRaises(ImportError):
+                numpy_engine.NumpyEngine(gen)
+
+        self.assertEqual(len(words), 10)
+        self.assertTrue(all(len(w) == 6 for w in words))
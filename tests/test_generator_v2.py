@@ -1,11 +1,14 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 from unittest.mock import Mock
 
 from misipwgen.generator_v2 import (
     SyllableV2,
     SyllableCollectionV2,
+    CompactSyllableCollectionV2,
+    SyllableViewV2,
     SyllablesLoaderV2Py,
     CumulativeV2,
+    AliasV2,
     MisiPwGenV2,
     GenerationError,
 )
@@ -36,6 +39,25 @@ class SyllableV2TestCase(TestCase):
             self.assertIn(result[0], "bcd")
             self.assertIn(result[1], "aei")
 
+    def test_prerendered_text(self):
+        s = SyllableV2(w_start=1, w_middle=2, w_end=3, sequence=["b", "a"])
+
+        self.assertEqual(s.text, "ba")
+        self.assertEqual(s.variants, ("ba",))
+        self.assertIs(s.random(), s.text)
+
+    def test_variants_for_multi_choice_columns(self):
+        s = SyllableV2(w_start=1, w_middle=2, w_end=3, sequence=["bc", "a", "eo"])
+
+        self.assertIsNone(s.text)
+        self.assertEqual(s.variants, ("bae", "bao", "cae", "cao"))
+        for _ in range(20):
+            self.assertIn(s.random(), s.variants)
+
+    def test_render_tables_do_not_affect_equality(self):
+        self.assertEqual(SyllableV2(1, 2, 3, ["b", "a"]), SyllableV2(1, 2, 3, ["b", "a"]))
+        self.assertNotIn("text", repr(SyllableV2(1, 2, 3, ["b", "a"])))
+
 
 class SyllableCollectionV2TestCase(TestCase):
     def test_finalize_sorts_by_length_and_str(self):
@@ -97,6 +119,80 @@ class SyllableCollectionV2TestCase(TestCase):
         self.assertEqual(coll.last_index(10), 2)  # > max -> return max
 
 
+class CompactSyllableCollectionV2TestCase(TestCase):
+    ROWS = [
+        (1, 2, 3, ["c", "a", "t"]),
+        (4, -5, 6, ["b", "a"]),
+        (7, 8, 9, ["d", "o", "g"]),
+        (1, 0, 2, ["a"]),
+        (0, 3, 0, ["str", "aio"]),
+    ]
+
+    def test_same_order_as_finalize(self):
+        coll = SyllableCollectionV2()
+        for ws, wm, we, seq in self.ROWS:
+            coll.append(SyllableV2(ws, wm, we, seq))
+        coll.finalize()
+
+        compact = CompactSyllableCollectionV2.from_rows(self.ROWS)
+
+        self.assertEqual([str(s) for s in compact], [str(s) for s in coll])
+        self.assertEqual(compact.last_syllable_by_length, coll.last_syllable_by_length)
+        self.assertEqual(compact.max_syllable_length, coll.max_syllable_length)
+        self.assertEqual(compact.last_index(10), coll.last_index(10))
+
+    def test_columns_and_pool(self):
+        compact = CompactSyllableCollectionV2.from_rows(self.ROWS)
+
+        self.assertEqual(compact.w_start.typecode, "I")
+        self.assertEqual(compact.lengths.typecode, "B")
+        self.assertEqual(list(compact.lengths), [1, 2, 2, 3, 3])
+        self.assertEqual(list(compact.w_middle), [0, 0, 3, 2, 8])  # negative stored as 0
+        self.assertEqual(compact.pool, "abacatdog")
+        self.assertEqual(compact.texts(), ["a", "ba", None, "cat", "dog"])
+
+    def test_views(self):
+        compact = CompactSyllableCollectionV2.from_rows(self.ROWS)
+
+        view = compact[1]
+        self.assertIsInstance(view, SyllableViewV2)
+        self.assertEqual((view.w_start, view.w_middle, view.w_end), (4, 0, 6))
+        self.assertEqual(view.sequence, ["b", "a"])
+        self.assertEqual(view.length(), 2)
+        self.assertEqual(view.random(), "ba")
+        self.assertEqual(str(compact[-1]), "d-o-g")
+        with self.assertRaises(IndexError):
+            compact[5]
+
+    def test_multi_choice_view(self):
+        compact = CompactSyllableCollectionV2.from_rows(self.ROWS)
+
+        view = compact[2]
+        self.assertIsNone(view.text)
+        self.assertEqual(view.sequence, ["str", "aio"])
+        self.assertEqual(view.variants, ("sa", "si", "so", "ta", "ti", "to", "ra", "ri", "ro"))
+        self.assertIn(view.random(), view.variants)
+
+    def test_from_syllables(self):
+        syllables = [SyllableV2(ws, wm, we, seq) for ws, wm, we, seq in self.ROWS]
+        compact = CompactSyllableCollectionV2.from_syllables(syllables)
+        self.assertEqual(len(compact), 5)
+
+    def test_alias_from_compact_matches_list(self):
+        compact = CompactSyllableCollectionV2.from_rows(self.ROWS)
+        alias = AliasV2(compact)
+        reference = AliasV2(list(compact))
+
+        for which in AliasV2.POSITIONS:
+            for length in range(1, 4):
+                self.assertEqual(
+                    alias.upto(which, length).weights, reference.upto(which, length).weights
+                )
+                self.assertEqual(
+                    alias.exact(which, length).indices, reference.exact(which, length).indices
+                )
+
+
 class SyllablesLoaderV2PyTestCase(TestCase):
     def test_load_from_module(self):
         loader = SyllablesLoaderV2Py("tests.fixtures.test_syllables_v2")
@@ -112,6 +208,14 @@ class SyllablesLoaderV2PyTestCase(TestCase):
         self.assertEqual(first.w_end, 0)
         self.assertEqual(first.sequence, ["b", "a"])
 
+    def test_load_compact(self):
+        loader = SyllablesLoaderV2Py("tests.fixtures.test_syllables_v2")
+
+        compact = loader.load_compact()
+
+        self.assertIsInstance(compact, CompactSyllableCollectionV2)
+        self.assertEqual([str(s) for s in compact], [str(s) for s in loader.load()])
+
     def test_load_custom_symbol(self):
         # Default symbol is SYLLABLES_V2
         loader = SyllablesLoaderV2Py("tests.fixtures.test_syllables_v2", symbol="SYLLABLES_V2")
@@ -212,6 +316,79 @@ class CumulativeV2TestCase(TestCase):
         self.assertEqual(idx, 2)  # 10 + 25 = 35 -> idx 2
 
 
+class AliasV2TestCase(TestCase):
+    def setUp(self):
+        self.syllables = [
+            SyllableV2(w_start=10, w_middle=5, w_end=2, sequence=["a"]),
+            SyllableV2(w_start=20, w_middle=0, w_end=5, sequence=["b", "a"]),
+            SyllableV2(w_start=15, w_middle=8, w_end=3, sequence=["c", "o"]),
+        ]
+
+    def test_upto_covers_shorter_syllables(self):
+        alias = AliasV2(self.syllables)
+
+        self.assertEqual(alias.upto("start", 1).indices, [0])
+        self.assertEqual(alias.upto("start", 2).indices, [0, 1, 2])
+        self.assertEqual(alias.upto("start", 2).total, 45)
+        # Zero weights are excluded from the table
+        self.assertEqual(alias.upto("middle", 2).indices, [0, 2])
+
+    def test_upto_clamps_length(self):
+        alias = AliasV2(self.syllables)
+
+        self.assertIs(alias.upto("end", 0), alias.upto("end", 1))
+        self.assertIs(alias.upto("end", 10), alias.upto("end", 2))
+
+    def test_exact_length(self):
+        alias = AliasV2(self.syllables)
+
+        self.assertEqual(alias.exact("end", 2).indices, [1, 2])
+        self.assertEqual(alias.exact("end", 2).total, 8)
+        self.assertIsNone(alias.exact("end", 0))
+        self.assertIsNone(alias.exact("end", 3))
+
+    def test_plan_prefers_exact_end(self):
+        alias = AliasV2(self.syllables)
+
+        self.assertIs(alias.plan(2, first=True), alias.exact("end", 2))
+        self.assertIs(alias.plan(1, first=False), alias.exact("end", 1))
+        # Nothing ends with 3 letters: fall back to start/middle among all syllables
+        self.assertIs(alias.plan(3, first=True), alias.upto("start", 2))
+        self.assertIs(alias.plan(3, first=False), alias.upto("middle", 2))
+
+    def test_plan_without_candidates(self):
+        alias = AliasV2([SyllableV2(w_start=0, w_middle=0, w_end=0, sequence=["a"])])
+
+        self.assertIsNone(alias.plan(2, first=True))
+
+    def test_compile_plans(self):
+        alias = AliasV2(self.syllables)
+        plans = alias.compile_plans()
+
+        self.assertEqual(len(plans), 2)
+        for first in (False, True):
+            self.assertEqual(len(plans[first]), alias.max_length + 2)
+            self.assertIsNone(plans[first][0])
+            for residual in range(1, alias.max_length + 2):
+                self.assertIs(plans[first][residual], alias.plan(residual, first))
+
+    def test_matches_cumulative_bisect(self):
+        alias = AliasV2(self.syllables)
+        cum = CumulativeV2(self.syllables)
+
+        table = alias.upto("start", 2)
+        counts = {}
+        columns = table.span // table.total
+        for u in range(table.span):
+            idx = table.sample(lambda start, stop, u=u: u)
+            counts[idx] = counts.get(idx, 0) + 1
+        expected = {}
+        for w in range(1, cum.weight_at("start", 2) + 1):
+            idx = cum.invert("start", w)
+            expected[idx] = expected.get(idx, 0) + columns
+        self.assertEqual(counts, expected)
+
+
 class MisiPwGenV2TestCase(TestCase):
     def test_init_with_lang(self):
         gen = MisiPwGenV2(lang="it")
@@ -253,6 +430,30 @@ class MisiPwGenV2TestCase(TestCase):
         self.assertGreater(len(word), 0)
         self.assertLessEqual(len(word), 4)
 
+    def test_generate_without_candidates_raises(self):
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+        gen.plans = ([None, None], [None, None])
+
+        with self.assertRaises(GenerationError):
+            gen.generate(4)
+
+    def test_texts_table(self):
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+
+        self.assertEqual(len(gen.texts), len(gen.syllables))
+        for text, syllable in zip(gen.texts, gen.syllables):
+            self.assertEqual(text, syllable.text)
+        self.assertIn(None, gen.texts)  # fixture has multi-choice columns
+
+    def test_render_syllable_with_rng_picks_variant(self):
+        mock_rng = Mock()
+        mock_rng.randrange = Mock(return_value=1)
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2", rng=mock_rng)
+
+        syllable = SyllableV2(w_start=1, w_middle=0, w_end=0, sequence=["p", "rae"])
+        self.assertEqual(gen._render_syllable(syllable), "pa")
+        mock_rng.randrange.assert_called_once_with(0, 3)
+
     def test_generate_different_lengths(self):
         gen = MisiPwGenV2(lang="it")
 
@@ -261,6 +462,86 @@ class MisiPwGenV2TestCase(TestCase):
                 word = gen.generate(length)
                 self.assertEqual(len(word), length)
 
+    def test_generate_many(self):
+        gen = MisiPwGenV2(lang="it")
+
+        words = gen.generate_many(9, 200)
+
+        self.assertEqual(len(words), 200)
+        self.assertTrue(all(len(w) == 9 and w.isalpha() for w in words))
+
+    def test_generate_many_uses_fixture_syllables(self):
+        from itertools import product
+
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+        renderings = {"".join(p) for s in gen.syllables for p in product(*s.sequence)}
+
+        for word in gen.generate_many(4, 100):
+            self.assertEqual(len(word), 4)
+            self.assertIn(word[:2], renderings)
+            self.assertIn(word[2:], renderings)
+
+    def test_generate_many_with_seeded_rng(self):
+        from random import Random
+
+        words1 = MisiPwGenV2(lang="it", rng=Random(3)).generate_many(7, 50)
+        words2 = MisiPwGenV2(lang="it", rng=Random(3)).generate_many(7, 50)
+        self.assertEqual(words1, words2)
+
+    def test_generate_many_edge_counts(self):
+        gen = MisiPwGenV2(lang="it")
+
+        self.assertEqual(gen.generate_many(8, 0), [])
+        self.assertEqual(gen.generate_many(0, 3), ["", "", ""])
+        with self.assertRaises(ValueError):
+            gen.generate_many(8, -1)
+
+    def test_choice_entropy_bits_single_syllable(self):
+        from math import log2
+
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+
+        # Length 2 words are one end-weighted syllable: de, fi, gu, la, no
+        weights = [15, 2, 8, 5, 10]
+        expected = -sum(w / 40 * log2(w / 40) for w in weights)
+        self.assertAlmostEqual(gen.choice_entropy_bits(2), expected)
+        self.assertEqual(gen.choice_entropy_bits(0), 0.0)
+
+    def test_choice_entropy_bits_matches_enumeration(self):
+        from math import log2
+
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+
+        def derivations(residual, first, p):
+            table = gen.plans[first][min(residual, len(gen.plans[first]) - 1)]
+            for index, weight in zip(table.indices, table.weights):
+                variants = gen.syllables[index].variants
+                for text in variants:
+                    q = p * weight / table.total / len(variants)
+                    if residual == len(text):
+                        yield q
+                    else:
+                        yield from derivations(residual - len(text), False, q)
+
+        for n in (4, 6):
+            with self.subTest(n=n):
+                expected = -sum(q * log2(q) for q in derivations(n, True, 1.0))
+                self.assertAlmostEqual(gen.choice_entropy_bits(n), expected)
+
+    def test_choice_entropy_bits_unreachable_length_raises(self):
+        gen = MisiPwGenV2(syllables_path="tests.fixtures.test_syllables_v2")
+
+        with self.assertRaises(GenerationError):
+            gen.choice_entropy_bits(3)  # no syllable can end an odd-length word
+
+    def test_choice_entropy_bits_grows_with_length(self):
+        gen = MisiPwGenV2(lang="it")
+
+        bits = [gen.choice_entropy_bits(n) for n in range(1, 65)]
+        self.assertTrue(all(b > 0 for b in bits))
+        self.assertGreater(bits[-1], bits[7])
+        self.assertEqual(MisiPwGenV2(lang="it").choice_entropy_bits(12), bits[11])
+
     def test_phrase(self):
         gen = MisiPwGenV2(lang="it")
 
@@ -362,6 +643,62 @@ class MisiPwGenV2TestCase(TestCase):
         self.assertEqual(len(word), 8)
 
 
+class MisiPwGenV2ThreadingTestCase(TestCase):
+    def test_rng_factory_gives_one_rng_per_thread(self):
+        import threading
+        from random import Random
+
+        created = []
+
+        def factory():
+            rng = Random(len(created))
+            created.append(rng)
+            return rng
+
+        gen = MisiPwGenV2(lang="it", rng_factory=factory)
+        seen = {}
+
+        def work(name):
+            gen.generate(8)
+            seen[name] = gen.current_rng()
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(created), 4)
+        self.assertEqual(len({id(rng) for rng in seen.values()}), 4)
+        self.assertIs(gen.current_rng(), gen.current_rng())
+
+    def test_rng_and_factory_are_exclusive(self):
+        from random import Random
+
+        with self.assertRaises(ValueError):
+            MisiPwGenV2(lang="it", rng=Random(1), rng_factory=Random)
+
+    def test_default_rng_is_random_module(self):
+        import random
+
+        self.assertIs(MisiPwGenV2(lang="it").current_rng(), random)
+
+    def test_sentence_partition_uses_configured_rng(self):
+        from random import Random
+
+        with mock.patch("random.randint", side_effect=AssertionError("global random used")):
+            s1 = MisiPwGenV2(lang="it", rng=Random(9)).sentence(29)
+            s2 = MisiPwGenV2(lang="it", rng=Random(9)).sentence(29)
+        self.assertEqual(s1, s2)
+
+    def test_partition_length_with_rng(self):
+        from random import Random
+
+        self.assertEqual(
+            MisiPwGenV2._partition_length(29, Random(1)), MisiPwGenV2._partition_length(29, Random(1))
+        )
+
+
 class GenerationErrorTestCase(TestCase):
     def test_is_exception(self):
         err = GenerationError("test error")
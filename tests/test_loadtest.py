@@ -0,0 +1,112 @@
+import io
+import json
+import threading
+import unittest
+from collections import Counter
+from contextlib import redirect_stderr, redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+try:
+    import flask  # noqa: F401
+except ImportError:  # pragma: no cover - Flask is only needed for the web app
+    flask = None
+
+from misipwgen import loadtest
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON server answering 200, or 400 for the sentence endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        status = 400 if self.path.endswith("sentence") else 200
+        payload = json.dumps({"language": body["language"]}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class LoadTestTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_parse_mix(self):
+        plan = loadtest.parse_mix("word=2,phrase=1")
+        self.assertEqual(Counter(plan), {"word": 2, "phrase": 1})
+        self.assertEqual(plan, ["word", "phrase", "word"])
+        self.assertEqual(loadtest.parse_mix("sentence"), ["sentence"])
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix("word=1,nope=2")
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix("word=0")
+
+    def test_percentiles(self):
+        values = [i / 1000 for i in range(1, 101)]
+        report = loadtest.summarize([("word", v, 200) for v in values], elapsed=2.0)
+        self.assertEqual(report["throughput_rps"], 50.0)
+        self.assertEqual(
+            report["latency_ms"], {"p50": 50.0, "p95": 95.0, "p99": 99.0, "max": 100.0, "mean": 50.5}
+        )
+        self.assertIsNone(loadtest.summarize([], 1.0)["latency_ms"])
+
+    def test_url_modes(self):
+        for mode in ("threads", "asyncio"):
+            with self.subTest(mode=mode):
+                report = loadtest.run(
+                    self.url,
+                    mode=mode,
+                    concurrency=3,
+                    duration=None,
+                    requests=40,
+                    mix="word=3,sentence=1",
+                )
+                self.assertEqual(report["requests"], 40)
+                words = report["endpoints"]["word"]["requests"]
+                sentences = report["endpoints"]["sentence"]["requests"]
+                self.assertEqual(words + sentences, 40)
+                self.assertGreater(words, sentences)
+                self.assertEqual(report["errors"], sentences)
+                self.assertEqual(report["statuses"], {"200": words, "400": sentences})
+                self.assertEqual(set(report["latency_ms"]), {"p50", "p95", "p99", "max", "mean"})
+
+    def test_connection_errors_are_counted(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        server.server_close()
+        report = loadtest.run(url, concurrency=1, duration=None, requests=3)
+        self.assertEqual(report["errors"], 3)
+        self.assertEqual(list(report["statuses"]), ["ConnectionRefusedError"])
+
+    def test_asyncio_needs_url(self):
+        with self.assertRaises(ValueError):
+            loadtest.run(object(), mode="asyncio")
+
+    @unittest.skipIf(flask is None, "Flask is not installed")
+    def test_cli_in_process(self):
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = loadtest.main(["--app", "webapp:app", "-c", "2", "-n", "30", "--lang", "es"])
+        self.assertEqual(code, 0, err.getvalue())
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["target"], "in-process")
+        self.assertEqual(report["requests"], 30)
+        self.assertEqual(report["statuses"], {"200": 30})
+        self.assertEqual(set(report["endpoints"]), {"word", "phrase", "sentence"})
+        self.assertIn("req/s", err.getvalue())
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
+import os
 import sys
 from io import StringIO
 
@@ -146,3 +147,51 @@ class MainTestCase(TestCase):
 
         self.assertEqual(result, 0)
         mock_gen.generate_word.assert_called_once_with(10)
+
+
+class BulkTestCase(TestCase):
+    def run_main(self, argv):
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            result = main(argv)
+        self.assertEqual(result, 0)
+        return mock_stdout.getvalue().splitlines()
+
+    def test_count_words(self):
+        lines = self.run_main(["9", "--count", "25"])
+        self.assertEqual(len(lines), 25)
+        self.assertTrue(all(len(line) == 9 for line in lines))
+
+    def test_count_phrases_and_sentences(self):
+        lines = self.run_main(["3", "5", "-n", "10", "--sep", "-"])
+        self.assertEqual([[len(w) for w in line.split("-")] for line in lines], [[3, 5]] * 10)
+
+        lines = self.run_main(["--sentence", "20", "-n", "10", "--sep", "-"])
+        self.assertEqual(len(lines), 10)
+        self.assertTrue(all(len(line.replace("-", "")) == 20 for line in lines))
+
+    @patch("misipwgen.bulk.CHUNK", 7)
+    def test_seeded_ordered_output_is_independent_of_jobs(self):
+        single = self.run_main(["8", "-n", "30", "--seed", "s"])
+        pooled = self.run_main(["8", "-n", "30", "--seed", "s", "--jobs", "2", "--ordered"])
+        self.assertEqual(single, pooled)
+        self.assertNotEqual(single, self.run_main(["8", "-n", "30", "--seed", "t"]))
+        # Chunks draw from distinct streams
+        self.assertNotEqual(single[:7], single[7:14])
+
+        unordered = self.run_main(["8", "-n", "30", "--seed", "s", "--jobs", "2"])
+        self.assertEqual(sorted(unordered), sorted(single))
+
+    def test_invalid_count(self):
+        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
+            self.assertEqual(main(["8", "--count", "0"]), 2)
+        self.assertIn("--count", mock_stderr.getvalue())
+
+    def test_broken_pipe(self):
+        with open(os.devnull, "w") as target:
+            stdout = MagicMock()
+            stdout.write.side_effect = BrokenPipeError
+            stdout.fileno.return_value = os.dup(target.fileno())
+            self.addCleanup(os.close, stdout.fileno.return_value)
+            with patch("sys.stdout", stdout):
+                self.assertEqual(main(["8", "--count", "100"]), 1)
+        stdout.write.assert_called_once()
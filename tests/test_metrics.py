@@ -0,0 +1,88 @@
+import threading
+from unittest import TestCase
+
+from misipwgen import webapi
+from misipwgen.metrics import Metrics
+
+DEFINITIONS = {
+    "requests_total": ("counter", "Requests."),
+    "latency_seconds": ("histogram", "Latency."),
+    "load_seconds": ("gauge", "Load time."),
+}
+
+
+def samples(text):
+    """Parse Prometheus text into {series: value}, skipping comments."""
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+
+
+class MetricsTestCase(TestCase):
+    def test_render(self):
+        metrics = Metrics(DEFINITIONS, buckets=(0.001, 0.01))
+        labels = (("endpoint", "word"),)
+        metrics.inc("requests_total", labels + (("status", "200"),))
+        metrics.inc("requests_total", labels + (("status", "200"),), 2)
+        metrics.observe("latency_seconds", labels, 0.0005)
+        metrics.observe("latency_seconds", labels, 0.001)
+        metrics.observe("latency_seconds", labels, 0.5)
+        metrics.set("load_seconds", (("language", 'i"t'),), 0.25)
+
+        text = metrics.render()
+        self.assertIn("# TYPE latency_seconds histogram\n", text)
+        self.assertEqual(
+            samples(text),
+            {
+                'requests_total{endpoint="word",status="200"}': "3",
+                'latency_seconds_bucket{endpoint="word",le="0.001"}': "2",
+                'latency_seconds_bucket{endpoint="word",le="0.01"}': "2",
+                'latency_seconds_bucket{endpoint="word",le="+Inf"}': "3",
+                'latency_seconds_sum{endpoint="word"}': "0.5015",
+                'latency_seconds_count{endpoint="word"}': "3",
+                'load_seconds{language="i\\"t"}': "0.25",
+            },
+        )
+
+    def test_threads_are_summed(self):
+        metrics = Metrics(DEFINITIONS)
+
+        def worker():
+            for _ in range(1000):
+                metrics.inc("requests_total")
+                metrics.observe("latency_seconds", (), 0.002)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(metrics._shards), 4)
+        values = samples(metrics.render())
+        self.assertEqual(values["requests_total"], "4000")
+        self.assertEqual(values["latency_seconds_count"], "4000")
+
+    def test_call_records_generation_and_serialization(self):
+        registry = webapi.GeneratorRegistry(["it"])
+        registry.warm()
+
+        status, body = webapi.call(registry, webapi.phrase, lambda: {"word_lengths": [3, 4]}, repr)
+        self.assertEqual(status, 200)
+        self.assertIsInstance(body, str)
+        status, _ = webapi.call(registry, webapi.word, lambda: {"language": "xx"}, repr)
+        self.assertEqual(status, 400)
+
+        values = samples(registry.render_metrics())
+        self.assertEqual(
+            values['misipwgen_requests_total{endpoint="phrase",language="it",status="200"}'], "1"
+        )
+        self.assertEqual(
+            values['misipwgen_requests_total{endpoint="word",language="other",status="400"}'], "1"
+        )
+        for name in ("request", "generation", "serialization"):
+            self.assertEqual(
+                values[f'misipwgen_{name}_seconds_count{{endpoint="phrase",language="it"}}'], "1"
+            )
+        self.assertEqual(values['misipwgen_words_generated_total{language="it"}'], "2")
+        self.assertEqual(values['misipwgen_characters_generated_total{language="it"}'], "7")
+        self.assertIn('misipwgen_table_load_seconds{language="it"}', values)
+        self.assertEqual(values["misipwgen_ready"], "1")
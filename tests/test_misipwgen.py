@@ -19,6 +19,134 @@ class MisiPwGenTestCase(TestCase):
         for i in range(100):
             self.assertIn(pwg.generate(4), self._all_combinations())
 
+    def test_generate_many(self):
+        pwg = MisiPwGen()
+
+        words = pwg.generate_many(4, 100)
+        self.assertEqual(len(words), 100)
+        for word in words:
+            self.assertIn(word, self._all_combinations())
+
+    def test_generate_many_with_seeded_rng(self):
+        from random import Random
+
+        words1 = MisiPwGen(lang="it", rng=Random(5)).generate_many(8, 30)
+        words2 = MisiPwGen(lang="it", rng=Random(5)).generate_many(8, 30)
+        self.assertEqual(words1, words2)
+        self.assertTrue(all(len(w) == 8 for w in words1))
+
+    def test_generate_many_negative_count_raises(self):
+        pwg = MisiPwGen()
+        with self.assertRaises(ValueError):
+            pwg.generate_many(4, -1)
+
+    def test_generate_with_rejection_sampling(self):
+        pwg = MisiPwGen(rejection_sampling=True)
+
+        for word in pwg.generate_many(4, 50) + [pwg.generate(4) for _ in range(50)]:
+            self.assertIn(word, self._all_combinations())
+
+    def test_generate_impossible_length_raises(self):
+        from misipwgen.generator_v2 import GenerationError
+
+        pwg = MisiPwGen()
+        with self.assertRaises(GenerationError):
+            pwg.generate(3)  # only 2-letter syllables: no word can end
+        with self.assertRaises(GenerationError):
+            pwg.generate_many(3, 2)
+
+    def test_boundary_table_only_holds_accepted_renderings(self):
+        pwg = MisiPwGen(lang="it")
+        texts, weights, starting = pwg.tables.renderings
+
+        for residual, prev in [(8, ""), (8, "a"), (8, "r"), (3, "o"), (2, "s"), (1, "n")]:
+            with self.subTest(residual=residual, prev=prev):
+                table = pwg.tables.boundary_table(residual, prev)
+                self.assertGreater(len(table), 0)
+                for i, weight in zip(table.indices, table.weights):
+                    self.assertLessEqual(len(texts[i]), residual)
+                    self.assertEqual(weight, weights[i])
+                    self.assertTrue(starting[i] or prev)
+                    self.assertFalse(
+                        pwg._reject_by_boundary(prev, texts[i], residual)
+                        and pwg._reject_by_boundary(prev, texts[i], residual, relax_vowel_vowel=True)
+                    )
+        # Residuals above the longest syllable share one table
+        self.assertIs(pwg.tables.boundary_table(20, "a"), pwg.tables.boundary_table(30, "a"))
+
+    def test_renderings_split_syllable_weight(self):
+        pwg = MisiPwGen()
+        texts, weights, starting = pwg.tables.renderings
+
+        self.assertEqual(texts, ["ba", "be", "ci", "co", "da", "du", "fa", "fi"])
+        self.assertEqual(weights, [5] * 8)
+        self.assertEqual(starting, [True] * 8)
+
+    def test_filtered_and_rejection_generators_agree(self):
+        from collections import Counter
+        from random import Random
+
+        filtered = MisiPwGen(lang="it", rng=Random(1))
+        rejection = MisiPwGen(lang="it", rng=Random(1), rejection_sampling=True)
+        a = Counter(filtered.generate(2) for _ in range(20000))
+        b = Counter(rejection.generate(2) for _ in range(20000))
+
+        for word, count in a.most_common(5):
+            self.assertAlmostEqual(count / 20000, b[word] / 20000, delta=0.01)
+
+    def test_choice_entropy_bits(self):
+        pwg = MisiPwGen()
+
+        # Every syllable has 2 renderings and every join passes the boundary rules
+        self.assertAlmostEqual(pwg.choice_entropy_bits(2), 3.0)
+        self.assertAlmostEqual(pwg.choice_entropy_bits(4), 6.0)
+        self.assertEqual(pwg.choice_entropy_bits(0), 0.0)
+
+    def test_choice_entropy_bits_unreachable_length_raises(self):
+        from misipwgen.generator_v2 import GenerationError
+
+        with self.assertRaises(GenerationError):
+            MisiPwGen().choice_entropy_bits(3)
+
+    def test_choice_entropy_bits_matches_boundary_rules(self):
+        from math import log2
+
+        pwg = MisiPwGen(lang="it")
+        # Single letter words: one-letter syllables that pass the first-position rules
+        weights = {}
+        for s in pwg.syllables[: pwg.syllables.last_index(1) + 1]:
+            for text in s.variants():
+                if s.weight and s.starting and not pwg._reject_by_boundary("", text, 1):
+                    weights[text] = weights.get(text, 0) + s.weight / len(s.variants())
+        total = sum(weights.values())
+        expected = -sum(w / total * log2(w / total) for w in weights.values())
+        self.assertAlmostEqual(pwg.choice_entropy_bits(1), expected)
+        self.assertGreater(pwg.choice_entropy_bits(32), pwg.choice_entropy_bits(16))
+
+    def test_choice_entropy_bits_bounds_word_entropy(self):
+        from math import log2
+
+        pwg = MisiPwGen(lang="it")
+        tables, texts = pwg.tables, pwg.tables.renderings[0]
+
+        def words(residual, prev, prefix, p):
+            table = tables.boundary_table(residual, prev)
+            for index, weight in zip(table.indices, table.weights):
+                text, q = texts[index], p * weight / table.total
+                if residual == len(text):
+                    yield prefix + text, q
+                else:
+                    yield from words(residual - len(text), text[-1], prefix + text, q)
+
+        for n in (2, 3):
+            with self.subTest(n=n):
+                merged = {}
+                for word, q in words(n, "", "", 1.0):
+                    merged[word] = merged.get(word, 0.0) + q
+                word_bits = -sum(q * log2(q) for q in merged.values())
+                # Different syllable splits can spell the same word
+                self.assertLess(word_bits, pwg.choice_entropy_bits(n))
+
     def test_init_with_lang_parameter(self):
         """Test initialization with lang parameter"""
         pwg = MisiPwGen(lang="it")
@@ -153,6 +281,42 @@ class MisiPwGenTestCase(TestCase):
         word2 = pwg2.generate(8)
         self.assertEqual(word1, word2)
 
+    def test_rng_factory_per_thread(self):
+        """Test each thread gets its own RNG from rng_factory"""
+        import threading
+        from random import Random
+
+        pwg = MisiPwGen(lang="it", rng_factory=Random)
+        rngs = []
+        threads = [threading.Thread(target=lambda: rngs.append(pwg.current_rng())) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len({id(r) for r in rngs}), 3)
+
+    def test_sentence_with_seeded_rng(self):
+        """Test sentence partitioning honours the configured RNG"""
+        from random import Random
+
+        s1 = MisiPwGen(lang="it", rng=Random(3)).sentence(31)
+        s2 = MisiPwGen(lang="it", rng=Random(3)).sentence(31)
+        self.assertEqual(s1, s2)
+
+    def test_boundary_violation_names_rule(self):
+        for args, rule in [
+            (("", "", 2), "empty_candidate"),
+            (("ba", "ab", 4), "repeated_letter"),
+            (("", "tà", 4), "accent_not_final"),
+            (("ba", "io", 4), "vowel_vowel"),
+            (("ab", "ci", 4), "consonant_consonant"),
+            (("ab", "a", 4), "single_vowel_middle"),
+            (("ba", "ci", 4), None),
+        ]:
+            with self.subTest(args=args):
+                self.assertEqual(MisiPwGen._boundary_violation(*args), rule)
+                self.assertEqual(MisiPwGen._reject_by_boundary(*args), rule is not None)
+
     def test_reject_by_boundary_empty_candidate(self):
         """Test _reject_by_boundary with empty candidate"""
         self.assertTrue(MisiPwGen._reject_by_boundary("ab", "", 2))
@@ -0,0 +1,36 @@
+import gc
+import os
+from unittest import TestCase
+
+from misipwgen import preload
+from misipwgen.cache import clear_cache
+from misipwgen.generator_v2 import MisiPwGenV2
+
+
+class PreloadTestCase(TestCase):
+    def setUp(self):
+        clear_cache()
+        self.addCleanup(clear_cache)
+
+    def test_languages(self):
+        self.assertEqual(preload.languages(), ["es", "it"])
+
+    def test_warm_fills_the_shared_cache(self):
+        gens = preload.warm()
+
+        self.assertEqual(sorted(gens), ["es", "it"])
+        self.assertIs(MisiPwGenV2.from_language("it").tables, gens["it"].tables)
+
+    def test_freeze(self):
+        self.addCleanup(gc.unfreeze)
+        preload.freeze()
+
+        self.assertGreater(gc.get_freeze_count(), 0)
+
+    def test_memory_usage(self):
+        usage = preload.memory_usage()
+
+        self.assertGreater(usage["rss"], 0)
+        if os.path.exists("/proc/self/smaps_rollup"):
+            self.assertIn("private_dirty", usage)
+        self.assertIn("rss=", preload.format_memory(usage))
@@ -0,0 +1,131 @@
+import random
+import threading
+import time
+from unittest import TestCase, mock
+
+from misipwgen import webapi
+from misipwgen.generator_v2 import MisiPwGenV2
+from misipwgen.reservoir import WordReservoir, _reset_after_fork
+
+
+class WordReservoirTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.generators = {"it": MisiPwGenV2.from_language("it", rng=random.Random(3))}
+
+    def reservoir(self, **kwargs):
+        reservoir = WordReservoir(self.generators, **kwargs)
+        self.addCleanup(reservoir.close)
+        return reservoir
+
+    def test_refills_between_watermarks(self):
+        reservoir = self.reservoir(capacity=20, low=5, high=15, background=False)
+
+        self.assertEqual(len(reservoir.get("it", 8)), 8)  # buffer created empty: fallback
+        self.assertEqual(reservoir.refill(), 15)
+        self.assertEqual(reservoir.refill(), 0)
+        for _ in range(10):
+            self.assertEqual(len(reservoir.get("it", 8)), 8)
+        self.assertEqual(reservoir.refill(), 10)
+
+        stats = reservoir.stats()
+        self.assertEqual((stats["hits"], stats["fallbacks"]), (10, 1))
+        self.assertEqual((stats["refills"], stats["generated"]), (2, 25))
+        self.assertEqual(stats["buffers"], {"it": {8: 15}})
+
+    def test_refill_counts_words_kept(self):
+        reservoir = self.reservoir(capacity=10, low=5, background=False)
+        reservoir.get("it", 8)
+        reservoir.refill()
+        for _ in range(5):
+            reservoir.get("it", 8)
+        buffer = reservoir._buffers[("it", 8)]
+        generate_many = self.generators["it"].generate_many
+
+        def popping_generate_many(length, count):
+            # Two words are taken by other threads while the refill generates
+            buffer.popleft()
+            buffer.popleft()
+            return generate_many(length, count)
+
+        with mock.patch.object(self.generators["it"], "generate_many", popping_generate_many):
+            self.assertEqual(reservoir.refill(), 3)
+        self.assertEqual(len(buffer), 8)
+        self.assertEqual(reservoir.stats()["generated"], 13)
+
+    def test_each_word_handed_out_once(self):
+        reservoir = self.reservoir(capacity=2000, low=0, background=False)
+        reservoir.get("it", 10)
+        reservoir.refill()
+        buffered = list(reservoir._buffers[("it", 10)])
+        popped = []
+
+        def worker():
+            for _ in range(500):
+                popped.append(reservoir.get("it", 10))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len({id(word) for word in popped}), 2000)
+        self.assertEqual(sorted(map(id, popped)), sorted(map(id, buffered)))
+        self.assertEqual(reservoir.stats()["hits"], 2000)
+
+    def test_max_buffers(self):
+        reservoir = self.reservoir(capacity=8, max_buffers=1, background=False)
+        reservoir.get("it", 6)
+        reservoir.get("it", 7)
+        reservoir.refill()
+
+        self.assertEqual(reservoir.stats()["buffers"], {"it": {6: 8}})
+        self.assertEqual(len(reservoir.get("it", 7)), 7)
+        self.assertEqual(reservoir.stats()["fallbacks"], 3)
+
+    def test_background_refill(self):
+        reservoir = self.reservoir(capacity=64)
+        reservoir.get("it", 9)
+        deadline = time.monotonic() + 5
+        while reservoir.stats()["buffers"]["it"][9] < 64 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(reservoir.stats()["buffers"], {"it": {9: 64}})
+        self.assertEqual(len(reservoir.get("it", 9)), 9)
+        self.assertEqual(reservoir.stats()["hits"], 1)
+        reservoir.close()
+        self.assertFalse(reservoir._thread.is_alive())
+
+    def test_reset_after_fork_wipes_buffers(self):
+        reservoir = self.reservoir(capacity=8, background=False)
+        reservoir.get("it", 8)
+        reservoir.refill()
+
+        _reset_after_fork()
+        self.assertEqual(
+            reservoir.stats(), {"hits": 0, "fallbacks": 0, "refills": 0, "generated": 0, "buffers": {}}
+        )
+        self.assertEqual(len(reservoir.get("it", 8)), 8)
+        self.assertEqual(reservoir.stats()["fallbacks"], 1)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            WordReservoir(self.generators, capacity=8, low=8)
+        with self.assertRaises(ValueError):
+            WordReservoir(self.generators, capacity=8, high=9)
+        with self.assertRaises(KeyError):
+            self.reservoir(background=False).get("xx", 8)
+
+    def test_registry_serves_words_from_reservoir(self):
+        registry = webapi.GeneratorRegistry(["it"], reservoir=32)
+        self.addCleanup(registry.reservoir.close)
+        registry.warm()
+
+        self.assertEqual(len(webapi.word(registry, {"length": 9})["result"]), 9)
+        result = webapi.phrase(registry, {"word_lengths": [4, 5], "separator": "-"})["result"]
+        self.assertEqual([len(w) for w in result.split("-")], [4, 5])
+        stats = registry.reservoir.stats()
+        self.assertEqual(stats["hits"] + stats["fallbacks"], 3)
+        with self.assertRaises(webapi.ApiError):
+            registry.word("xx", 8)
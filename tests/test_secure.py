@@ -0,0 +1,87 @@
+from array import array
+from collections import Counter
+from unittest import TestCase, mock
+
+from misipwgen.generator_v2 import MisiPwGenV2
+from misipwgen.misipwgen import MisiPwGen
+from misipwgen.secure import BufferedSystemRandom, _reset_after_fork
+
+
+def _urandom_words(*words):
+    """Fake os.urandom returning the given 64-bit words, then zeros."""
+    data = array("Q", words).tobytes()
+    return lambda n: (data + bytes(n))[:n]
+
+
+class BufferedSystemRandomTestCase(TestCase):
+    def test_ranges(self):
+        rng = BufferedSystemRandom()
+
+        for _ in range(1000):
+            self.assertTrue(0 <= rng.random() < 1)
+            self.assertTrue(1 <= rng.randrange(1, 7) < 7)
+            self.assertTrue(0 <= rng.getrandbits(5) < 32)
+        self.assertEqual(rng.getrandbits(0), 0)
+        self.assertLess(rng.getrandbits(200), 1 << 200)
+        self.assertEqual(len(rng.randbytes(33)), 33)
+        with self.assertRaises(ValueError):
+            rng.getrandbits(-1)
+
+    def test_roughly_uniform(self):
+        rng = BufferedSystemRandom(block_size=64)
+        counts = Counter(rng.randrange(6) for _ in range(60000))
+        for face in range(6):
+            self.assertAlmostEqual(counts[face] / 60000, 1 / 6, delta=0.015)
+
+    def test_bit_slicing_with_rejection(self):
+        rng = BufferedSystemRandom()
+        # _randbelow(5) keeps the top 3 bits: 7 and 5 are rejected, 3 is accepted
+        words = (7 << 61, 5 << 61, 3 << 61 | 12345)
+        with mock.patch("misipwgen.secure.os.urandom", _urandom_words(*words)):
+            rng._reset()
+            self.assertEqual(rng._randbelow(5), 3)
+
+    def test_large_ranges(self):
+        rng = BufferedSystemRandom()
+        n = (1 << 70) + 3
+        for _ in range(100):
+            self.assertLess(rng.randrange(n), n)
+
+    def test_refills_in_blocks(self):
+        rng = BufferedSystemRandom(block_size=16)
+        with mock.patch("misipwgen.secure.os.urandom", wraps=__import__("os").urandom) as urandom:
+            for _ in range(10):
+                rng.getrandbits(64)
+        self.assertEqual(urandom.call_count, 5)
+        urandom.assert_called_with(16)
+
+    def test_reset_after_fork_discards_buffer(self):
+        rng = BufferedSystemRandom()
+        with mock.patch("misipwgen.secure.os.urandom", _urandom_words(1, 2, 3)):
+            rng._reset()
+            self.assertEqual(rng.getrandbits(64), 1)
+        _reset_after_fork()
+        with mock.patch("misipwgen.secure.os.urandom", _urandom_words(9)):
+            self.assertEqual(rng.getrandbits(64), 9)
+
+    def test_not_seedable(self):
+        rng = BufferedSystemRandom()
+        self.assertIsNone(rng.seed(42))
+        with self.assertRaises(NotImplementedError):
+            rng.getstate()
+        with self.assertRaises(NotImplementedError):
+            rng.setstate(None)
+
+    def test_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            BufferedSystemRandom(block_size=4)
+
+    def test_generators_accept_it(self):
+        rng = BufferedSystemRandom()
+
+        self.assertEqual(len(MisiPwGenV2(lang="it", rng=rng).generate(12)), 12)
+        self.assertEqual(len(MisiPwGenV2(lang="it", rng=rng).generate_many(6, 10)), 10)
+        self.assertEqual(len(MisiPwGen(lang="it", rng=rng).generate(8)), 8)
+        self.assertGreaterEqual(
+            len(MisiPwGen(lang="it", rng_factory=BufferedSystemRandom).sentence(20)), 20
+        )
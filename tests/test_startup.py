@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import misipwgen
+from misipwgen import binary
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in microseconds, several times what a cold start
+# measures today (about 2 ms for the package, 30 ms for everything the CLI imports)
+# so that slow CI machines pass while an eager import of the data still fails.
+PACKAGE_BUDGET_US = 20_000
+CLI_BUDGET_US = 120_000
+
+
+def import_times(*args: str):
+    """Run `python -X importtime <args>`; return {module: cumulative microseconds}
+    and the total of the top-level imports.
+
+    Keeps the fastest of three runs, the first of which also warms the bytecode cache.
+    """
+    best: dict = {}
+    best_total = None
+    for _ in range(3):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times = {}
+        total = 0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+            # Nested imports are indented below the module that triggered them
+            if not name.startswith("  "):
+                total += int(cumulative)
+        if best_total is None or total < best_total:
+            best, best_total = times, total
+    return best, best_total
+
+
+class StartupTestCase(TestCase):
+    def test_package_import_is_lazy(self):
+        times, _ = import_times("-c", "import misipwgen")
+
+        loaded = [name for name in times if name.startswith("misipwgen.")]
+        self.assertEqual(loaded, [])
+        self.assertLess(times["misipwgen"], PACKAGE_BUDGET_US)
+
+    def test_cli_skips_legacy_generator_and_data_modules(self):
+        times, total = import_times("-m", "misipwgen", "8")
+
+        self.assertIn("misipwgen.generator_v2", times)
+        self.assertNotIn("misipwgen.misipwgen", times)
+        self.assertNotIn("dataclasses", times)
+        self.assertFalse([name for name in times if name.startswith("misipwgen.data")])
+        self.assertLess(total, CLI_BUDGET_US)
+
+    def test_public_names_resolve_on_access(self):
+        self.assertIs(misipwgen.MisiPwGen, misipwgen.MisiPwGenPositional)
+        self.assertIn("MisiPwGen", dir(misipwgen))
+        with self.assertRaises(AttributeError):
+            misipwgen.NoSuchName
+
+
+class PackagedDataTestCase(TestCase):
+    def test_binary_data_matches_modules(self):
+        for lang in ("it", "es"):
+            with self.subTest(lang=lang):
+                module = __import__(f"misipwgen.data.{lang}.syllables_v2", fromlist=["SYLLABLES_V2"])
+                path = os.path.join(ROOT, "misipwgen", "data", lang, "syllables_v2.bin")
+                with open(path, "rb") as f:
+                    self.assertEqual(f.read(), binary.dumps(module.SYLLABLES_V2, positional=True))
@@ -0,0 +1,114 @@
+from random import Random
+from unittest import TestCase, mock
+
+from misipwgen.misipwgen import MisiPwGen
+from misipwgen.stats import GenerationStats
+
+
+class GenerationStatsTestCase(TestCase):
+    def test_empty_snapshot(self):
+        stats = GenerationStats()
+
+        self.assertEqual(
+            stats.snapshot(), {"words": 0, "attempts": {}, "rejections": {}, "fallbacks": 0}
+        )
+
+    def test_recorder_counts(self):
+        stats = GenerationStats()
+        recorder = stats.word(4)
+        draw = recorder.draws(lambda residual: "ba")
+        reject = recorder.checks(MisiPwGen._boundary_violation)
+
+        draw(4)
+        draw(2)
+        self.assertTrue(reject("ba", "ab", 2))  # repeated letter
+        self.assertTrue(reject("ba", "o", 2))  # vowel-vowel, not final
+        self.assertFalse(reject("ba", "o", 2, relax_vowel_vowel=True))
+        self.assertFalse(reject("ba", "ba", 2))
+        recorder.commit()
+
+        self.assertEqual(
+            stats.snapshot(),
+            {
+                "words": 1,
+                "attempts": {4: {2: 1}},
+                "rejections": {"repeated_letter": 1, "vowel_vowel": 1},
+                "fallbacks": 1,
+            },
+        )
+
+    def test_reset(self):
+        stats = GenerationStats()
+        stats.word(3).commit()
+        stats.reset()
+
+        self.assertEqual(stats.snapshot()["words"], 0)
+
+    def test_snapshot_is_a_copy(self):
+        stats = GenerationStats()
+        stats.word(3).commit()
+        snapshot = stats.snapshot()
+        stats.word(3).commit()
+
+        self.assertEqual(snapshot["attempts"], {3: {0: 1}})
+
+
+@mock.patch("misipwgen.misipwgen.SYLLABLES_FILE", "tests/fixtures/syllables2.csv")
+class GeneratorStatsTestCase(TestCase):
+    def test_disabled_by_default(self):
+        self.assertIsNone(MisiPwGen().stats)
+
+    def test_rejection_sampling_records_words(self):
+        stats = GenerationStats()
+        pwg = MisiPwGen(lang="it", rng=Random(2), rejection_sampling=True, stats=stats)
+
+        pwg.generate_many(6, 50)
+        for _ in range(50):
+            pwg.generate(6)
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["words"], 100)
+        self.assertEqual(sum(snapshot["attempts"][6].values()), 100)
+        self.assertTrue(all(attempts >= 2 for attempts in snapshot["attempts"][6]))
+        self.assertGreater(sum(snapshot["rejections"].values()), 0)
+        self.assertLessEqual(
+            set(snapshot["rejections"]),
+            {
+                "repeated_letter",
+                "accent_not_final",
+                "vowel_vowel",
+                "consonant_consonant",
+                "single_vowel_middle",
+            },
+        )
+
+    def test_filtered_generator_never_rejects(self):
+        stats = GenerationStats()
+        pwg = MisiPwGen(stats=stats)
+
+        for _ in range(20):
+            pwg.generate(4)
+
+        # Two 2-letter syllables per word, each drawn once
+        self.assertEqual(
+            stats.snapshot(), {"words": 20, "attempts": {4: {2: 20}}, "rejections": {}, "fallbacks": 0}
+        )
+
+    def test_filtered_generator_counts_relaxed_tables(self):
+        stats = GenerationStats()
+        pwg = MisiPwGen(stats=stats)
+        tables = {pwg.tables.boundary_table(2, vowel) for vowel in "aeiou"}
+        pwg.tables.relaxed.update(tables)
+        try:
+            pwg.generate(4)
+        finally:
+            pwg.tables.relaxed.difference_update(tables)
+
+        self.assertEqual(stats.snapshot()["fallbacks"], 1)
+
+    def test_shared_between_generators(self):
+        stats = GenerationStats()
+        MisiPwGen(stats=stats).generate(2)
+        MisiPwGen.from_csv("tests/fixtures/syllables2.csv", stats=stats).generate(4)
+
+        self.assertEqual(stats.snapshot()["words"], 2)
@@ -19,6 +19,10 @@ class SyllableTestCase(TestCase):
         s = Syllable(starting=True, weight=5, sequence=["a", "b", "c", "d"])
         self.assertEqual(s.length(), 4)
 
+    def test_variants(self):
+        s = Syllable(starting=True, weight=5, sequence=["ab", "c", "de"])
+        self.assertEqual(s.variants(), ("acd", "ace", "bcd", "bce"))
+
     def test_random_generation(self):
 
         s = Syllable(starting=True, weight=5, sequence=["x", "y", "z"])
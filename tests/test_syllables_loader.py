@@ -29,3 +29,19 @@ class SyllablesLoaderTestCase(TestCase):
             [str(s) for s in syllables],
             ["aeiou", "b-a", "b-r-aeiou", "n-v-aeiou", "t-t-r-aeiou"],
         )
+
+    def test_load_expanded(self):
+
+        syllables = SyllablesLoader("tests/fixtures/syllables.csv", expand=True).load()
+
+        self.assertEqual(len(syllables), 1 + 5 + 5 + 5 + 5)
+        self.assertTrue(all(len(column) == 1 for s in syllables for column in s.sequence))
+        by_text = {"".join(s.sequence): s for s in syllables}
+        # Weights are scaled by lcm(1, 5) and split among the renderings
+        self.assertEqual(by_text["ba"].weight, 25)
+        self.assertEqual(by_text["e"].weight, 7)
+        self.assertEqual(by_text["bro"].weight, 2)
+        self.assertTrue(by_text["o"].starting)
+        self.assertFalse(by_text["ttru"].starting)
+        self.assertEqual(syllables.max_syllable_length, 4)
+        self.assertEqual(syllables.last_index(1), 4)
@@ -0,0 +1,134 @@
+import json
+import threading
+import unittest
+from unittest import TestCase, mock
+
+try:
+    import flask  # noqa: F401
+except ImportError:  # pragma: no cover - Flask is only needed for the web app
+    flask = None
+
+from misipwgen import webapi
+
+if flask is not None:
+    import webapp
+
+
+@unittest.skipIf(flask is None, "Flask is not installed")
+class CreateAppTestCase(TestCase):
+    def test_discovers_language_packs(self):
+        client = webapp.create_app().test_client()
+
+        response = client.get("/readyz")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"status": "ready", "languages": ["es", "it"]})
+        response = client.post("/api/generate/word", json={"language": "xx"})
+        self.assertEqual(response.get_json()["error"], "Language must be 'it' or 'es'")
+
+    def test_serves_from_registry(self):
+        app = webapp.create_app(["it"])
+        client = app.test_client()
+        registry = app.extensions["misipwgen"]
+
+        with mock.patch.object(webapi.MisiPwGen, "from_language") as from_language:
+            response = client.post("/api/generate/word", json={"length": 9, "language": "it"})
+            from_language.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()["result"]), 9)
+        self.assertIs(registry.get("it"), registry.generators["it"])
+
+        response = client.post("/api/generate/sentence", json={"language": "es"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Language must be 'it'")
+
+    def test_background_warm_flips_readiness(self):
+        gate = threading.Event()
+        from_language = webapi.MisiPwGen.from_language
+
+        def slow(language):
+            gate.wait(5)
+            return from_language(language)
+
+        with mock.patch.object(webapi.MisiPwGen, "from_language", side_effect=slow):
+            app = webapp.create_app(["it"], background=True, timeout=0)
+            client = app.test_client()
+
+            self.assertEqual(client.get("/readyz").status_code, 503)
+            response = client.post("/api/generate/word", json={"language": "it"})
+            self.assertEqual(response.status_code, 503)
+
+            gate.set()
+            self.assertTrue(app.extensions["misipwgen"].ready.wait(5))
+        self.assertEqual(client.get("/readyz").status_code, 200)
+        response = client.post("/api/generate/phrase", json={"word_lengths": [3, 4]})
+        self.assertEqual(response.status_code, 200)
+
+    def test_metrics(self):
+        client = webapp.create_app(["it"]).test_client()
+        client.post("/api/generate/word", json={"length": 9})
+        client.post("/api/generate/batch", json={"count": 3, "length": 5})
+
+        response = client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain; version=0.0.4"))
+        text = response.get_data(as_text=True)
+        self.assertIn('misipwgen_requests_total{endpoint="word",language="it",status="200"} 1\n', text)
+        self.assertIn('misipwgen_requests_total{endpoint="batch",language="it",status="200"} 1\n', text)
+        self.assertIn('misipwgen_generation_seconds_count{endpoint="word",language="it"} 1\n', text)
+        self.assertIn('misipwgen_serialization_seconds_count{endpoint="batch",language="it"} 1\n', text)
+        self.assertIn('misipwgen_characters_generated_total{language="it"} 24\n', text)
+
+
+@unittest.skipIf(flask is None, "Flask is not installed")
+class BatchTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = webapp.create_app(["it"])
+        cls.client = cls.app.test_client()
+
+    def lines(self, **body):
+        response = self.client.post("/api/generate/batch", json=body)
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+        return response, response.get_data(as_text=True).splitlines()
+
+    def test_words_in_chunks_from_bulk_path(self):
+        pwg = self.app.extensions["misipwgen"].get("it")
+        count = webapi.BATCH_CHUNK + 5
+
+        with mock.patch.object(pwg, "generate", side_effect=AssertionError("per-word path")):
+            response, lines = self.lines(count=count, length=9)
+
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        self.assertEqual(len(lines), count)
+        self.assertTrue(all(len(json.loads(line)["result"]) == 9 for line in lines))
+
+    def test_length_range_as_text(self):
+        response, lines = self.lines(count=300, min_length=4, max_length=6, format="text")
+
+        self.assertEqual(response.mimetype, "text/plain")
+        self.assertEqual({len(line) for line in lines}, {4, 5, 6})
+
+    def test_phrases_and_sentences(self):
+        _, lines = self.lines(count=20, type="phrase", word_lengths=[3, 5], format="text")
+        self.assertTrue(all([len(w) for w in line.split("_")] == [3, 5] for line in lines))
+
+        _, lines = self.lines(count=20, type="sentence", total_length=20, separator=" ")
+        for line in lines:
+            words = json.loads(line)["result"].split(" ")
+            self.assertEqual(sum(map(len, words)), 20)
+
+    def test_validation(self):
+        bad = [
+            {"count": 0},
+            {"count": webapi.MAX_BATCH + 1},
+            {"format": "csv"},
+            {"type": "poem"},
+            {"min_length": 6, "max_length": 4},
+            {"type": "phrase", "word_lengths": []},
+            {"type": "sentence", "total_length": 101},
+            {"language": "es"},
+        ]
+        for body in bad:
+            with self.subTest(body=body):
+                response = self.client.post("/api/generate/batch", json=body)
+                self.assertEqual(response.status_code, 400)
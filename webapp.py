@@ -5,96 +5,92 @@ Exposes word, phrase, and sentence generation via web interface
 """
 
 import os
-from flask import Flask, render_template, request, jsonify
-from misipwgen import MisiPwGen
+import threading
 
-app = Flask(__name__)
+from flask import Blueprint, Flask, Response, current_app, render_template, request, jsonify
+from misipwgen import webapi
+from misipwgen.webapi import GeneratorRegistry
 
+bp = Blueprint("misipwgen", __name__)
 
-@app.route("/")
+
+def create_app(languages=None, background=False, timeout=30.0, reservoir=0):
+    """Build the Flask app with a warm registry of generators.
+
+    Serves every packaged language unless `languages` is given. Generators are
+    warmed before returning, or on a background thread with `background=True`
+    (requests then wait up to `timeout` s for them and `/readyz` answers 503
+    until they are loaded). `reservoir` > 0 serves words from pre-generated
+    buffers of that capacity (see `misipwgen.reservoir`).
+    """
+    app = Flask(__name__)
+    registry = GeneratorRegistry(languages, timeout=timeout, reservoir=reservoir)
+    app.extensions["misipwgen"] = registry
+    app.register_blueprint(bp)
+    if background:
+        threading.Thread(target=registry.warm, name="misipwgen-warm", daemon=True).start()
+    else:
+        registry.warm()
+    return app
+
+
+def handle(handler):
+    """Run a `misipwgen.webapi` handler on the request's JSON body"""
+    registry = current_app.extensions["misipwgen"]
+    status, body = webapi.call(registry, handler, request.get_json, jsonify)
+    return body, status
+
+
+@bp.route("/readyz")
+def readyz():
+    """Readiness probe: 200 once every generator is loaded, else 503"""
+    status, body = current_app.extensions["misipwgen"].status()
+    return jsonify(body), status
+
+
+@bp.route("/metrics")
+def metrics():
+    """Prometheus metrics of this process"""
+    text = current_app.extensions["misipwgen"].render_metrics()
+    return Response(text, content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@bp.route("/")
 def index():
     """Main page with generation forms"""
     return render_template("index.html")
 
 
-@app.route("/api/generate/word", methods=["POST"])
+@bp.route("/api/generate/word", methods=["POST"])
 def generate_word():
     """Generate a single word"""
-    try:
-        data = request.get_json()
-        length = int(data.get("length", 7))
-        language = data.get("language", "it")
+    return handle(webapi.word)
 
-        # Validate inputs
-        if length < 1 or length > 50:
-            return jsonify({"error": "Length must be between 1 and 50"}), 400
-        if language not in ["it", "es"]:
-            return jsonify({"error": "Language must be 'it' or 'es'"}), 400
 
-        pwg = MisiPwGen.from_language(language)
-        word = pwg.generate_word(length)
-
-        return jsonify({"result": word, "type": "word", "language": language})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@app.route("/api/generate/phrase", methods=["POST"])
+@bp.route("/api/generate/phrase", methods=["POST"])
 def generate_phrase():
     """Generate a phrase with multiple words"""
-    try:
-        data = request.get_json()
-        word_lengths = data.get("word_lengths", [5, 5, 5])
-        separator = data.get("separator", "_")
-        language = data.get("language", "it")
-
-        # Validate inputs
-        if not word_lengths or len(word_lengths) > 10:
-            return jsonify({"error": "Provide 1-10 word lengths"}), 400
-        if any(l < 1 or l > 50 for l in word_lengths):
-            return jsonify({"error": "Each word length must be between 1 and 50"}), 400
-        if language not in ["it", "es"]:
-            return jsonify({"error": "Language must be 'it' or 'es'"}), 400
-
-        pwg = MisiPwGen.from_language(language)
-        phrase = pwg.phrase(*word_lengths, sep=separator)
-
-        return jsonify({
-            "result": phrase,
-            "type": "phrase",
-            "language": language,
-            "word_count": len(word_lengths)
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-
-@app.route("/api/generate/sentence", methods=["POST"])
+    return handle(webapi.phrase)
+
+
+@bp.route("/api/generate/sentence", methods=["POST"])
 def generate_sentence():
     """Generate a sentence with automatic word splitting"""
-    try:
-        data = request.get_json()
-        total_length = int(data.get("total_length", 24))
-        separator = data.get("separator", "_")
-        language = data.get("language", "it")
-
-        # Validate inputs
-        if total_length < 1 or total_length > 100:
-            return jsonify({"error": "Total length must be between 1 and 100"}), 400
-        if language not in ["it", "es"]:
-            return jsonify({"error": "Language must be 'it' or 'es'"}), 400
-
-        pwg = MisiPwGen.from_language(language)
-        sentence = pwg.sentence(total_length, sep=separator)
-
-        return jsonify({
-            "result": sentence,
-            "type": "sentence",
-            "language": language,
-            "total_length": total_length
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return handle(webapi.sentence)
+
+
+@bp.route("/api/generate/batch", methods=["POST"])
+def generate_batch():
+    """Stream many words, phrases or sentences as NDJSON or plain text lines"""
+    registry = current_app.extensions["misipwgen"]
+    status, body = webapi.call(registry, webapi.batch, request.get_json, jsonify)
+    if status != 200:
+        return body, status
+    mimetype, chunks = body
+    return Response(chunks, mimetype=mimetype)
+
+
+app = create_app(reservoir=int(os.environ.get("MISIPWGEN_RESERVOIR", 0)))
 
 
 if __name__ == "__main__":